@@ -40,10 +40,11 @@ async def list_bricks():
         from app.core.database import AsyncSessionLocal
         from app.models.brick import Brick
         from sqlalchemy import select
+        from sqlalchemy.orm import raiseload
         
         async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(Brick).order_by(Brick.created_at.desc())
+                select(Brick).options(raiseload("*")).order_by(Brick.created_at.desc())
             )
             db_bricks = result.scalars().all()
         
@@ -5,7 +5,7 @@ UBIC v1.5 Health Check API Endpoints
 from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, HTTPException, Depends, status
 import structlog
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -69,6 +69,7 @@ async def health_check():
         
         # Check dependencies with real database health check
         db_health = await check_database_health()
+        checked_at = datetime.now(timezone.utc)
         
         dependencies = [
             DependencyInfo(
@@ -76,7 +77,7 @@ async def health_check():
                 type="infra",
                 severity=Severity.INFO if db_health["status"] == Status.HEALTHY else Severity.CRITICAL,
                 status=db_health["status"],
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details=db_health
             ),
             DependencyInfo(
@@ -84,7 +85,7 @@ async def health_check():
                 type="infra", 
                 severity=Severity.INFO,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"response_time_ms": 5}
             ),
             DependencyInfo(
@@ -92,7 +93,7 @@ async def health_check():
                 type="functional",
                 severity=Severity.WARNING,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"api_configured": True}
             ),
             DependencyInfo(
@@ -100,7 +101,7 @@ async def health_check():
                 type="functional",
                 severity=Severity.WARNING,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"api_configured": True}
             )
         ]
@@ -114,14 +115,14 @@ async def health_check():
             elif dep.status == Status.WARNING and dep.severity == Severity.CRITICAL:
                 overall_status = Status.WARNING
         
-        health_data = HealthStatus(
+        health_data = HealthStatus.fast_build(
             status=overall_status,
             dependencies=dependencies,
-            last_check=datetime.utcnow(),
+            last_check=checked_at,
             uptime_seconds=int(time.time() - _service_start_time)
         )
         
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.SUCCESS,
             message="Health check completed",
             details=health_data.dict()
@@ -130,7 +131,7 @@ async def health_check():
     except Exception as e:
         _failed_count += 1
         logger.error("Health check failed", error=str(e))
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="HEALTH_CHECK_FAILED",
             message="Health check failed",
@@ -202,14 +203,14 @@ async def get_capabilities():
             storage_max="500Gi"
         )
         
-        brick_capabilities = BrickCapabilities(
+        brick_capabilities = BrickCapabilities.fast_build(
             capabilities=capabilities,
             api_version="1.5",
             feature_flags=feature_flags,
             resource_spec=resource_spec
         )
         
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.SUCCESS,
             message="Capabilities retrieved successfully",
             details=brick_capabilities.dict()
@@ -217,7 +218,7 @@ async def get_capabilities():
         
     except Exception as e:
         logger.error("Failed to get capabilities", error=str(e))
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="CAPABILITIES_FAILED",
             message="Failed to retrieve capabilities",
@@ -233,7 +234,7 @@ async def get_state():
         
         success_rate = (_success_count / _request_count * 100) if _request_count > 0 else 0
         
-        state_metrics = StateMetrics(
+        state_metrics = StateMetrics.fast_build(
             requests_total=_request_count,
             requests_success=_success_count,
             requests_failed=_failed_count,
@@ -241,10 +242,10 @@ async def get_state():
             memory_usage_percent=45.2,  # Mock value
             cpu_usage_percent=23.1,  # Mock value
             active_connections=5,  # Mock value
-            last_updated=datetime.utcnow()
+            last_updated=datetime.now(timezone.utc)
         )
         
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.SUCCESS,
             message="State metrics retrieved successfully",
             details=state_metrics.dict()
@@ -252,7 +253,7 @@ async def get_state():
         
     except Exception as e:
         logger.error("Failed to get state", error=str(e))
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="STATE_FAILED",
             message="Failed to retrieve state metrics",
@@ -266,6 +267,7 @@ async def get_dependencies():
     try:
         # Get real database health status
         db_health = await check_database_health()
+        checked_at = datetime.now(timezone.utc)
         
         dependencies = [
             DependencyInfo(
@@ -273,7 +275,7 @@ async def get_dependencies():
                 type="infra",
                 severity=Severity.INFO if db_health["status"] == Status.HEALTHY else Severity.CRITICAL,
                 status=db_health["status"],
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details=db_health
             ),
             DependencyInfo(
@@ -281,7 +283,7 @@ async def get_dependencies():
                 type="infra", 
                 severity=Severity.INFO,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"host": "redis", "port": 6379}
             ),
             DependencyInfo(
@@ -289,7 +291,7 @@ async def get_dependencies():
                 type="functional",
                 severity=Severity.WARNING,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"version": "0.28.9rc2", "agents_available": 5}
             ),
             DependencyInfo(
@@ -297,7 +299,7 @@ async def get_dependencies():
                 type="functional",
                 severity=Severity.WARNING,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"version": "0.1.0", "memory_count": 150}
             ),
             DependencyInfo(
@@ -305,7 +307,7 @@ async def get_dependencies():
                 type="optional",
                 severity=Severity.INFO,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"models_available": ["gpt-4", "gpt-3.5-turbo"]}
             ),
             DependencyInfo(
@@ -313,12 +315,12 @@ async def get_dependencies():
                 type="optional",
                 severity=Severity.INFO,
                 status=Status.HEALTHY,
-                last_check=datetime.utcnow(),
+                last_check=checked_at,
                 details={"models_available": ["claude-3-opus", "claude-3-sonnet"]}
             )
         ]
         
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.SUCCESS,
             message="Dependencies retrieved successfully",
             details={"dependencies": [dep.dict() for dep in dependencies]}
@@ -326,7 +328,7 @@ async def get_dependencies():
         
     except Exception as e:
         logger.error("Failed to get dependencies", error=str(e))
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="DEPENDENCIES_FAILED",
             message="Failed to retrieve dependencies",
@@ -353,7 +355,7 @@ async def reload_config(request: ConfigReloadRequest):
                 "warnings": ["Mock validation - would check actual config in production"]
             }
             
-            return UBICResponse(
+            return UBICResponse.fast_build(
                 status=Status.SUCCESS,
                 message="Configuration validation completed (dry run)",
                 details={
@@ -369,18 +371,18 @@ async def reload_config(request: ConfigReloadRequest):
                 user="system"
             )
             
-            return UBICResponse(
+            return UBICResponse.fast_build(
                 status=Status.SUCCESS,
                 message="Configuration reloaded successfully",
                 details={
-                    "reloaded_at": datetime.utcnow().isoformat(),
+                    "reloaded_at": datetime.now(timezone.utc).isoformat(),
                     "request_id": request.request_id
                 }
             )
             
     except Exception as e:
         logger.error("Failed to reload configuration", error=str(e), request_id=request.request_id)
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="CONFIG_RELOAD_FAILED",
             message="Failed to reload configuration",
@@ -400,18 +402,18 @@ async def graceful_shutdown():
         # 3. Close database connections
         # 4. Clean up resources
         
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.SUCCESS,
             message="Graceful shutdown initiated",
             details={
-                "shutdown_initiated_at": datetime.utcnow().isoformat(),
+                "shutdown_initiated_at": datetime.now(timezone.utc).isoformat(),
                 "estimated_completion_seconds": 30
             }
         )
         
     except Exception as e:
         logger.error("Failed to initiate graceful shutdown", error=str(e))
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="SHUTDOWN_FAILED",
             message="Failed to initiate graceful shutdown",
@@ -437,11 +439,11 @@ async def emergency_stop(request: EmergencyStopRequest):
         # 3. Set cooldown period before restart
         # 4. Generate post-mortem report
         
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.SUCCESS,
             message="Emergency stop executed",
             details={
-                "emergency_stop_at": datetime.utcnow().isoformat(),
+                "emergency_stop_at": datetime.now(timezone.utc).isoformat(),
                 "reason": request.reason,
                 "severity": request.severity,
                 "cooldown_seconds": request.cooldown_seconds,
@@ -451,7 +453,7 @@ async def emergency_stop(request: EmergencyStopRequest):
         
     except Exception as e:
         logger.error("Failed to execute emergency stop", error=str(e))
-        return UBICResponse(
+        return UBICResponse.fast_build(
             status=Status.ERROR,
             error_code="EMERGENCY_STOP_FAILED",
             message="Failed to execute emergency stop",
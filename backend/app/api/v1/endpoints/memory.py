@@ -202,9 +202,10 @@ async def search_memories(
                 # Extract keywords from query for better matching
                 query_words = query.lower().replace("?", "").replace("'", "").split()
                 
-                # Build search conditions for each word
+                # Build search conditions for each distinct word; repeats would only
+                # add redundant ILIKEs and another compiled-statement cache variant
                 search_conditions = []
-                for word in query_words:
+                for word in dict.fromkeys(query_words):
                     if len(word) > 2:  # Skip very short words
                         search_conditions.append(
                             cast(Memory.content, String).ilike(f'%{word}%')
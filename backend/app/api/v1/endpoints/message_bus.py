@@ -7,7 +7,6 @@ from fastapi import APIRouter, HTTPException, Depends, status
 import structlog
 from datetime import datetime, timedelta
 import uuid
-import json
 
 from app.models.ubic import (
     UBICResponse, UBICMessage, Priority, Status, EmergenceSignal,
@@ -184,7 +183,7 @@ async def send_message(message: UBICMessage):
         message_metadata = {
             "sent_at": datetime.utcnow().isoformat(),
             "sender_ip": "127.0.0.1",  # Mock value
-            "message_size_bytes": len(json.dumps(message.dict())),
+            "message_size_bytes": len(message.model_dump_json()),
             "retry_count": 0
         }
         
@@ -2,6 +2,7 @@
 UBIC v1.5 Metrics API Endpoints
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, Response
 from prometheus_client import (
@@ -12,58 +13,69 @@ import structlog
 from datetime import datetime
 import time
 
+from app.core.metrics import registry
+
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
-# Prometheus metrics
+# Prometheus metrics, on the application's dedicated registry
 REQUEST_COUNT = Counter(
     'ubic_requests_total',
     'Total number of requests',
-    ['method', 'endpoint', 'status']
+    ['method', 'endpoint', 'status'],
+    registry=registry
 )
 
 REQUEST_DURATION = Histogram(
     'ubic_request_duration_seconds',
     'Request duration in seconds',
-    ['method', 'endpoint']
+    ['method', 'endpoint'],
+    registry=registry
 )
 
 ACTIVE_CONNECTIONS = Gauge(
     'ubic_active_connections',
-    'Number of active connections'
+    'Number of active connections',
+    registry=registry
 )
 
 MEMORY_USAGE = Gauge(
     'ubic_memory_usage_bytes',
-    'Memory usage in bytes'
+    'Memory usage in bytes',
+    registry=registry
 )
 
 CPU_USAGE = Gauge(
     'ubic_cpu_usage_percent',
-    'CPU usage percentage'
+    'CPU usage percentage',
+    registry=registry
 )
 
 MESSAGE_QUEUE_SIZE = Gauge(
     'ubic_message_queue_size',
     'Message queue size',
-    ['priority']
+    ['priority'],
+    registry=registry
 )
 
 DEPENDENCY_HEALTH = Gauge(
     'ubic_dependency_health',
     'Dependency health status (1=healthy, 0=unhealthy)',
-    ['dependency_name', 'dependency_type']
+    ['dependency_name', 'dependency_type'],
+    registry=registry
 )
 
 EMERGENCE_DETECTED = Counter(
     'ubic_emergence_detected_total',
     'Total number of emergence signals detected',
-    ['emergence_type']
+    ['emergence_type'],
+    registry=registry
 )
 
 BRICK_INFO = Info(
     'ubic_brick_info',
-    'Brick information'
+    'Brick information',
+    registry=registry
 )
 
 # Set brick info
@@ -83,7 +95,7 @@ async def get_metrics():
         _update_metrics()
         
         # Generate Prometheus metrics
-        metrics_data = generate_latest()
+        metrics_data = generate_latest(registry)
         
         return Response(
             content=metrics_data,
@@ -124,11 +136,21 @@ def _update_metrics():
         logger.error("Failed to update metrics", error=str(e))
 
 
+@lru_cache(maxsize=4096)
+def _request_count_child(method: str, endpoint: str, status: str):
+    return REQUEST_COUNT.labels(method, endpoint, status)
+
+
+@lru_cache(maxsize=4096)
+def _request_duration_child(method: str, endpoint: str):
+    return REQUEST_DURATION.labels(method, endpoint)
+
+
 def record_request(method: str, endpoint: str, status: str, duration: float):
     """Record request metrics"""
     try:
-        REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status).inc()
-        REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(duration)
+        _request_count_child(method, endpoint, status).inc()
+        _request_duration_child(method, endpoint).observe(duration)
     except Exception as e:
         logger.error("Failed to record request metrics", error=str(e))
 
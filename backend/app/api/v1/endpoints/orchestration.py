@@ -427,10 +427,16 @@ async def get_orchestration_sessions(
         from app.core.database import AsyncSessionLocal
         from app.models.orchestration import OrchestrationSession
         from sqlalchemy import select, desc
+        from sqlalchemy.orm import raiseload
         
         async with AsyncSessionLocal() as db:
-            # Build query with filters
-            query = select(OrchestrationSession).order_by(desc(OrchestrationSession.created_at))
+            # Build query with filters; the listing only reads columns, so any
+            # relationship access is a bug rather than a silent per-row query
+            query = (
+                select(OrchestrationSession)
+                .options(raiseload("*"))
+                .order_by(desc(OrchestrationSession.created_at))
+            )
             
             if limit:
                 query = query.limit(limit)
@@ -65,13 +65,14 @@ class RevenueConnectionsResponse(BaseModel):
 async def get_church_kit_metrics(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Get Church Kit Generator business metrics"""
     try:
-        if not orchestrator.church_kit_connector:
+        church_kit_connector = await orchestrator.get_service("church_kit_connector")
+        if not church_kit_connector:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Church Kit connector not available"
             )
         
-        result = await orchestrator.church_kit_connector.get_business_metrics()
+        result = await church_kit_connector.get_business_metrics()
         return result
     
     except HTTPException:
@@ -88,13 +89,14 @@ async def get_church_kit_metrics(orchestrator: AIOrchestrator = Depends(get_orch
 async def get_church_kit_insights(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Get Church Kit Generator customer insights"""
     try:
-        if not orchestrator.church_kit_connector:
+        church_kit_connector = await orchestrator.get_service("church_kit_connector")
+        if not church_kit_connector:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Church Kit connector not available"
             )
         
-        result = await orchestrator.church_kit_connector.get_customer_insights()
+        result = await church_kit_connector.get_customer_insights()
         return result
     
     except HTTPException:
@@ -111,13 +113,14 @@ async def get_church_kit_insights(orchestrator: AIOrchestrator = Depends(get_orc
 async def get_global_sky_capabilities(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Get Global Sky AI capabilities"""
     try:
-        if not orchestrator.global_sky_connector:
+        global_sky_connector = await orchestrator.get_service("global_sky_connector")
+        if not global_sky_connector:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Global Sky connector not available"
             )
         
-        result = await orchestrator.global_sky_connector.get_ai_capabilities()
+        result = await global_sky_connector.get_ai_capabilities()
         return result
     
     except HTTPException:
@@ -134,13 +137,14 @@ async def get_global_sky_capabilities(orchestrator: AIOrchestrator = Depends(get
 async def analyze_global_sky_revenue(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Analyze Global Sky AI revenue streams"""
     try:
-        if not orchestrator.global_sky_connector:
+        global_sky_connector = await orchestrator.get_service("global_sky_connector")
+        if not global_sky_connector:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Global Sky connector not available"
             )
         
-        result = await orchestrator.global_sky_connector.analyze_revenue_streams()
+        result = await global_sky_connector.analyze_revenue_streams()
         return result
     
     except HTTPException:
@@ -157,13 +161,14 @@ async def analyze_global_sky_revenue(orchestrator: AIOrchestrator = Depends(get_
 async def get_financial_health(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Get overall financial health analysis"""
     try:
-        if not orchestrator.treasury_optimizer:
+        treasury_optimizer = await orchestrator.get_service("treasury_optimizer")
+        if not treasury_optimizer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Treasury optimizer not available"
             )
         
-        result = await orchestrator.treasury_optimizer.analyze_financial_health()
+        result = await treasury_optimizer.analyze_financial_health()
         return result
     
     except HTTPException:
@@ -180,13 +185,14 @@ async def get_financial_health(orchestrator: AIOrchestrator = Depends(get_orches
 async def optimize_resources(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Get resource optimization recommendations"""
     try:
-        if not orchestrator.treasury_optimizer:
+        treasury_optimizer = await orchestrator.get_service("treasury_optimizer")
+        if not treasury_optimizer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Treasury optimizer not available"
             )
         
-        result = await orchestrator.treasury_optimizer.optimize_resource_allocation()
+        result = await treasury_optimizer.optimize_resource_allocation()
         return result
     
     except HTTPException:
@@ -203,13 +209,14 @@ async def optimize_resources(orchestrator: AIOrchestrator = Depends(get_orchestr
 async def forecast_revenue(months: int, orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Forecast revenue for N months"""
     try:
-        if not orchestrator.treasury_optimizer:
+        treasury_optimizer = await orchestrator.get_service("treasury_optimizer")
+        if not treasury_optimizer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Treasury optimizer not available"
             )
         
-        result = await orchestrator.treasury_optimizer.forecast_revenue(months)
+        result = await treasury_optimizer.forecast_revenue(months)
         return result
     
     except HTTPException:
@@ -229,13 +236,14 @@ async def generate_autonomous_proposal(
 ):
     """Generate autonomous BRICK development proposal"""
     try:
-        if not orchestrator.autonomous_brick_proposer:
+        autonomous_brick_proposer = await orchestrator.get_service("autonomous_brick_proposer")
+        if not autonomous_brick_proposer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Autonomous BRICK proposer not available"
             )
         
-        result = await orchestrator.autonomous_brick_proposer.generate_brick_proposal(
+        result = await autonomous_brick_proposer.generate_brick_proposal(
             request.proposal_context
         )
         
@@ -262,13 +270,14 @@ async def get_all_proposals(
 ):
     """Get all BRICK development proposals"""
     try:
-        if not orchestrator.autonomous_brick_proposer:
+        autonomous_brick_proposer = await orchestrator.get_service("autonomous_brick_proposer")
+        if not autonomous_brick_proposer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Autonomous BRICK proposer not available"
             )
         
-        result = await orchestrator.autonomous_brick_proposer.get_all_proposals(status_filter)
+        result = await autonomous_brick_proposer.get_all_proposals(status_filter)
         return result
     
     except HTTPException:
@@ -289,13 +298,14 @@ async def approve_proposal(
 ):
     """Approve or reject a BRICK proposal"""
     try:
-        if not orchestrator.autonomous_brick_proposer:
+        autonomous_brick_proposer = await orchestrator.get_service("autonomous_brick_proposer")
+        if not autonomous_brick_proposer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Autonomous BRICK proposer not available"
             )
         
-        result = await orchestrator.autonomous_brick_proposer.approve_proposal(
+        result = await autonomous_brick_proposer.approve_proposal(
             proposal_id,
             request.approved,
             request.feedback
@@ -317,13 +327,14 @@ async def approve_proposal(
 async def get_revenue_connections(orchestrator: AIOrchestrator = Depends(get_orchestrator)):
     """Get revenue connection status across all BRICKs"""
     try:
-        if not orchestrator.autonomous_brick_proposer:
+        autonomous_brick_proposer = await orchestrator.get_service("autonomous_brick_proposer")
+        if not autonomous_brick_proposer:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Autonomous BRICK proposer not available"
             )
         
-        result = await orchestrator.autonomous_brick_proposer.get_revenue_connection_status()
+        result = await autonomous_brick_proposer.get_revenue_connection_status()
         
         return RevenueConnectionsResponse(
             status=result["status"],
@@ -112,13 +112,14 @@ async def get_bricks_ecosystem(
 ):
     """Get BRICKS ecosystem context and specifications"""
     try:
-        if not orchestrator.bricks_context_service:
+        bricks_context_service = await orchestrator.get_service("bricks_context_service")
+        if not bricks_context_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="BRICKS context service not available"
             )
         
-        result = await orchestrator.bricks_context_service.get_ecosystem_context(brick_name)
+        result = await bricks_context_service.get_ecosystem_context(brick_name)
         
         return BRICKSEcosystemResponse(
             status=result["status"],
@@ -145,13 +146,14 @@ async def analyze_revenue_opportunities(
 ):
     """Analyze revenue opportunities across BRICKS ecosystem"""
     try:
-        if not orchestrator.revenue_analysis_service:
+        revenue_analysis_service = await orchestrator.get_service("revenue_analysis_service")
+        if not revenue_analysis_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Revenue analysis service not available"
             )
         
-        result = await orchestrator.revenue_analysis_service.analyze_revenue_opportunities()
+        result = await revenue_analysis_service.analyze_revenue_opportunities()
         
         return RevenueOpportunitiesResponse(
             status=result["status"],
@@ -172,13 +174,39 @@ async def analyze_revenue_opportunities(
         )
 
 
+@router.get("/revenue-rollup")
+async def get_revenue_rollup(
+    orchestrator: AIOrchestrator = Depends(get_orchestrator)
+):
+    """Get pre-aggregated revenue totals by opportunity status and type"""
+    try:
+        revenue_analysis_service = await orchestrator.get_service("revenue_analysis_service")
+        if not revenue_analysis_service:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Revenue analysis service not available"
+            )
+        
+        return await revenue_analysis_service.get_revenue_rollup()
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to get revenue roll-up", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @router.get("/strategic-gaps", response_model=StrategicGapsResponse)
 async def detect_strategic_gaps(
     orchestrator: AIOrchestrator = Depends(get_orchestrator)
 ):
     """Detect strategic gaps in BRICKS ecosystem"""
     try:
-        if not orchestrator.strategic_gap_service:
+        strategic_gap_service = await orchestrator.get_service("strategic_gap_service")
+        if not strategic_gap_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Strategic gap service not available"
@@ -186,11 +214,12 @@ async def detect_strategic_gaps(
         
         # Get BRICKS context for gap analysis
         bricks_context = None
-        if orchestrator.bricks_context_service:
-            context_result = await orchestrator.bricks_context_service.get_ecosystem_context()
+        bricks_context_service = await orchestrator.get_service("bricks_context_service")
+        if bricks_context_service:
+            context_result = await bricks_context_service.get_ecosystem_context()
             bricks_context = context_result.get("ecosystem")
         
-        result = await orchestrator.strategic_gap_service.detect_strategic_gaps(bricks_context)
+        result = await strategic_gap_service.detect_strategic_gaps(bricks_context)
         
         return StrategicGapsResponse(
             status=result["status"],
@@ -218,7 +247,8 @@ async def get_brick_priority_queue(
 ):
     """Get next BRICK priority queue"""
     try:
-        if not orchestrator.brick_priority_service:
+        brick_priority_service = await orchestrator.get_service("brick_priority_service")
+        if not brick_priority_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="BRICK priority service not available"
@@ -226,8 +256,9 @@ async def get_brick_priority_queue(
         
         # Get BRICKS context
         ecosystem_context = None
-        if orchestrator.bricks_context_service:
-            context_result = await orchestrator.bricks_context_service.get_ecosystem_context()
+        bricks_context_service = await orchestrator.get_service("bricks_context_service")
+        if bricks_context_service:
+            context_result = await bricks_context_service.get_ecosystem_context()
             ecosystem_context = context_result.get("ecosystem")
         
         if not ecosystem_context:
@@ -236,7 +267,7 @@ async def get_brick_priority_queue(
                 detail="BRICKS ecosystem context required"
             )
         
-        result = await orchestrator.brick_priority_service.generate_priority_queue(ecosystem_context)
+        result = await brick_priority_service.generate_priority_queue(ecosystem_context)
         
         return BRICKPriorityQueueResponse(
             status=result["status"],
@@ -263,7 +294,8 @@ async def predict_brick_constraints(
 ):
     """Predict constraints for a specific BRICK development"""
     try:
-        if not orchestrator.constraint_prediction_service:
+        constraint_prediction_service = await orchestrator.get_service("constraint_prediction_service")
+        if not constraint_prediction_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Constraint prediction service not available"
@@ -271,8 +303,9 @@ async def predict_brick_constraints(
         
         # Get BRICK data
         brick_data = None
-        if orchestrator.bricks_context_service:
-            context_result = await orchestrator.bricks_context_service.get_ecosystem_context(brick_name)
+        bricks_context_service = await orchestrator.get_service("bricks_context_service")
+        if bricks_context_service:
+            context_result = await bricks_context_service.get_ecosystem_context(brick_name)
             brick_data = context_result.get("brick")
         
         if not brick_data:
@@ -281,7 +314,7 @@ async def predict_brick_constraints(
                 detail=f"BRICK '{brick_name}' not found"
             )
         
-        result = await orchestrator.constraint_prediction_service.predict_constraints(
+        result = await constraint_prediction_service.predict_constraints(
             brick_name,
             brick_data
         )
@@ -315,13 +348,14 @@ async def perform_strategic_analysis(
 ):
     """Perform comprehensive strategic analysis using STRATEGIC framework"""
     try:
-        if not orchestrator.strategic_intelligence_service:
+        strategic_intelligence_service = await orchestrator.get_service("strategic_intelligence_service")
+        if not strategic_intelligence_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Strategic intelligence service not available"
             )
         
-        result = await orchestrator.strategic_intelligence_service.analyze_strategic_situation(
+        result = await strategic_intelligence_service.analyze_strategic_situation(
             analysis_type=analysis_type
         )
         
@@ -352,13 +386,14 @@ async def get_strategic_dashboard(
 ):
     """Get strategic intelligence dashboard with comprehensive insights"""
     try:
-        if not orchestrator.strategic_intelligence_service:
+        strategic_intelligence_service = await orchestrator.get_service("strategic_intelligence_service")
+        if not strategic_intelligence_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Strategic intelligence service not available"
             )
         
-        result = await orchestrator.strategic_intelligence_service.get_strategic_dashboard()
+        result = await strategic_intelligence_service.get_strategic_dashboard()
         
         return StrategicDashboardResponse(
             status=result["status"],
@@ -384,13 +419,14 @@ async def get_income_stream_mapping(
 ):
     """Get income stream mapping across BRICKS ecosystem"""
     try:
-        if not orchestrator.revenue_analysis_service:
+        revenue_analysis_service = await orchestrator.get_service("revenue_analysis_service")
+        if not revenue_analysis_service:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Revenue analysis service not available"
             )
         
-        result = await orchestrator.revenue_analysis_service.map_income_streams()
+        result = await revenue_analysis_service.map_income_streams()
         return result
     
     except HTTPException:
@@ -0,0 +1,48 @@
+"""
+Batched draining of background write queues
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+async def drain_in_batches(
+    queue: asyncio.Queue,
+    write: Callable[[List[Any]], Awaitable[Any]],
+    batch_size: int,
+    flush_interval: float,
+    error_message: str
+):
+    """Pass queued items to write() in batches, forever
+
+    A batch closes at batch_size items or flush_interval seconds after its first
+    item, whichever comes first. Failed batches are logged under error_message
+    and dropped; every item is marked done so queue.join() returns.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + flush_interval
+        while len(batch) < batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+        try:
+            await write(batch)
+        except Exception:
+            logger.error(error_message, count=len(batch), exc_info=True)
+        finally:
+            for _ in batch:
+                queue.task_done()
@@ -2,10 +2,16 @@
 Redis cache configuration and management
 """
 
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+import msgspec
 import redis.asyncio as redis
 import structlog
-from typing import Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
 
+from app.core.batching import drain_in_batches
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -13,6 +19,18 @@ logger = structlog.get_logger(__name__)
 # Global Redis client
 redis_client: Optional[redis.Redis] = None
 
+# Structured cache values are stored as MessagePack; the key prefix keeps them
+# apart from the JSON values written by earlier releases
+STRUCTURED_KEY_PREFIX = "v2:"
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+# Fire-and-forget writes are batched into pipelines of up to WRITE_BATCH_SIZE
+# commands, flushed at least every WRITE_FLUSH_INTERVAL seconds
+WRITE_BATCH_SIZE = 100
+WRITE_FLUSH_INTERVAL = 0.005
+MAX_PENDING_WRITES = 256
+
 
 async def get_redis() -> redis.Redis:
     """Get Redis client instance"""
@@ -20,11 +38,7 @@ async def get_redis() -> redis.Redis:
     
     if redis_client is None:
         try:
-            redis_client = redis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True
-            )
+            redis_client = redis.from_url(settings.REDIS_URL)
             
             # Test connection
             await redis_client.ping()
@@ -55,56 +69,155 @@ class CacheManager:
     
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def set(self, key: str, value: str, expire: Optional[int] = None):
         """Set cache value"""
         try:
             await self.redis.set(key, value, ex=expire)
-        except Exception as e:
-            logger.error("Failed to set cache", key=key, error=str(e))
+        except Exception:
+            logger.error("Failed to set cache", key=key, exc_info=True)
             raise
     
-    async def get(self, key: str) -> Optional[str]:
-        """Get cache value"""
+    async def set_async(self, key: str, value: Any, expire: Optional[int] = None):
+        """Queue a non-critical cache write without waiting for Redis
+        
+        Use set() when the write must be durable before continuing.
+        """
+        if self._writer_task is None or self._writer_task.done():
+            self._write_queue = asyncio.Queue(maxsize=MAX_PENDING_WRITES)
+            self._writer_task = asyncio.create_task(self._drain_writes(self._write_queue))
         try:
-            return await self.redis.get(key)
-        except Exception as e:
-            logger.error("Failed to get cache", key=key, error=str(e))
-            return None
+            self._write_queue.put_nowait((key, value, expire))
+        except asyncio.QueueFull:
+            logger.warning("Cache write queue full, dropping write", key=key)
+    
+    async def _drain_writes(self, queue: asyncio.Queue):
+        """Flush queued writes to Redis in pipelined batches"""
+        await drain_in_batches(
+            queue, self._write_batch, WRITE_BATCH_SIZE, WRITE_FLUSH_INTERVAL, "Failed to flush cache writes"
+        )
+    
+    async def _write_batch(self, batch):
+        pipe = self.redis.pipeline(transaction=False)
+        for key, value, expire in batch:
+            pipe.set(key, value, ex=expire)
+        await pipe.execute()
+    
+    async def flush(self):
+        """Wait for queued writes to reach Redis and stop the writer"""
+        if self._writer_task is None:
+            return
+        await self._write_queue.join()
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Get cache value
+        
+        Redis errors propagate to the caller, which decides how to degrade.
+        """
+        raw = await self.redis.get(key)
+        return raw.decode() if raw is not None else None
     
     async def delete(self, key: str):
         """Delete cache value"""
         try:
             await self.redis.delete(key)
-        except Exception as e:
-            logger.error("Failed to delete cache", key=key, error=str(e))
+        except Exception:
+            logger.error("Failed to delete cache", key=key, exc_info=True)
     
-    async def exists(self, key: str) -> bool:
-        """Check if key exists"""
+    async def get_or_none(self, key: str) -> Optional[bytes]:
+        """Get raw cache value in a single round trip (None on a miss)
+        
+        Prefer this over an exists() check followed by a get().
+        """
+        return await self.redis.get(key)
+    
+    async def get_with_exists(self, key: str) -> Tuple[int, Optional[str]]:
+        """Get key existence count and value in one pipelined round trip"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.get(key)
+        exists, raw = await pipe.execute()
+        return exists, raw.decode() if raw is not None else None
+    
+    async def exists(self, key: str) -> int:
+        """Check if key exists (number of matching keys, as returned by Redis)"""
         try:
             return await self.redis.exists(key)
-        except Exception as e:
-            logger.error("Failed to check cache existence", key=key, error=str(e))
-            return False
+        except Exception:
+            logger.error("Failed to check cache existence", key=key, exc_info=True)
+            return 0
     
-    async def set_json(self, key: str, data: dict, expire: Optional[int] = None):
-        """Set JSON data in cache"""
-        import json
+    async def set_json(self, key: str, data: Any, expire: Optional[int] = None):
+        """Set structured data in cache (MessagePack encoded)"""
         try:
-            json_data = json.dumps(data)
-            await self.set(key, json_data, expire)
-        except Exception as e:
-            logger.error("Failed to set JSON cache", key=key, error=str(e))
+            await self.redis.set(
+                STRUCTURED_KEY_PREFIX + key,
+                _msgpack_encoder.encode(data),
+                ex=expire
+            )
+        except Exception:
+            logger.error("Failed to set JSON cache", key=key, exc_info=True)
             raise
     
-    async def get_json(self, key: str) -> Optional[dict]:
-        """Get JSON data from cache"""
-        import json
+    async def get_json(self, key: str) -> Optional[Any]:
+        """Get structured data from cache (MessagePack encoded)"""
         try:
-            data = await self.get(key)
-            if data:
-                return json.loads(data)
-            return None
-        except Exception as e:
-            logger.error("Failed to get JSON cache", key=key, error=str(e))
+            raw = await self.redis.get(STRUCTURED_KEY_PREFIX + key)
+            return _msgpack_decoder.decode(raw) if raw else None
+        except Exception:
+            logger.error("Failed to get JSON cache", key=key, exc_info=True)
             return None
+
+
+def async_lru(
+    maxsize: int = 512,
+    ttl: float = 60.0,
+    key: Optional[Callable[..., Hashable]] = None
+):
+    """In-process LRU cache with a TTL for a coroutine function
+    
+    The cache holds the call's future rather than its result, so concurrent
+    callers with the same key share one upstream call. Failed calls are not
+    cached. key builds the cache key from the call arguments; by default the
+    positional and keyword arguments themselves are used.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        entries: "OrderedDict[Hashable, Tuple[float, asyncio.Future]]" = OrderedDict()
+        
+        def evict_failed(cache_key: Hashable, future: asyncio.Future):
+            if future.cancelled() or future.exception() is not None:
+                if entries.get(cache_key, (None, None))[1] is future:
+                    del entries[cache_key]
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            entry = entries.get(cache_key)
+            if entry and entry[0] > now:
+                entries.move_to_end(cache_key)
+                future = entry[1]
+            else:
+                future = asyncio.ensure_future(func(*args, **kwargs))
+                future.add_done_callback(functools.partial(evict_failed, cache_key))
+                entries[cache_key] = (now + ttl, future)
+                entries.move_to_end(cache_key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            
+            # Shielded so a cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(future)
+        
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    
+    return decorator
@@ -2,15 +2,29 @@
 Configuration management for I PROACTIVE BRICK Orchestration Intelligence
 """
 
-from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import field_validator
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import PrivateAttr, field_validator, model_validator
 import os
 
 
+# Values that mark an API key as an unfilled template placeholder
+_PLACEHOLDER_PREFIXES = ("your-", "changeme")
+_REQUIRED_API_KEYS = ("ANTHROPIC_API_KEY", "MEM0_API_KEY")
+
+
 class Settings(BaseSettings):
     """Application settings"""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+    )
+    
     # Application
     APP_NAME: str = "I PROACTIVE BRICK Orchestration Intelligence"
     APP_VERSION: str = "1.0.0"
@@ -82,6 +96,15 @@ class Settings(BaseSettings):
     # Monitoring
     ENABLE_METRICS: bool = True
     METRICS_PORT: int = 9090
+    STATUS_PROBE_TIMEOUT_SECONDS: float = 2.0
+    STATUS_TTL_SECONDS: float = 3.0
+    HEALTH_TTL_SECONDS: float = 2.0
+    MEMORY_LOOKUP_TTL_SECONDS: float = 60.0
+    INIT_TIMEOUT_SECONDS: float = 30.0
+    SERVICE_CLEANUP_TIMEOUT_SECONDS: float = 10.0
+    UBIC_SCAN_TTL_SECONDS: float = 3600.0
+    AUDIT_CACHE_TTL_SECONDS: float = 3600.0
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS: float = 86400.0
     
     # Business Systems
     CHURCH_KIT_API_KEY: Optional[str] = None
@@ -96,6 +119,8 @@ class Settings(BaseSettings):
     DREAM_BIG_MASKS_API_KEY: Optional[str] = None
     DREAM_BIG_MASKS_BASE_URL: str = "https://api.dreambigmasks.com"
     
+    _cors_cache: Tuple[str, ...] = PrivateAttr(default=())
+    
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v):
@@ -105,9 +130,10 @@ class Settings(BaseSettings):
             return [i.strip() for i in v.split(",")]
         return v
     
-    def get_cors_origins(self) -> List[str]:
-        """Get CORS origins based on VPS configuration"""
-        origins = self.CORS_ORIGINS.copy() if self.CORS_ORIGINS else [
+    @model_validator(mode="after")
+    def assemble_cors_cache(self):
+        """Build the full CORS origin list once, at construction time"""
+        origins = list(self.CORS_ORIGINS) if self.CORS_ORIGINS else [
             "http://localhost:3000",
             "http://localhost:8000",
             "http://127.0.0.1:3000",
@@ -131,7 +157,12 @@ class Settings(BaseSettings):
                 f"https://www.{self.VPS_DOMAIN}",
             ])
         
-        return origins
+        self._cors_cache = tuple(origins)
+        return self
+    
+    def get_cors_origins(self) -> Tuple[str, ...]:
+        """Get CORS origins based on VPS configuration"""
+        return self._cors_cache
     
     @field_validator("ENVIRONMENT")
     @classmethod
@@ -161,23 +192,28 @@ class Settings(BaseSettings):
             return v  # Allow default values for now
         return v
     
-    def validate_api_keys(self) -> dict:
-        """Validate that required API keys are configured"""
-        missing_keys = []
-        if not self.ANTHROPIC_API_KEY or self.ANTHROPIC_API_KEY.startswith("your-"):
-            missing_keys.append("ANTHROPIC_API_KEY")
-        if not self.MEM0_API_KEY or self.MEM0_API_KEY.startswith("your-"):
-            missing_keys.append("MEM0_API_KEY")
-        
-        return {
+    @property
+    def api_keys_status(self) -> Mapping[str, Any]:
+        """Required API key status for the current key values, read-only"""
+        missing_keys = [
+            name for name in _REQUIRED_API_KEYS
+            if not (value := getattr(self, name)) or value.startswith(_PLACEHOLDER_PREFIXES)
+        ]
+        return MappingProxyType({
             "valid": len(missing_keys) == 0,
             "missing_keys": missing_keys
-        }
+        })
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    def validate_api_keys(self) -> dict:
+        """Validate that required API keys are configured"""
+        return dict(self.api_keys_status)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance (env and .env parsed once)"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
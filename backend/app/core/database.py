@@ -2,10 +2,18 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+import asyncio
+from urllib.parse import urlsplit
+
+from datetime import date
+
+from sqlalchemy import create_engine, event, text, BigInteger, DateTime, Integer, JSON, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 import structlog
 
 from app.core.config import settings
@@ -13,33 +21,163 @@ from app.core.config import settings
 logger = structlog.get_logger(__name__)
 
 # Create async engine with asyncpg driver
-async_database_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
-logger.info("Database URL", url=async_database_url)
+_scheme, _sep, _rest = settings.DATABASE_URL.partition("://")
+if _scheme == "postgresql":
+    _scheme = "postgresql+asyncpg"
+async_database_url = f"{_scheme}{_sep}{_rest}"
+# Parsed once; the engine receives the URL object instead of re-parsing the string
+async_database_url_obj = make_url(async_database_url)
+if settings.DEBUG:
+    # Host only: the full URL carries credentials
+    logger.debug("Database host", host=urlsplit(async_database_url).hostname)
+# SQL echo stays off: statement logging goes through the "sqlalchemy" logger
+# instead of synchronous echo writes on the event loop
 engine = create_async_engine(
-    async_database_url,
-    echo=settings.DEBUG,
+    async_database_url_obj,
+    echo=False,
     future=True,
     connect_args={
         "command_timeout": 60,
+        "prepared_statement_cache_size": 512,
+        "statement_cache_size": 512,
         "server_settings": {
             "application_name": "brick_orchestration",
+            "jit": "off",
         }
     },
     pool_timeout=60,
-    pool_recycle=3600,
+    pool_recycle=1800,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    pool_size=20,
+    max_overflow=40,
+    # ORM flushes and executemany inserts are folded into multi-row
+    # INSERT ... VALUES statements of up to this many rows
+    insertmanyvalues_page_size=1000,
+    # Compiled-SQL cache entries (default 500); sized so the ORM's statement
+    # variants across all models stay resident instead of being recompiled
+    query_cache_size=1200
 )
 
+# Monthly partitions created ahead of the current month for partitioned tables
+PARTITION_MONTHS_AHEAD = 2
+
+# Background task rolling the partition window forward, see init_db
+_partition_task = None
+
 # Create async session factory
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
 # Create base class for models
 Base = declarative_base()
 
+# Binary JSONB on PostgreSQL so containment lookups skip re-parsing and can use
+# GIN indexes; other dialects (the sqlite test database) fall back to JSON
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+# 64-bit keys for primary keys and the foreign keys pointing at them; sqlite only
+# autoincrements an INTEGER PRIMARY KEY, so it keeps Integer there
+BigIntType = BigInteger().with_variant(Integer, "sqlite")
+
+
+class clock_timestamp(FunctionElement):
+    """Server-side insert timestamp
+    
+    clock_timestamp() on PostgreSQL, so rows inserted by one multi-row statement
+    get distinct times instead of the shared transaction start now() returns;
+    CURRENT_TIMESTAMP elsewhere.
+    """
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(clock_timestamp)
+def _compile_clock_timestamp(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(clock_timestamp, "postgresql")
+def _compile_clock_timestamp_postgresql(element, compiler, **kw):
+    return "clock_timestamp()"
+
+
+@compiles(PrimaryKeyConstraint, "postgresql")
+def _compile_primary_key(constraint, compiler, **kw):
+    """Add a partitioned table's partition key (info["partition_key"]) to its primary key
+    
+    PostgreSQL requires it in every unique constraint of a partitioned table. The
+    mapped primary key stays id alone, so sqlite keeps id as its autoincrementing
+    INTEGER PRIMARY KEY.
+    """
+    partition_key = constraint.table.info.get("partition_key", ())
+    extra = [name for name in partition_key if name not in constraint.columns]
+    if not extra:
+        return compiler.visit_primary_key_constraint(constraint, **kw)
+    
+    columns = [column.name for column in constraint.columns] + extra
+    return (
+        compiler.define_constraint_preamble(constraint, **kw)
+        + "PRIMARY KEY (%s)" % ", ".join(compiler.preparer.quote(name) for name in columns)
+    )
+
+
+# On PostgreSQL updated_at is maintained by a BEFORE UPDATE trigger, so every
+# writer (ORM, Core, raw SQL) gets it; same function as database/init.sql. The
+# models declare server_onupdate=FetchedValue() for it, plus an ORM onupdate
+# that keeps the column current on other dialects.
+_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _apply_column_compression(target, connection, **kw):
+    """Apply the TOAST compression named in a column's info["compression"]
+    
+    ALTER ... SET COMPRESSION only affects newly written values, so re-running it
+    on every create_all is cheap.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    
+    for table in target.sorted_tables:
+        for column in table.columns:
+            method = column.info.get("compression")
+            if method:
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column.name} SET COMPRESSION {method}"
+                ))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_updated_at_triggers(target, connection, **kw):
+    """Attach the updated_at trigger to every table with an updated_at column
+    
+    Existing triggers are left alone, so a restart takes no table locks.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    
+    connection.execute(text(_UPDATED_AT_FUNCTION))
+    existing = set(connection.scalars(text("SELECT tgname FROM pg_trigger WHERE NOT tgisinternal")))
+    for table in target.sorted_tables:
+        if "updated_at" not in table.c:
+            continue
+        trigger = f"update_{table.name}_updated_at"
+        if trigger in existing:
+            continue
+        connection.execute(text(
+            f"CREATE TRIGGER {trigger} BEFORE UPDATE ON {table.name} "
+            "FOR EACH ROW EXECUTE FUNCTION update_updated_at_column()"
+        ))
+
 
 async def get_db():
     """Dependency to get database session"""
@@ -56,22 +194,127 @@ async def get_db():
 
 async def init_db():
     """Initialize database tables"""
+    # Import all models to ensure they are registered, then configure every
+    # mapper once up front: a broken relationship fails startup loudly instead
+    # of being compiled lazily on the first query
+    from app.models import user, orchestration, memory, brick, strategic
+    Base.registry.configure()
+    
     try:
         async with engine.begin() as conn:
-            # Import all models to ensure they are registered
-            from app.models import user, orchestration, memory, brick
-            
             # Create all tables
             await conn.run_sync(Base.metadata.create_all)
+            if conn.dialect.name == "postgresql":
+                for statement in strategic.REVENUE_ROLLUP_DDL:
+                    await conn.execute(statement)
             logger.info("Database tables created successfully")
     except Exception as e:
         logger.error("Failed to initialize database", error=str(e))
         # Don't raise the error - let the app continue with in-memory fallback
         logger.warning("Continuing with in-memory fallback due to database issues")
+        return
+    
+    await ensure_monthly_partitions(engine)
+    
+    global _partition_task
+    if _partition_task is None or _partition_task.done():
+        _partition_task = asyncio.create_task(_roll_partitions_forward())
+
+
+async def _roll_partitions_forward():
+    """Keep the monthly partition window ahead of the clock for the life of the process"""
+    while True:
+        await asyncio.sleep(settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            await ensure_monthly_partitions(engine)
+        except Exception:
+            logger.warning("Failed to roll monthly partitions forward", exc_info=True)
+
+
+async def ensure_monthly_partitions(bind, months_ahead: int = PARTITION_MONTHS_AHEAD):
+    """Create the default, current and upcoming monthly partitions of RANGE-partitioned tables
+    
+    Idempotent. Each partition is created in its own transaction on ``bind``
+    (an engine), so one failure is logged and skipped instead of rolling back
+    the rest.
+    """
+    if bind.dialect.name != "postgresql":
+        return
+    
+    first = date.today().replace(day=1)
+    for table in Base.metadata.sorted_tables:
+        if not table.dialect_options["postgresql"].get("partition_by"):
+            continue
+        
+        try:
+            async with bind.begin() as conn:
+                await conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {table.name}_default PARTITION OF {table.name} DEFAULT"
+                ))
+        except Exception:
+            logger.warning("Failed to create default partition", table=table.name, exc_info=True)
+            continue
+        
+        for offset in range(months_ahead + 1):
+            year, month = divmod(first.month - 1 + offset, 12)
+            start = date(first.year + year, month + 1, 1)
+            year, month = divmod(first.month + offset, 12)
+            end = date(first.year + year, month + 1, 1)
+            try:
+                async with bind.begin() as conn:
+                    await _create_month_partition(conn, table, start, end)
+            except Exception:
+                logger.warning(
+                    "Failed to create monthly partition", table=table.name, month=f"{start:%Y_%m}", exc_info=True
+                )
+
+
+async def _create_month_partition(conn, table, start: date, end: date):
+    """Create one monthly partition, moving any of its rows out of the default partition
+    
+    PostgreSQL refuses to create a partition while the default partition holds
+    rows in its range (e.g. written while the roll-forward was not running), so
+    the default is detached, the partition created, the stranded rows re-inserted
+    through the parent and the default reattached, all in the caller's transaction.
+    """
+    name = f"{table.name}_{start:%Y_%m}"
+    if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is not None:
+        return
+    
+    default = f"{table.name}_default"
+    key = table.info["partition_key"][0]
+    in_range = f"{key} >= :start AND {key} < :end"
+    bounds = {"start": start, "end": end}
+    create = text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table.name} "
+        f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    )
+    stranded = await conn.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})"), bounds)
+    if not stranded:
+        await conn.execute(create)
+        return
+    
+    logger.info("Moving rows out of the default partition", table=table.name, partition=name)
+    await conn.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {default}"))
+    await conn.execute(create)
+    await conn.execute(text(
+        f"INSERT INTO {table.name} OVERRIDING SYSTEM VALUE SELECT * FROM {default} WHERE {in_range}"
+    ), bounds)
+    await conn.execute(text(f"DELETE FROM {default} WHERE {in_range}"), bounds)
+    await conn.execute(text(f"ALTER TABLE {table.name} ATTACH PARTITION {default} DEFAULT"))
 
 
 async def close_db():
     """Close database connections"""
+    global _partition_task
+    if _partition_task is not None:
+        _partition_task.cancel()
+        try:
+            await _partition_task
+        except asyncio.CancelledError:
+            pass
+        _partition_task = None
+    
     try:
         await engine.dispose()
         logger.info("Database connections closed")
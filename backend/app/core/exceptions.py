@@ -9,23 +9,28 @@ from typing import Any, Dict, Optional
 class BrickOrchestrationException(HTTPException):
     """Base exception for Brick Orchestration system"""
     
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    
     def __init__(
         self,
         detail: str = "Brick Orchestration error",
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        status_code: Optional[int] = None,
         headers: Optional[Dict[str, Any]] = None
     ):
-        super().__init__(status_code=status_code, detail=detail, headers=headers)
+        super().__init__(
+            status_code=self.status_code if status_code is None else status_code,
+            detail=detail,
+            headers=headers
+        )
 
 
 class AIOrchestrationError(BrickOrchestrationException):
     """Exception for AI orchestration failures"""
     
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    
     def __init__(self, detail: str = "AI orchestration failed"):
-        super().__init__(
-            detail=detail,
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+        super().__init__(detail=detail)
 
 
 class CrewAIError(AIOrchestrationError):
@@ -52,48 +57,43 @@ class DevinAIError(AIOrchestrationError):
 class BusinessSystemError(BrickOrchestrationException):
     """Exception for business system integration failures"""
     
+    status_code = status.HTTP_502_BAD_GATEWAY
+    
     def __init__(self, detail: str = "Business system integration failed"):
-        super().__init__(
-            detail=detail,
-            status_code=status.HTTP_502_BAD_GATEWAY
-        )
+        super().__init__(detail=detail)
 
 
 class ConfigurationError(BrickOrchestrationException):
     """Exception for configuration errors"""
     
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    
     def __init__(self, detail: str = "Configuration error"):
-        super().__init__(
-            detail=detail,
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        super().__init__(detail=detail)
 
 
 class ValidationError(BrickOrchestrationException):
     """Exception for validation errors"""
     
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    
     def __init__(self, detail: str = "Validation error"):
-        super().__init__(
-            detail=detail,
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
-        )
+        super().__init__(detail=detail)
 
 
 class AuthenticationError(BrickOrchestrationException):
     """Exception for authentication errors"""
     
+    status_code = status.HTTP_401_UNAUTHORIZED
+    
     def __init__(self, detail: str = "Authentication failed"):
-        super().__init__(
-            detail=detail,
-            status_code=status.HTTP_401_UNAUTHORIZED
-        )
+        super().__init__(detail=detail)
 
 
 class AuthorizationError(BrickOrchestrationException):
     """Exception for authorization errors"""
     
+    status_code = status.HTTP_403_FORBIDDEN
+    
     def __init__(self, detail: str = "Authorization failed"):
-        super().__init__(
-            detail=detail,
-            status_code=status.HTTP_403_FORBIDDEN
-        )
+        super().__init__(detail=detail)
@@ -0,0 +1,92 @@
+"""
+COPY-based writer for append-only log tables
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import orjson
+import structlog
+
+from app.core.batching import drain_in_batches
+from app.core.database import engine
+
+logger = structlog.get_logger(__name__)
+
+TASK_LOG_COLUMNS = ("task_id", "log_level", "message", "task_metadata", "timestamp")
+
+# Queued log rows are flushed with one COPY per COPY_BATCH_SIZE rows, at least
+# every COPY_FLUSH_INTERVAL seconds
+COPY_BATCH_SIZE = 5000
+COPY_FLUSH_INTERVAL = 0.1
+MAX_PENDING_LOGS = 50000
+
+
+async def copy_logs(conn, rows: Iterable[Tuple[Any, ...]]):
+    """COPY task log records (ordered as TASK_LOG_COLUMNS) into task_logs
+
+    conn is a raw asyncpg connection.
+    """
+    await conn.copy_records_to_table("task_logs", records=rows, columns=TASK_LOG_COLUMNS)
+
+
+class TaskLogWriter:
+    """Buffers task log rows and writes them with the COPY protocol
+
+    Skips ORM flushes and statement parsing entirely; the TaskLog model stays
+    the read path.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+    def log(
+        self,
+        task_id: Optional[int],
+        log_level: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Queue a task log row without waiting for the database"""
+        if self._writer_task is None or self._writer_task.done():
+            self._queue = asyncio.Queue(maxsize=MAX_PENDING_LOGS)
+            self._writer_task = asyncio.create_task(self._drain(self._queue))
+
+        record = (
+            task_id,
+            log_level,
+            message,
+            # asyncpg's default jsonb codec takes text
+            orjson.dumps(metadata).decode() if metadata is not None else None,
+            datetime.now(timezone.utc),
+        )
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            logger.warning("Task log queue full, dropping log", task_id=task_id)
+
+    async def _drain(self, queue: asyncio.Queue):
+        """Flush queued rows in COPY batches"""
+        await drain_in_batches(queue, self._write, COPY_BATCH_SIZE, COPY_FLUSH_INTERVAL, "Failed to copy task logs")
+
+    async def _write(self, batch: Sequence[Tuple[Any, ...]]):
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            await copy_logs(raw.driver_connection, batch)
+
+    async def flush(self):
+        """Wait for queued rows to be written and stop the writer"""
+        if self._writer_task is None:
+            return
+        await self._queue.join()
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+
+
+task_log_writer = TaskLogWriter()
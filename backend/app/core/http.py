@@ -0,0 +1,38 @@
+"""
+Shared HTTP connection pool for downstream service clients
+"""
+
+from typing import Optional
+
+import httpx
+
+# One pool for every downstream API client, so connections, TLS sessions and
+# keep-alives are reused across services instead of each service opening its own
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=256)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+_transport: Optional[httpx.AsyncHTTPTransport] = None
+
+
+def http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an HTTP client backed by the shared connection pool
+
+    Takes the usual AsyncClient options (base_url, headers, ...). The client
+    doesn't own the pool, so it isn't aclose()d; close_http_pool() closes the
+    pool once at shutdown.
+    """
+    global _transport
+
+    if _transport is None:
+        _transport = httpx.AsyncHTTPTransport(limits=HTTP_LIMITS)
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    return httpx.AsyncClient(transport=_transport, **kwargs)
+
+
+async def close_http_pool():
+    """Close the shared connection pool"""
+    global _transport
+
+    if _transport is not None:
+        transport, _transport = _transport, None
+        await transport.aclose()
@@ -2,70 +2,112 @@
 Prometheus metrics collection
 """
 
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from functools import lru_cache
+from prometheus_client import (
+    CollectorRegistry, Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+)
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Dedicated registry so scrapes only format our own series, not the
+# process/GC/platform collectors attached to the default registry
+registry = CollectorRegistry()
+
 # Request metrics
 REQUEST_COUNT = Counter(
     'brick_orchestration_requests_total',
     'Total number of requests',
-    ['method', 'endpoint', 'status']
+    ['method', 'endpoint', 'status'],
+    registry=registry
 )
 
 REQUEST_DURATION = Histogram(
     'brick_orchestration_request_duration_seconds',
     'Request duration in seconds',
-    ['method', 'endpoint']
+    ['method', 'endpoint'],
+    registry=registry
 )
 
 # AI System metrics
 AI_REQUESTS = Counter(
     'brick_orchestration_ai_requests_total',
     'Total AI system requests',
-    ['ai_system', 'task_type', 'status']
+    ['ai_system', 'task_type', 'status'],
+    registry=registry
 )
 
 AI_RESPONSE_TIME = Histogram(
     'brick_orchestration_ai_response_time_seconds',
     'AI system response time',
-    ['ai_system', 'task_type']
+    ['ai_system', 'task_type'],
+    registry=registry
 )
 
 # Orchestration metrics
 ORCHESTRATION_SESSIONS = Gauge(
     'brick_orchestration_active_sessions',
-    'Number of active orchestration sessions'
+    'Number of active orchestration sessions',
+    registry=registry
 )
 
 ORCHESTRATION_TASKS = Counter(
     'brick_orchestration_tasks_total',
     'Total orchestration tasks',
-    ['task_type', 'status']
+    ['task_type', 'status'],
+    registry=registry
 )
 
 # Business metrics
 BRICK_ANALYSES = Counter(
     'brick_orchestration_brick_analyses_total',
-    'Total BRICK analyses performed'
+    'Total BRICK analyses performed',
+    registry=registry
 )
 
 REVENUE_OPPORTUNITIES = Gauge(
     'brick_orchestration_revenue_opportunities_identified',
-    'Number of revenue opportunities identified'
+    'Number of revenue opportunities identified',
+    registry=registry
 )
 
 STRATEGIC_GAPS = Gauge(
     'brick_orchestration_strategic_gaps_identified',
-    'Number of strategic gaps identified'
+    'Number of strategic gaps identified',
+    registry=registry
 )
 
 
+# Bound label children, cached so recording skips per-call label resolution
+@lru_cache(maxsize=4096)
+def _request_count_child(method: str, endpoint: str, status_code: int):
+    return REQUEST_COUNT.labels(method, endpoint, status_code)
+
+
+@lru_cache(maxsize=4096)
+def _request_duration_child(method: str, endpoint: str):
+    return REQUEST_DURATION.labels(method, endpoint)
+
+
+@lru_cache(maxsize=4096)
+def _ai_requests_child(ai_system: str, task_type: str, status: str):
+    return AI_REQUESTS.labels(ai_system, task_type, status)
+
+
+@lru_cache(maxsize=4096)
+def _ai_response_time_child(ai_system: str, task_type: str):
+    return AI_RESPONSE_TIME.labels(ai_system, task_type)
+
+
+@lru_cache(maxsize=4096)
+def _orchestration_tasks_child(task_type: str, status: str):
+    return ORCHESTRATION_TASKS.labels(task_type, status)
+
+
 def generate_metrics():
     """Generate Prometheus metrics"""
     try:
-        return generate_latest()
+        return generate_latest(registry)
     except Exception as e:
         logger.error("Failed to generate metrics", error=str(e))
         raise
@@ -74,16 +116,8 @@ def generate_metrics():
 def record_request(method: str, endpoint: str, status_code: int, duration: float):
     """Record request metrics"""
     try:
-        REQUEST_COUNT.labels(
-            method=method,
-            endpoint=endpoint,
-            status=status_code
-        ).inc()
-        
-        REQUEST_DURATION.labels(
-            method=method,
-            endpoint=endpoint
-        ).observe(duration)
+        _request_count_child(method, endpoint, status_code).inc()
+        _request_duration_child(method, endpoint).observe(duration)
         
     except Exception as e:
         logger.error("Failed to record request metrics", error=str(e))
@@ -92,16 +126,8 @@ def record_request(method: str, endpoint: str, status_code: int, duration: float
 def record_ai_request(ai_system: str, task_type: str, status: str, duration: float):
     """Record AI system request metrics"""
     try:
-        AI_REQUESTS.labels(
-            ai_system=ai_system,
-            task_type=task_type,
-            status=status
-        ).inc()
-        
-        AI_RESPONSE_TIME.labels(
-            ai_system=ai_system,
-            task_type=task_type
-        ).observe(duration)
+        _ai_requests_child(ai_system, task_type, status).inc()
+        _ai_response_time_child(ai_system, task_type).observe(duration)
         
     except Exception as e:
         logger.error("Failed to record AI request metrics", error=str(e))
@@ -118,10 +144,7 @@ def record_orchestration_session(active_sessions: int):
 def record_orchestration_task(task_type: str, status: str):
     """Record orchestration task metrics"""
     try:
-        ORCHESTRATION_TASKS.labels(
-            task_type=task_type,
-            status=status
-        ).inc()
+        _orchestration_tasks_child(task_type, status).inc()
     except Exception as e:
         logger.error("Failed to record orchestration task metrics", error=str(e))
 
@@ -0,0 +1,42 @@
+"""
+Buffered random UUID generation
+"""
+
+import os
+import threading
+
+# One os.urandom() call yields POOL_BYTES // 16 UUIDs
+POOL_BYTES = 4096
+
+_local = threading.local()
+
+
+def _reset_after_fork():
+    # A forked worker must not hand out the parent's remaining random bytes
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def fast_uuid4() -> str:
+    """Random (version 4) UUID string, like str(uuid.uuid4())
+
+    Random bytes are drawn from a per-thread buffer refilled with one
+    os.urandom() read, rather than one read per UUID.
+    """
+    pool = _local.__dict__
+    buf = pool.get("buf")
+    pos = pool.get("pos", POOL_BYTES)
+    if buf is None or pos >= POOL_BYTES:
+        buf = pool["buf"] = os.urandom(POOL_BYTES)
+        pos = 0
+    pool["pos"] = pos + 16
+
+    raw = bytearray(buf[pos:pos + 16])
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
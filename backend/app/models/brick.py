@@ -2,10 +2,9 @@
 BRICK (Business Resource Intelligence & Capability Kit) models
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Float, Boolean, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, DateTime, Text, Float, Boolean, ForeignKey, Index, CheckConstraint, Identity, FetchedValue
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, BigIntType, JSONBType, clock_timestamp
 
 
 class Brick(Base):
@@ -13,27 +12,44 @@ class Brick(Base):
     
     __tablename__ = "bricks"
     
-    id = Column(Integer, primary_key=True, index=True)
-    brick_id = Column(String(100), unique=True, index=True, nullable=False)
-    name = Column(String(200), nullable=False)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    brick_id = Column(Text, unique=True, index=True, nullable=False)
+    name = Column(Text, nullable=False)
     description = Column(Text)
-    category = Column(String(100), nullable=False)  # automation, analysis, integration, etc.
-    status = Column(String(50), default="development")  # development, testing, production, deprecated
+    category = Column(Text, nullable=False)  # automation, analysis, integration, etc.
+    status = Column(Text, default="development")  # development, testing, production, deprecated
     priority = Column(Integer, default=5)  # 1-10 scale
     complexity = Column(Integer, default=5)  # 1-10 scale
     estimated_development_hours = Column(Integer)
     actual_development_hours = Column(Integer)
     revenue_potential = Column(Float)  # Estimated revenue impact
-    dependencies = Column(JSON)  # Array of other brick IDs this depends on
-    capabilities = Column(JSON)  # Array of capabilities this brick provides
-    integration_points = Column(JSON)  # APIs, databases, services this connects to
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    dependencies = Column(JSONBType)  # Array of other brick IDs this depends on
+    capabilities = Column(JSONBType)  # Array of capabilities this brick provides
+    integration_points = Column(JSONBType)  # APIs, databases, services this connects to
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
     deployed_at = Column(DateTime(timezone=True))
     
-    # Relationships
-    developments = relationship("BrickDevelopment", back_populates="brick")
-    analyses = relationship("BrickAnalysis", back_populates="brick")
+    __table_args__ = (
+        # Default jsonb_ops so both @> and key-existence (?) lookups are indexed
+        Index("ix_bricks_capabilities_gin", capabilities, postgresql_using="gin"),
+        Index("ix_bricks_dependencies_gin", dependencies, postgresql_using="gin"),
+        # Status/priority listings are answered from the index alone (index-only scan)
+        Index(
+            "ix_bricks_status_priority_covering",
+            status,
+            priority,
+            postgresql_include=["name", "category", "revenue_potential"],
+        ),
+        CheckConstraint(
+            "status IN ('development', 'testing', 'production', 'deprecated')",
+            name="ck_bricks_status",
+        ),
+    )
+    
+    # Relationships (load explicitly with selectinload(); implicit lazy loads raise)
+    developments = relationship("BrickDevelopment", back_populates="brick", lazy="raise")
+    analyses = relationship("BrickAnalysis", back_populates="brick", lazy="raise")
 
 
 class BrickDevelopment(Base):
@@ -41,15 +57,15 @@ class BrickDevelopment(Base):
     
     __tablename__ = "brick_developments"
     
-    id = Column(Integer, primary_key=True, index=True)
-    brick_id = Column(Integer, ForeignKey("bricks.id"))
-    development_type = Column(String(50), nullable=False)  # planning, coding, testing, deployment
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    brick_id = Column(BigIntType, ForeignKey("bricks.id"))
+    development_type = Column(Text, nullable=False)  # planning, coding, testing, deployment
     description = Column(Text)
     progress_percentage = Column(Integer, default=0)  # 0-100
-    ai_system_used = Column(String(50))  # Which AI system handled this development
-    output = Column(JSON)  # Code, configurations, documentation
+    ai_system_used = Column(Text)  # Which AI system handled this development
+    output = Column(JSONBType)  # Code, configurations, documentation
     time_spent_minutes = Column(Integer)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
     
     # Relationships
     brick = relationship("Brick", back_populates="developments")
@@ -60,15 +76,15 @@ class BrickAnalysis(Base):
     
     __tablename__ = "brick_analyses"
     
-    id = Column(Integer, primary_key=True, index=True)
-    brick_id = Column(Integer, ForeignKey("bricks.id"))
-    analysis_type = Column(String(50), nullable=False)  # strategic, technical, financial, market
-    ai_system_used = Column(String(50))
-    findings = Column(Text)
-    recommendations = Column(Text)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    brick_id = Column(BigIntType, ForeignKey("bricks.id"))
+    analysis_type = Column(Text, nullable=False)  # strategic, technical, financial, market
+    ai_system_used = Column(Text)
+    findings = Column(Text, info={"compression": "lz4"})
+    recommendations = Column(Text, info={"compression": "lz4"})
     confidence_score = Column(Float)  # 0.0 to 1.0
-    impact_assessment = Column(JSON)  # Revenue, efficiency, strategic value
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    impact_assessment = Column(JSONBType)  # Revenue, efficiency, strategic value
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
     
     # Relationships
     brick = relationship("Brick", back_populates="analyses")
@@ -2,9 +2,8 @@
 Memory models for persistent AI memory and context
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Float, Boolean
-from sqlalchemy.sql import func
-from app.core.database import Base
+from sqlalchemy import Column, DateTime, Text, Float, Boolean, Index, Identity, DDL, event, text, FetchedValue
+from app.core.database import Base, BigIntType, JSONBType, clock_timestamp
 
 
 class Memory(Base):
@@ -16,13 +15,25 @@ class Memory(Base):
     
     __tablename__ = "memories"
     
-    id = Column(Integer, primary_key=True, index=True)
-    memory_id = Column(String(100), unique=True, index=True, nullable=False)
-    user_id = Column(String(255), nullable=False, index=True)  # Trinity BRICKS: Multi-user isolation
-    content = Column(JSON, nullable=False)  # Trinity BRICKS: Store as JSONB for structured data
-    memory_metadata = Column("metadata", JSON)  # Trinity BRICKS: Flexible metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    memory_id = Column(Text, unique=True, index=True, nullable=False)
+    user_id = Column(Text, nullable=False)  # Trinity BRICKS: Multi-user isolation
+    content = Column(JSONBType, nullable=False)  # Trinity BRICKS: Store as JSONB for structured data
+    memory_metadata = Column("metadata", JSONBType)  # Trinity BRICKS: Flexible metadata
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    __table_args__ = (
+        # Per-user listings filter on user_id and read newest first
+        Index("ix_memories_user_created", user_id, created_at.desc()),
+        # Containment lookups (content @> '{"type": ...}')
+        Index(
+            "ix_memories_content_gin",
+            content,
+            postgresql_using="gin",
+            postgresql_ops={"content": "jsonb_path_ops"},
+        ),
+    )
     
     def __repr__(self):
         return f"<Memory(id={self.id}, user='{self.user_id}', memory_id='{self.memory_id}')>"
@@ -33,15 +44,27 @@ class Context(Base):
     
     __tablename__ = "contexts"
     
-    id = Column(Integer, primary_key=True, index=True)
-    context_id = Column(String(100), unique=True, index=True, nullable=False)
-    session_id = Column(String(100), index=True)
-    context_type = Column(String(50), nullable=False)  # session, task, user, business
-    content = Column(JSON, nullable=False)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    context_id = Column(Text, index=True, nullable=False)
+    session_id = Column(Text, index=True)
+    context_type = Column(Text, nullable=False)  # session, task, user, business
+    content = Column(JSONBType, nullable=False)
     is_active = Column(Boolean, default=True)
     expires_at = Column(DateTime(timezone=True))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    __table_args__ = (
+        # Uniqueness only matters for live contexts; the partial index stays
+        # small as expired contexts accumulate
+        Index(
+            "ux_contexts_active_context_id",
+            context_id,
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
     
     def __repr__(self):
         return f"<Context(id={self.id}, type='{self.context_type}', session='{self.session_id}')>"
@@ -52,14 +75,42 @@ class KnowledgeGraph(Base):
     
     __tablename__ = "knowledge_graph"
     
-    id = Column(Integer, primary_key=True, index=True)
-    source_entity = Column(String(200), nullable=False, index=True)
-    relationship = Column(String(100), nullable=False)
-    target_entity = Column(String(200), nullable=False, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    source_entity = Column(Text, nullable=False)
+    relationship = Column(Text, nullable=False)
+    target_entity = Column(Text, nullable=False)
     strength = Column(Float, default=1.0)  # Relationship strength
-    memory_metadata = Column("metadata", JSON)  # Map to 'metadata' column in database
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    memory_metadata = Column("metadata", JSONBType)  # Map to 'metadata' column in database
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    __table_args__ = (
+        # Forward and reverse traversal by (entity, relationship)
+        Index("ix_kg_fwd", source_entity, relationship, target_entity),
+        Index("ix_kg_rev", target_entity, relationship, source_entity),
+        # Substring/typeahead matches (LIKE '%acme%') on source entities
+        Index(
+            "ix_kg_src_trgm",
+            source_entity,
+            postgresql_using="gin",
+            postgresql_ops={"source_entity": "gin_trgm_ops"},
+        ),
+        # Ranked traversal only follows strong edges
+        Index(
+            "ix_kg_strong",
+            source_entity,
+            strength.desc(),
+            postgresql_where=strength > 0.5,
+        ),
+    )
     
     def __repr__(self):
         return f"<KnowledgeGraph({self.source_entity} -> {self.relationship} -> {self.target_entity})>"
+
+
+# gin_trgm_ops comes from pg_trgm, which must exist before the table's indexes
+event.listen(
+    KnowledgeGraph.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -2,13 +2,13 @@
 Orchestration models for tracking AI system interactions
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey, Boolean, Index, CheckConstraint, Identity, text, FetchedValue
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-from app.core.database import Base
+from app.core.database import Base, BigIntType, JSONBType, clock_timestamp
 
 
 class OrchestrationSession(Base):
@@ -16,19 +16,28 @@ class OrchestrationSession(Base):
     
     __tablename__ = "orchestration_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String(100), unique=True, index=True, nullable=False)
-    user_id = Column(Integer, nullable=True)  # Removed foreign key constraint
-    status = Column(String(50), default="active")  # active, completed, failed, cancelled
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    session_id = Column(Text, unique=True, index=True, nullable=False)
+    user_id = Column(BigIntType, nullable=True)  # Removed foreign key constraint
+    status = Column(Text, default="active")  # active, completed, failed, cancelled
     goal = Column(Text)  # High-level goal description
-    context = Column(JSON)  # Session context and parameters
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    context = Column(JSONBType)  # Session context and parameters
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
     completed_at = Column(DateTime(timezone=True))
     
+    __table_args__ = (
+        # Session listings read newest first
+        Index("ix_orchestration_sessions_created", created_at.desc()),
+        CheckConstraint(
+            "status IN ('active', 'completed', 'failed', 'cancelled')",
+            name="ck_orchestration_sessions_status",
+        ),
+    )
+    
     # Relationships
     # user = relationship("User", back_populates="orchestration_sessions")  # Temporarily disabled
-    tasks = relationship("OrchestrationTask", back_populates="session")
+    tasks = relationship("OrchestrationTask", back_populates="session", lazy="raise")
 
 
 class OrchestrationTask(Base):
@@ -36,24 +45,32 @@ class OrchestrationTask(Base):
     
     __tablename__ = "orchestration_tasks"
     
-    id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(String(100), unique=True, index=True, nullable=False)
-    session_id = Column(Integer, ForeignKey("orchestration_sessions.id"))
-    ai_system = Column(String(50), nullable=False)  # crewai, mem0, devin, copilot, etc.
-    task_type = Column(String(50), nullable=False)  # analysis, generation, execution, etc.
-    status = Column(String(50), default="pending")  # pending, running, completed, failed
-    input_data = Column(JSON)
-    output_data = Column(JSON)
-    error_message = Column(Text)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    task_id = Column(Text, unique=True, index=True, nullable=False)
+    session_id = Column(BigIntType, ForeignKey("orchestration_sessions.id"))
+    ai_system = Column(Text, nullable=False)  # crewai, mem0, devin, copilot, etc.
+    task_type = Column(Text, nullable=False)  # analysis, generation, execution, etc.
+    status = Column(Text, default="pending")  # pending, running, completed, failed
+    input_data = Column(JSONBType)
+    output_data = Column(JSONBType)
+    error_message = Column(Text, info={"compression": "lz4"})
     execution_time_ms = Column(Integer)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')",
+            name="ck_orchestration_tasks_status",
+        ),
+    )
+    
     # Relationships
     session = relationship("OrchestrationSession", back_populates="tasks")
-    logs = relationship("TaskLog", back_populates="task")
+    # Logs nearly always follow a task; batch them in one IN (...) query
+    logs = relationship("TaskLog", back_populates="task", lazy="selectin")
 
 
 class TaskLog(Base):
@@ -61,12 +78,45 @@ class TaskLog(Base):
     
     __tablename__ = "task_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(Integer, ForeignKey("orchestration_tasks.id"))
-    log_level = Column(String(20), nullable=False)  # info, warning, error, debug
-    message = Column(Text, nullable=False)
-    task_metadata = Column(JSON)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    task_id = Column(BigIntType, ForeignKey("orchestration_tasks.id"))
+    log_level = Column(Text, nullable=False)  # info, warning, error, debug
+    message = Column(Text, nullable=False, info={"compression": "lz4"})
+    task_metadata = Column(JSONBType)
+    timestamp = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    
+    __table_args__ = (
+        # Per-task log tail, newest first
+        Index("ix_task_logs_task_ts", task_id, timestamp.desc()),
+        # Alert queries only look at warnings and errors
+        Index(
+            "ix_task_logs_alerts",
+            task_id,
+            timestamp.desc(),
+            postgresql_where=text("log_level IN ('warning', 'error')"),
+        ),
+        Index(
+            "ix_task_logs_metadata_gin",
+            task_metadata,
+            postgresql_using="gin",
+            postgresql_ops={"task_metadata": "jsonb_path_ops"},
+        ),
+        # Append-only, so timestamp follows physical order; BRIN block ranges
+        # serve time-window scans at a fraction of a B-tree's size
+        Index(
+            "ix_task_logs_ts_brin",
+            timestamp,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        CheckConstraint(
+            "log_level IN ('debug', 'info', 'warning', 'error')",
+            name="ck_task_logs_log_level",
+        ),
+        # Monthly partitions, see ensure_monthly_partitions; the partition key
+        # joins the primary key on PostgreSQL only, see _compile_primary_key
+        {"postgresql_partition_by": "RANGE (timestamp)", "info": {"partition_key": ("timestamp",)}},
+    )
     
     # Relationships
     task = relationship("OrchestrationTask", back_populates="logs")
@@ -77,14 +127,26 @@ class AIInteraction(Base):
     
     __tablename__ = "ai_interactions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("orchestration_sessions.id"))
-    from_ai_system = Column(String(50), nullable=False)
-    to_ai_system = Column(String(50), nullable=False)
-    interaction_type = Column(String(50), nullable=False)  # request, response, collaboration
-    message = Column(Text, nullable=False)
-    task_metadata = Column(JSON)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    session_id = Column(BigIntType, ForeignKey("orchestration_sessions.id"))
+    from_ai_system = Column(Text, nullable=False)
+    to_ai_system = Column(Text, nullable=False)
+    interaction_type = Column(Text, nullable=False)  # request, response, collaboration
+    message = Column(Text, nullable=False, info={"compression": "lz4"})
+    task_metadata = Column(JSONBType)
+    timestamp = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    
+    __table_args__ = (
+        # Per-session interaction history, newest first
+        Index("ix_ai_interactions_session_ts", session_id, timestamp.desc()),
+        Index(
+            "ix_ai_interactions_ts_brin",
+            timestamp,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)", "info": {"partition_key": ("timestamp",)}},
+    )
     
     # Relationships
     session = relationship("OrchestrationSession")
@@ -94,24 +156,36 @@ class ChatMessage(Base):
     """Chat messages model - stores chat conversation history"""
     __tablename__ = "chat_messages"
     
-    id = Column(Integer, primary_key=True, index=True)
-    message_id = Column(String, unique=True, index=True, nullable=False)
-    session_id = Column(String, index=True, nullable=False)
-    message_type = Column(String(20), nullable=False)  # user or system
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    message_id = Column(Text, unique=True, index=True, nullable=False)
+    session_id = Column(Text, index=True, nullable=False)
+    message_type = Column(Text, nullable=False)  # user or system
     content = Column(Text, nullable=False)
-    message_metadata = Column(JSON)  # renamed from 'metadata' (SQLAlchemy reserved)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    message_metadata = Column(JSONBType)  # renamed from 'metadata' (SQLAlchemy reserved)
+    timestamp = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    
+    __table_args__ = (
+        # Conversation replay filters on session_id and orders by time
+        Index("ix_chat_messages_session_ts", session_id, timestamp.desc()),
+        Index(
+            "ix_chat_messages_ts_brin",
+            timestamp,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        CheckConstraint("message_type IN ('user', 'system')", name="ck_chat_messages_message_type"),
+    )
 
 
 class ChatSession(Base):
     """Chat sessions model - stores chat session metadata"""
     __tablename__ = "chat_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, unique=True, index=True, nullable=False)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    session_id = Column(Text, unique=True, index=True, nullable=False)
     message_count = Column(Integer, default=0)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    last_activity = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    last_activity = Column(DateTime(timezone=True), server_default=clock_timestamp(), onupdate=func.now())
 
 
 # Pydantic models for API responses
@@ -2,16 +2,19 @@
 Database models for Strategic Intelligence Layer
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Text, Boolean
-from sqlalchemy.sql import func
-from app.core.database import Base
+from sqlalchemy import (
+    Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey, Identity, Index, DDL, MetaData,
+    Table, FetchedValue, event, text
+)
+from sqlalchemy.orm import deferred, relationship
+from app.core.database import Base, BigIntType, JSONBType, clock_timestamp
 
 
 class BRICKEcosystem(Base):
     """BRICKS ecosystem model - stores BRICK definitions and relationships"""
     __tablename__ = "brick_ecosystem"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     brick_id = Column(String, unique=True, index=True, nullable=False)
     brick_name = Column(String, nullable=False)
     brick_type = Column(String, nullable=False)  # existing, potential
@@ -19,25 +22,50 @@ class BRICKEcosystem(Base):
     revenue_stream = Column(String)
     monthly_revenue = Column(Float, default=0.0)
     user_base = Column(Integer, default=0)
-    technology_stack = Column(JSON)
-    integration_points = Column(JSON)
+    # Wide columns in the "details" group are skipped by list queries and load
+    # together on first access, or up front with undefer_group("details")
+    technology_stack = deferred(Column(JSONBType), group="details")
+    integration_points = deferred(Column(JSONBType), group="details")
     expansion_potential = Column(String)
     strategic_value = Column(String)
     revenue_potential = Column(String)
-    dependencies = Column(JSON)
-    value_proposition = Column(Text)
+    dependencies = deferred(Column(JSONBType), group="details")
+    value_proposition = deferred(Column(Text), group="details")
     target_market = Column(String)
     estimated_dev_time = Column(String)
-    brick_metadata = Column(JSON)  # Renamed from metadata to avoid SQLAlchemy reserved name
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    brick_metadata = deferred(Column(JSONBType), group="details")  # Renamed from metadata to avoid SQLAlchemy reserved name
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    __table_args__ = (
+        # jsonb_path_ops: smaller index, serves "technology_stack @> '[...]'" containment
+        Index(
+            "ix_brick_ecosystem_technology_stack_gin",
+            "technology_stack",
+            postgresql_using="gin",
+            postgresql_ops={"technology_stack": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_brick_ecosystem_dependencies_gin",
+            "dependencies",
+            postgresql_using="gin",
+            postgresql_ops={"dependencies": "jsonb_path_ops"},
+        ),
+        # Dashboard listings filter on status and existing/potential type
+        Index("ix_brick_ecosystem_status_type", "status", "brick_type"),
+    )
+    
+    # Loaded with one WHERE brick_id IN (...) query per collection, not per row
+    priorities = relationship("BRICKPriority", back_populates="brick", lazy="selectin")
+    constraints = relationship("ConstraintPrediction", back_populates="brick", lazy="selectin")
+    income_streams = relationship("IncomeStream", back_populates="brick", lazy="selectin")
 
 
 class RevenueOpportunity(Base):
     """Revenue opportunities model - stores identified revenue opportunities"""
     __tablename__ = "revenue_opportunities"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     opportunity_id = Column(String, unique=True, index=True, nullable=False)
     opportunity_type = Column(String, nullable=False)  # cross_selling, upselling, new_brick, etc.
     name = Column(String, nullable=False)
@@ -46,17 +74,68 @@ class RevenueOpportunity(Base):
     probability = Column(Float, default=0.5)
     effort_level = Column(String)
     time_to_revenue = Column(String)
-    action_items = Column(JSON)
+    action_items = Column(JSONBType)
     status = Column(String, default="identified")  # identified, in_progress, completed, rejected
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+
+
+# Revenue roll-up per (status, opportunity_type), materialized so dashboards read a
+# handful of pre-aggregated rows. The unique index is what allows
+# REFRESH MATERIALIZED VIEW CONCURRENTLY, so readers are never blocked.
+# Created by init_db on every startup (IF NOT EXISTS), not on table creation,
+# so databases that predate the view get it too.
+REVENUE_ROLLUP_VIEW = "mv_revenue_by_status"
+
+REVENUE_ROLLUP_DDL = (
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {REVENUE_ROLLUP_VIEW} AS "
+        "SELECT status, opportunity_type, "
+        "count(*) AS opportunity_count, "
+        "sum(potential_revenue) AS total_potential_revenue, "
+        "avg(probability) AS avg_probability "
+        "FROM revenue_opportunities GROUP BY status, opportunity_type"
+    ),
+    DDL(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{REVENUE_ROLLUP_VIEW} "
+        f"ON {REVENUE_ROLLUP_VIEW} (status, opportunity_type)"
+    ),
+)
+
+event.listen(
+    RevenueOpportunity.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {REVENUE_ROLLUP_VIEW}").execute_if(dialect="postgresql"),
+)
+
+
+class RevenueRollup(Base):
+    """Read-only mapping of the revenue roll-up materialized view"""
+    # Separate metadata keeps create_all from emitting the view as a table
+    __table__ = Table(
+        REVENUE_ROLLUP_VIEW,
+        MetaData(),
+        Column("status", String, primary_key=True),
+        Column("opportunity_type", String, primary_key=True),
+        Column("opportunity_count", Integer),
+        Column("total_potential_revenue", Float),
+        Column("avg_probability", Float),
+    )
+
+
+class MaterializedViewRefresh(Base):
+    """Last refresh time of each materialized view, kept apart from its rows"""
+    __tablename__ = "materialized_view_refreshes"
+    
+    view_name = Column(String, primary_key=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
 
 
 class StrategicGap(Base):
     """Strategic gaps model - stores identified strategic gaps"""
     __tablename__ = "strategic_gaps"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     gap_id = Column(String, unique=True, index=True, nullable=False)
     gap_category = Column(String, nullable=False)  # capability, market, revenue, technology, competitive
     gap_name = Column(String, nullable=False)
@@ -66,43 +145,59 @@ class StrategicGap(Base):
     severity = Column(String)
     impact = Column(String)
     coverage_level = Column(Float)
-    missing_capabilities = Column(JSON)
+    missing_capabilities = deferred(Column(JSONBType), group="details")
     market_segment = Column(String)
     current_penetration = Column(Float)
     market_size = Column(Integer)
     revenue_potential = Column(Float)
     competition_level = Column(String)
-    examples = Column(JSON)
-    mitigation_strategy = Column(Text)
+    examples = deferred(Column(JSONBType), group="details")
+    mitigation_strategy = deferred(Column(Text), group="details")
     status = Column(String, default="open")  # open, in_progress, resolved, accepted
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    __table_args__ = (
+        # Only unresolved gaps are listed; completed ones stay out of the index
+        Index(
+            "ix_strategic_gaps_active_category",
+            gap_category,
+            postgresql_where=text("status <> 'completed'"),
+        ),
+    )
 
 
 class BRICKPriority(Base):
     """BRICK priority model - stores BRICK priority scores and rankings"""
     __tablename__ = "brick_priorities"
     
-    id = Column(Integer, primary_key=True, index=True)
-    brick_id = Column(String, index=True, nullable=False)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
+    brick_id = Column(String, ForeignKey("brick_ecosystem.brick_id"), nullable=False)
     brick_name = Column(String, nullable=False)
     priority_score = Column(Float, nullable=False)
     priority_level = Column(String, nullable=False)  # critical, high, medium, low
-    component_scores = Column(JSON)  # Individual scoring components
+    component_scores = Column(JSONBType)  # Individual scoring components
     recommendation = Column(Text)
-    estimated_timeline = Column(JSON)
+    estimated_timeline = Column(JSONBType)
     dependencies_met = Column(Boolean, default=False)
-    calculated_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    calculated_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    __table_args__ = (
+        # Also serves brick_id-only lookups and the selectin load from BRICKEcosystem
+        Index("ix_brick_priorities_brick_level", brick_id, priority_level),
+    )
+    
+    brick = relationship("BRICKEcosystem", back_populates="priorities")
 
 
 class ConstraintPrediction(Base):
     """Constraint predictions model - stores predicted constraints for BRICKs"""
     __tablename__ = "constraint_predictions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     prediction_id = Column(String, unique=True, index=True, nullable=False)
-    brick_id = Column(String, index=True, nullable=False)
+    brick_id = Column(String, ForeignKey("brick_ecosystem.brick_id"), index=True, nullable=False)
     brick_name = Column(String, nullable=False)
     constraint_type = Column(String, nullable=False)  # resource, technical, business, operational
     constraint_description = Column(Text)
@@ -110,19 +205,21 @@ class ConstraintPrediction(Base):
     impact = Column(String)
     probability = Column(Float)
     mitigation_strategy = Column(Text)
-    mitigation_actions = Column(JSON)
-    predicted_at = Column(DateTime(timezone=True), server_default=func.now())
+    mitigation_actions = Column(JSONBType)
+    predicted_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
     resolved = Column(Boolean, default=False)
     resolved_at = Column(DateTime(timezone=True))
+    
+    brick = relationship("BRICKEcosystem", back_populates="constraints")
 
 
 class IncomeStream(Base):
     """Income streams model - stores revenue stream data"""
     __tablename__ = "income_streams"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     stream_id = Column(String, unique=True, index=True, nullable=False)
-    brick_id = Column(String, index=True, nullable=False)
+    brick_id = Column(String, ForeignKey("brick_ecosystem.brick_id"), index=True, nullable=False)
     stream_type = Column(String, nullable=False)  # subscription, service_fee, transaction_fee, etc.
     current_monthly = Column(Float, nullable=False)
     projected_annual = Column(Float)
@@ -133,29 +230,31 @@ class IncomeStream(Base):
     recurring = Column(Boolean, default=False)
     predictability = Column(String)
     margin = Column(Float)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
+    
+    brick = relationship("BRICKEcosystem", back_populates="income_streams")
 
 
 class BRICKProposal(Base):
     """BRICK proposals model - stores autonomous BRICK development proposals"""
     __tablename__ = "brick_proposals"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     proposal_id = Column(String, unique=True, index=True, nullable=False)
     proposal_type = Column(String, nullable=False)
     brick_name = Column(String, nullable=False)
     brick_id = Column(String)
-    opportunity = Column(JSON)
-    brick_design = Column(JSON)
-    revenue_impact = Column(JSON)
-    feasibility_assessment = Column(JSON)
-    implementation_plan = Column(JSON)
-    intelligence_sources = Column(JSON)
+    opportunity = Column(JSONBType)
+    brick_design = Column(JSONBType)
+    revenue_impact = Column(JSONBType)
+    feasibility_assessment = Column(JSONBType)
+    implementation_plan = Column(JSONBType)
+    intelligence_sources = Column(JSONBType)
     status = Column(String, default="pending_approval")  # pending_approval, approved, rejected, in_development
     confidence_score = Column(Float)
     human_feedback = Column(Text)
     reviewed_by = Column(String)
     reviewed_at = Column(DateTime(timezone=True))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
@@ -3,10 +3,15 @@ UBIC v1.5 Models - Universal Brick Interface Contract
 """
 
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
-import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+
+from app.core.uuid_pool import fast_uuid4
+
+# Timezone-aware replacement for the deprecated datetime.utcnow
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 class Priority(str, Enum):
@@ -33,7 +38,23 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
-class UBICResponse(BaseModel):
+class UBICModel(BaseModel):
+    """Base for UBIC models"""
+
+    # Messages are immutable once built; nothing reassigns their fields
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def fast_build(cls, **data: Any):
+        """Build from trusted, already well-typed data, skipping validation
+
+        Defaults and default factories are still applied. Only use it for data
+        the service produces itself; enums must be passed as enum members.
+        """
+        return cls.model_construct(**data)
+
+
+class UBICResponse(UBICModel):
     """UBIC v1.5 Standard API Response Format"""
     status: Status = Field(..., description="Response status")
     error_code: Optional[str] = Field(None, description="Error code if applicable")
@@ -41,7 +62,7 @@ class UBICResponse(BaseModel):
     details: Dict[str, Any] = Field(default_factory=dict, description="Additional details")
 
 
-class EmergenceSignal(BaseModel):
+class EmergenceSignal(UBICModel):
     """Emergence detection signal"""
     signal: bool = Field(..., description="Whether emergence is detected")
     type: Optional[str] = Field(None, description="Type of emergence")
@@ -49,29 +70,29 @@ class EmergenceSignal(BaseModel):
     threshold_metrics: Dict[str, Any] = Field(default_factory=dict, description="Boundary conditions")
 
 
-class UBICMessage(BaseModel):
+class UBICMessage(UBICModel):
     """UBIC v1.5 Standard Message Format"""
-    idempotency_key: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique message identifier")
+    idempotency_key: str = Field(default_factory=fast_uuid4, description="Unique message identifier")
     priority: Priority = Field(Priority.NORMAL, description="Message priority")
     source: str = Field(..., description="Source brick name")
     target: str = Field(..., description="Target brick name")
     message_type: str = Field(..., description="Type of message")
     payload: Dict[str, Any] = Field(default_factory=dict, description="Message payload")
-    trace_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Request trace identifier")
+    trace_id: str = Field(default_factory=fast_uuid4, description="Request trace identifier")
     emergence: Optional[EmergenceSignal] = Field(None, description="Emergence detection data")
 
 
-class DependencyInfo(BaseModel):
+class DependencyInfo(UBICModel):
     """Dependency information"""
     name: str = Field(..., description="Dependency name")
     type: str = Field(..., description="Dependency type (infra/functional/optional)")
     severity: Severity = Field(Severity.INFO, description="Dependency severity")
     status: Status = Field(..., description="Dependency status")
-    last_check: datetime = Field(default_factory=datetime.utcnow, description="Last health check")
+    last_check: datetime = Field(default_factory=_utcnow, description="Last health check")
     details: Dict[str, Any] = Field(default_factory=dict, description="Additional dependency info")
 
 
-class CapabilityInfo(BaseModel):
+class CapabilityInfo(UBICModel):
     """Brick capabilities information"""
     name: str = Field(..., description="Capability name")
     description: str = Field(..., description="Capability description")
@@ -79,7 +100,7 @@ class CapabilityInfo(BaseModel):
     enabled: bool = Field(True, description="Whether capability is enabled")
 
 
-class FeatureFlag(BaseModel):
+class FeatureFlag(UBICModel):
     """Feature flag definition"""
     name: str = Field(..., description="Feature flag name")
     supported: bool = Field(..., description="Whether feature is supported")
@@ -87,7 +108,7 @@ class FeatureFlag(BaseModel):
     description: Optional[str] = Field(None, description="Feature description")
 
 
-class ResourceSpec(BaseModel):
+class ResourceSpec(UBICModel):
     """Resource specification"""
     cpu_min: float = Field(0.1, description="Minimum CPU cores")
     cpu_recommended: float = Field(1.0, description="Recommended CPU cores")
@@ -100,15 +121,15 @@ class ResourceSpec(BaseModel):
     storage_max: str = Field("100Gi", description="Maximum storage")
 
 
-class HealthStatus(BaseModel):
+class HealthStatus(UBICModel):
     """Health status with dependencies"""
     status: Status = Field(..., description="Overall health status")
     dependencies: List[DependencyInfo] = Field(default_factory=list, description="Dependency health")
-    last_check: datetime = Field(default_factory=datetime.utcnow, description="Last health check")
+    last_check: datetime = Field(default_factory=_utcnow, description="Last health check")
     uptime_seconds: int = Field(0, description="Service uptime in seconds")
 
 
-class StateMetrics(BaseModel):
+class StateMetrics(UBICModel):
     """Operational state metrics"""
     requests_total: int = Field(0, description="Total requests processed")
     requests_success: int = Field(0, description="Successful requests")
@@ -117,10 +138,10 @@ class StateMetrics(BaseModel):
     memory_usage_percent: float = Field(0.0, description="Memory usage percentage")
     cpu_usage_percent: float = Field(0.0, description="CPU usage percentage")
     active_connections: int = Field(0, description="Active connections")
-    last_updated: datetime = Field(default_factory=datetime.utcnow, description="Last metrics update")
+    last_updated: datetime = Field(default_factory=_utcnow, description="Last metrics update")
 
 
-class BrickCapabilities(BaseModel):
+class BrickCapabilities(UBICModel):
     """Brick capabilities response"""
     capabilities: List[CapabilityInfo] = Field(default_factory=list, description="Available capabilities")
     api_version: str = Field("1.5", description="UBIC API version")
@@ -128,34 +149,34 @@ class BrickCapabilities(BaseModel):
     resource_spec: ResourceSpec = Field(default_factory=ResourceSpec, description="Resource specification")
 
 
-class ConfigReloadRequest(BaseModel):
+class ConfigReloadRequest(UBICModel):
     """Configuration reload request"""
     dry_run: bool = Field(True, description="Whether to perform dry run validation")
     config_data: Dict[str, Any] = Field(..., description="Configuration data to reload")
-    request_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Request identifier")
+    request_id: str = Field(default_factory=fast_uuid4, description="Request identifier")
 
 
-class RateLimitInfo(BaseModel):
+class RateLimitInfo(UBICModel):
     """Rate limiting information"""
     requests_per_minute: int = Field(60, description="Requests allowed per minute")
     requests_per_hour: int = Field(1000, description="Requests allowed per hour")
     burst_limit: int = Field(10, description="Burst request limit")
     current_usage: int = Field(0, description="Current usage count")
-    reset_time: datetime = Field(default_factory=datetime.utcnow, description="Usage reset time")
+    reset_time: datetime = Field(default_factory=_utcnow, description="Usage reset time")
 
 
-class EmergencyStopRequest(BaseModel):
+class EmergencyStopRequest(UBICModel):
     """Emergency stop request"""
     reason: str = Field(..., description="Reason for emergency stop")
     severity: Severity = Field(Severity.CRITICAL, description="Emergency severity")
     cooldown_seconds: int = Field(300, description="Cooldown period before restart")
-    request_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Request identifier")
+    request_id: str = Field(default_factory=fast_uuid4, description="Request identifier")
 
 
-class AuditLogEntry(BaseModel):
+class AuditLogEntry(UBICModel):
     """Audit log entry"""
     request_id: str = Field(..., description="Request identifier")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Event timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Event timestamp")
     action: str = Field(..., description="Action performed")
     user: Optional[str] = Field(None, description="User identifier")
     details: Dict[str, Any] = Field(default_factory=dict, description="Action details")
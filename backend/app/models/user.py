@@ -2,9 +2,8 @@
 User model for authentication and authorization
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
-from sqlalchemy.sql import func
-from app.core.database import Base
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Identity, FetchedValue
+from app.core.database import Base, BigIntType, clock_timestamp
 
 
 class User(Base):
@@ -12,15 +11,15 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntType, Identity(always=True), primary_key=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
     full_name = Column(String(100))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=clock_timestamp())
+    updated_at = Column(DateTime(timezone=True), onupdate=clock_timestamp(), server_onupdate=FetchedValue())
     
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
@@ -3,39 +3,192 @@ AI Orchestrator - Core orchestration intelligence
 Coordinates multiple AI systems for strategic BRICKS development
 """
 
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, NamedTuple, Optional, Any, Tuple
 import asyncio
+import hashlib
+import importlib
+import time
+import orjson
 import structlog
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime
+from types import MethodType
 
+from app.core.cache import async_lru
 from app.core.config import settings
+from app.core.http import close_http_pool
 from app.core.exceptions import AIOrchestrationError, CrewAIError, Mem0Error, DevinAIError
-from app.services.crewai_service import CrewAIService
-from app.services.mem0_service import Mem0Service
-from app.services.devin_service import DevinService
-from app.services.copilot_service import CopilotService
-from app.services.github_copilot_service import GitHubCopilotService
-from app.services.multi_model_router import MultiModelRouter
-# Phase 3 - Strategic Intelligence Services
-from app.services.bricks_context_service import BRICKSContextService
-from app.services.revenue_analysis_service import RevenueAnalysisService
-from app.services.strategic_gap_service import StrategicGapService
-from app.services.brick_priority_service import BRICKPriorityService
-from app.services.constraint_prediction_service import ConstraintPredictionService
-from app.services.strategic_intelligence_service import StrategicIntelligenceService
-from app.services.human_ai_collaboration_service import HumanAICollaborationService
-# Phase 4 - Revenue Integration Loop Services
-from app.services.church_kit_connector import ChurchKitConnector
-from app.services.global_sky_connector import GlobalSkyConnector
-from app.services.treasury_optimizer import TreasuryOptimizer
-from app.services.autonomous_brick_proposer import AutonomousBRICKProposer
+
+# Service modules pull in their SDKs, so they're imported when their service
+# is built (see ServiceSpec)
+if TYPE_CHECKING:
+    from app.services.crewai_service import CrewAIService
+    from app.services.mem0_service import Mem0Service
+    from app.services.devin_service import DevinService
+    from app.services.copilot_service import CopilotService
+    from app.services.github_copilot_service import GitHubCopilotService
+    from app.services.multi_model_router import MultiModelRouter
+    # Phase 3 - Strategic Intelligence Services
+    from app.services.bricks_context_service import BRICKSContextService
+    from app.services.revenue_analysis_service import RevenueAnalysisService
+    from app.services.strategic_gap_service import StrategicGapService
+    from app.services.brick_priority_service import BRICKPriorityService
+    from app.services.constraint_prediction_service import ConstraintPredictionService
+    from app.services.strategic_intelligence_service import StrategicIntelligenceService
+    from app.services.human_ai_collaboration_service import HumanAICollaborationService
+    # Phase 4 - Revenue Integration Loop Services
+    from app.services.church_kit_connector import ChurchKitConnector
+    from app.services.global_sky_connector import GlobalSkyConnector
+    from app.services.treasury_optimizer import TreasuryOptimizer
+    from app.services.autonomous_brick_proposer import AutonomousBRICKProposer
 
 logger = structlog.get_logger(__name__)
 
 
+class ServiceSpec(NamedTuple):
+    """How the orchestrator builds one of its services"""
+    name: str  # name in the system status and logs
+    attr: str  # orchestrator attribute holding the service
+    cls: str  # "module:Class", imported when the service is built
+    label: str  # human-readable name for log messages
+    setting: Optional[str] = None  # settings key that must be set to start the service
+    initialize: bool = True  # await service.initialize() after construction
+    error: Optional[type] = None  # raise init failures as this error instead of logging
+    lazy: bool = False  # built on first use by get_service() rather than at startup
+    deps: Tuple[Tuple[str, str], ...] = ()  # (constructor kwarg, orchestrator attribute)
+
+
+SERVICE_SPECS = (
+    # Phase 2 - core AI services, health checked and cleaned up by the orchestrator
+    ServiceSpec("multi_model_router", "multi_model_router",
+                "app.services.multi_model_router:MultiModelRouter", "Multi-model router"),
+    ServiceSpec("crewai", "crewai_service", "app.services.crewai_service:CrewAIService",
+                "CrewAI service", setting="CREWAI_API_KEY", error=CrewAIError),
+    ServiceSpec("mem0", "mem0_service", "app.services.mem0_service:Mem0Service",
+                "Mem0 service", setting="MEM0_API_KEY"),
+    ServiceSpec("devin", "devin_service", "app.services.devin_service:DevinService",
+                "Devin AI service", setting="DEVIN_API_KEY", error=DevinAIError),
+    ServiceSpec("copilot", "copilot_service", "app.services.copilot_service:CopilotService",
+                "Copilot service", setting="COPILOT_STUDIO_API_KEY"),
+    ServiceSpec("github_copilot", "github_copilot_service",
+                "app.services.github_copilot_service:GitHubCopilotService",
+                "GitHub Copilot service", setting="GITHUB_COPILOT_TOKEN"),
+    
+    # Phase 3 - Strategic Intelligence Services
+    ServiceSpec("bricks_context", "bricks_context_service",
+                "app.services.bricks_context_service:BRICKSContextService",
+                "BRICKS context service", initialize=False, lazy=True),
+    ServiceSpec("revenue_analysis", "revenue_analysis_service",
+                "app.services.revenue_analysis_service:RevenueAnalysisService",
+                "Revenue analysis service", initialize=False, lazy=True),
+    ServiceSpec("strategic_gap", "strategic_gap_service",
+                "app.services.strategic_gap_service:StrategicGapService",
+                "Strategic gap service", initialize=False, lazy=True),
+    ServiceSpec("brick_priority", "brick_priority_service",
+                "app.services.brick_priority_service:BRICKPriorityService",
+                "BRICK priority service", initialize=False, lazy=True),
+    ServiceSpec("constraint_prediction", "constraint_prediction_service",
+                "app.services.constraint_prediction_service:ConstraintPredictionService",
+                "Constraint prediction service", initialize=False, lazy=True),
+    ServiceSpec("human_ai_collaboration", "human_ai_collaboration_service",
+                "app.services.human_ai_collaboration_service:HumanAICollaborationService",
+                "Human-AI collaboration service", initialize=False, lazy=True),
+    ServiceSpec("strategic_intelligence", "strategic_intelligence_service",
+                "app.services.strategic_intelligence_service:StrategicIntelligenceService",
+                "Strategic intelligence service", initialize=False, lazy=True,
+                deps=(
+                    ("bricks_context_service", "bricks_context_service"),
+                    ("revenue_analysis_service", "revenue_analysis_service"),
+                    ("strategic_gap_service", "strategic_gap_service"),
+                    ("brick_priority_service", "brick_priority_service"),
+                    ("constraint_prediction_service", "constraint_prediction_service"),
+                    ("multi_model_router", "multi_model_router"),
+                )),
+    
+    # Phase 4 - Revenue Integration Loop Services
+    ServiceSpec("church_kit_generator", "church_kit_connector",
+                "app.services.church_kit_connector:ChurchKitConnector",
+                "Church Kit Generator connector", lazy=True),
+    ServiceSpec("global_sky_ai", "global_sky_connector",
+                "app.services.global_sky_connector:GlobalSkyConnector",
+                "Global Sky AI connector", lazy=True),
+    ServiceSpec("treasury_optimization", "treasury_optimizer",
+                "app.services.treasury_optimizer:TreasuryOptimizer",
+                "Treasury Optimizer", lazy=True),
+    ServiceSpec("autonomous_brick_proposer", "autonomous_brick_proposer",
+                "app.services.autonomous_brick_proposer:AutonomousBRICKProposer",
+                "Autonomous BRICK Proposer", initialize=False, lazy=True,
+                deps=(
+                    ("church_kit_connector", "church_kit_connector"),
+                    ("global_sky_connector", "global_sky_connector"),
+                    ("treasury_optimizer", "treasury_optimizer"),
+                    ("strategic_intelligence", "strategic_intelligence_service"),
+                    ("human_ai_collaboration", "human_ai_collaboration_service"),
+                    ("multi_model_router", "multi_model_router"),
+                )),
+)
+
+SERVICES_BY_ATTR = {spec.attr: spec for spec in SERVICE_SPECS}
+
+
+# Sessions whose last stored Mem0 context/results digests are remembered
+MAX_TRACKED_SESSIONS = 1024
+
+# Mem0 writes waiting for the background writer; more are dropped with a warning
+MAX_PENDING_MEMORY_WRITES = 1024
+
+
+# (id(context), digest) of the context of the task being orchestrated, so the
+# context is serialized and hashed once per task
+_context_digest: ContextVar[Optional[Tuple[int, bytes]]] = ContextVar("context_digest", default=None)
+
+
+def _digest(payload: Any) -> bytes:
+    """Stable digest of a JSON-like payload"""
+    encoded = orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _context_key(context: Dict[str, Any]) -> bytes:
+    """Digest of a task context, reusing the one computed by orchestrate_task()"""
+    current = _context_digest.get()
+    if current and current[0] == id(context):
+        return current[1]
+    return _digest(context)
+
+
+def _goal_context_key(goal: str, context: Dict[str, Any]) -> bytes:
+    """Stable cache key for a goal and its context"""
+    return hashlib.blake2b(
+        goal.encode() + b"\0" + _context_key(context), digest_size=16
+    ).digest()
+
+
 class AIOrchestrator:
     """Main orchestrator for coordinating AI systems"""
     
+    # (status name, attribute) of the Phase 2 AI services; these are health
+    # checked and cleaned up by the orchestrator
+    CORE_SERVICES = tuple((spec.name, spec.attr) for spec in SERVICE_SPECS if not spec.lazy)
+    
+    # Phase 3 (Strategic Intelligence) and Phase 4 (Revenue Integration Loop)
+    # services, reported in the system status
+    STRATEGIC_SERVICES = tuple((spec.name, spec.attr) for spec in SERVICE_SPECS if spec.lazy)
+    
+    # task_type -> orchestration handler (method name or registered function);
+    # unknown types use the generic handler
+    _DISPATCH: Dict[str, Any] = {
+        "strategic_analysis": "_orchestrate_strategic_analysis",
+        "brick_development": "_orchestrate_brick_development",
+        "revenue_optimization": "_orchestrate_revenue_optimization",
+        "gap_analysis": "_orchestrate_gap_analysis",
+    }
+    
     def __init__(self):
         # Phase 2 Services
         self.crewai_service: Optional[CrewAIService] = None
@@ -62,229 +215,169 @@ class AIOrchestrator:
         
         self.initialized = False
         
+        # (name, service) pairs of the services that initialized, built once by
+        # initialize() and shared by status, health check and cleanup
+        self._core_services: Tuple[Tuple[str, Any], ...] = ()
+        self._active_services: Tuple[Tuple[str, Any], ...] = ()
+        
+        # (monotonic timestamp, status) of the last completed status probe, and
+        # the probe currently in flight, shared by concurrent callers
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_probe: Optional[asyncio.Future] = None
+        # Same for health checks, on the shorter HEALTH_TTL_SECONDS
+        self._health_cache: Optional[Tuple[float, str]] = None
+        self._health_probe: Optional[asyncio.Future] = None
+        
+        # Phase 3/4 services are built on first use by get_service(); the
+        # in-flight build is shared by concurrent first callers
+        self._lazy_inits = {spec.attr: spec for spec in SERVICE_SPECS if spec.lazy}
+        self._pending_inits: Dict[str, asyncio.Future] = {}
+        
+        # Mem0 strategy lookups are reused for MEMORY_LOOKUP_TTL_SECONDS per
+        # (goal, context); concurrent identical lookups share one vector search
+        self._find_similar_strategies = async_lru(
+            maxsize=512, ttl=settings.MEMORY_LOOKUP_TTL_SECONDS, key=_goal_context_key
+        )(lambda goal, context: self.mem0_service.find_similar_strategies(goal, context))
+        
+        # (session_id, "context" | "results") -> digest of the payload last
+        # stored in Mem0, so unchanged payloads aren't re-embedded and re-stored
+        self._stored_digests: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        
+        # Mem0 writes are queued and stored in order by one background writer,
+        # started on first use
+        self._memory_queue: Optional[asyncio.Queue] = None
+        self._memory_writer: Optional[asyncio.Task] = None
+        
+        # _DISPATCH bound to this instance once, so dispatch is a plain lookup
+        self._task_handlers = {
+            task_type: getattr(self, handler) if isinstance(handler, str) else MethodType(handler, self)
+            for task_type, handler in self._DISPATCH.items()
+        }
+        self._default_handler = self._orchestrate_generic_task
+    
+    @classmethod
+    def register_task(
+        cls,
+        task_type: str,
+        handler: Callable[["AIOrchestrator", str, Dict[str, Any], str], Awaitable[Dict[str, Any]]]
+    ):
+        """Route task_type to handler(orchestrator, goal, context, session_id)
+        
+        Applies to orchestrators created afterwards.
+        """
+        cls._DISPATCH = {**cls._DISPATCH, task_type: handler}
+    
     async def initialize(self):
         """Initialize all AI services"""
         try:
             logger.info("Initializing AI Orchestrator")
             
             # PHASE 1: Initialize core AI services first (these are dependencies)
-            core_tasks = []
-            
-            if settings.CREWAI_API_KEY:
-                core_tasks.append(self._init_crewai())
-            if settings.MEM0_API_KEY:
-                core_tasks.append(self._init_mem0())
-            if settings.DEVIN_API_KEY:
-                core_tasks.append(self._init_devin())
-            if settings.COPILOT_STUDIO_API_KEY:
-                core_tasks.append(self._init_copilot())
-            if settings.GITHUB_COPILOT_TOKEN:
-                core_tasks.append(self._init_github_copilot())
-            
-            # Initialize multi-model router FIRST (critical dependency)
-            await self._init_multi_model_router()
-            logger.info("✅ Multi-Model Router initialized (with Real AI support)")
-            
-            # Wait for core services
-            if core_tasks:
-                await asyncio.gather(*core_tasks, return_exceptions=True)
-            
-            # PHASE 2: Initialize services that depend on Multi-Model Router
-            dependent_tasks = []
-            
-            # Phase 3 - Strategic Intelligence Services (need multi-model router)
-            dependent_tasks.append(self._init_bricks_context())
-            dependent_tasks.append(self._init_revenue_analysis())
-            dependent_tasks.append(self._init_strategic_gap())
-            dependent_tasks.append(self._init_brick_priority())
-            dependent_tasks.append(self._init_constraint_prediction())
-            dependent_tasks.append(self._init_human_ai_collaboration())
-            dependent_tasks.append(self._init_strategic_intelligence())
+            # Core services are optional: a failure or timeout is logged and the
+            # orchestrator starts without that service
+            core_specs = [
+                spec for spec in SERVICE_SPECS
+                if spec.setting and not spec.lazy and getattr(settings, spec.setting)
+            ]
             
-            # Phase 4 - Revenue Integration Loop (need multi-model router)
-            dependent_tasks.append(self._init_church_kit_connector())
-            dependent_tasks.append(self._init_global_sky_connector())
-            dependent_tasks.append(self._init_treasury_optimizer())
-            dependent_tasks.append(self._init_autonomous_brick_proposer())
+            # Initialize multi-model router FIRST (phase 3/4 services are built on it)
+            try:
+                await self._with_init_timeout(self._init_service(SERVICES_BY_ATTR["multi_model_router"]))
+            except asyncio.TimeoutError:
+                logger.warning("Multi-model router initialization timed out, continuing without it")
             
-            # Wait for all dependent services to initialize
-            results = await asyncio.gather(*dependent_tasks, return_exceptions=True)
+            # Wait for core services; each task is named after its service and
+            # handles its own failure, so one service can't cancel the others
+            async with asyncio.TaskGroup() as group:
+                for spec in core_specs:
+                    group.create_task(self._init_optional_service(spec), name=f"init:{spec.name}")
             
-            # Check for initialization errors
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Service initialization failed", error=str(result))
-                    raise result
+            # Phase 3/4 services are built on first use, see get_service()
             
             self.initialized = True
-            logger.info("AI Orchestrator initialized successfully")
+            # One summary line rather than one per service
+            logger.info(
+                "AI Orchestrator initialized successfully",
+                services=[spec.name for spec in SERVICE_SPECS if getattr(self, spec.attr) is not None]
+            )
             
         except Exception as e:
             logger.error("Failed to initialize AI Orchestrator", error=str(e))
             raise AIOrchestrationError(f"Failed to initialize orchestrator: {str(e)}")
+        finally:
+            # Also after a partial failure, so cleanup sees what did start
+            self._refresh_active_services()
     
-    async def _init_crewai(self):
-        """Initialize CrewAI service"""
-        try:
-            self.crewai_service = CrewAIService()
-            await self.crewai_service.initialize()
-            logger.info("CrewAI service initialized")
-        except Exception as e:
-            raise CrewAIError(f"Failed to initialize CrewAI: {str(e)}")
-    
-    async def _init_mem0(self):
-        """Initialize Mem0 service"""
-        try:
-            self.mem0_service = Mem0Service()
-            await self.mem0_service.initialize()
-            if self.mem0_service.initialized:
-                logger.info("Mem0 service initialized successfully")
-            else:
-                logger.info("Mem0 service running in mock mode")
-        except Exception as e:
-            logger.warning(f"Mem0 service initialization failed, continuing with mock mode: {str(e)}")
-            # Don't raise error - allow service to continue in mock mode
-    
-    async def _init_devin(self):
-        """Initialize Devin AI service"""
-        try:
-            self.devin_service = DevinService()
-            await self.devin_service.initialize()
-            logger.info("Devin AI service initialized")
-        except Exception as e:
-            raise DevinAIError(f"Failed to initialize Devin AI: {str(e)}")
-    
-    async def _init_copilot(self):
-        """Initialize Copilot service"""
-        try:
-            self.copilot_service = CopilotService()
-            await self.copilot_service.initialize()
-            logger.info("Copilot service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Copilot: {str(e)}")
-    
-    async def _init_github_copilot(self):
-        """Initialize GitHub Copilot service"""
-        try:
-            self.github_copilot_service = GitHubCopilotService()
-            await self.github_copilot_service.initialize()
-            logger.info("GitHub Copilot service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize GitHub Copilot: {str(e)}")
-    
-    async def _init_multi_model_router(self):
-        """Initialize multi-model router"""
-        try:
-            self.multi_model_router = MultiModelRouter()
-            await self.multi_model_router.initialize()
-            logger.info("Multi-model router initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize multi-model router: {str(e)}")
-    
-    async def _init_bricks_context(self):
-        """Initialize BRICKS context service"""
-        try:
-            self.bricks_context_service = BRICKSContextService()
-            logger.info("BRICKS context service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize BRICKS context service: {str(e)}")
-    
-    async def _init_revenue_analysis(self):
-        """Initialize revenue analysis service"""
-        try:
-            self.revenue_analysis_service = RevenueAnalysisService()
-            logger.info("Revenue analysis service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize revenue analysis service: {str(e)}")
-    
-    async def _init_strategic_gap(self):
-        """Initialize strategic gap service"""
-        try:
-            self.strategic_gap_service = StrategicGapService()
-            logger.info("Strategic gap service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize strategic gap service: {str(e)}")
-    
-    async def _init_brick_priority(self):
-        """Initialize BRICK priority service"""
-        try:
-            self.brick_priority_service = BRICKPriorityService()
-            logger.info("BRICK priority service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize BRICK priority service: {str(e)}")
-    
-    async def _init_constraint_prediction(self):
-        """Initialize constraint prediction service"""
-        try:
-            self.constraint_prediction_service = ConstraintPredictionService()
-            logger.info("Constraint prediction service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize constraint prediction service: {str(e)}")
-    
-    async def _init_human_ai_collaboration(self):
-        """Initialize human-AI collaboration service"""
-        try:
-            self.human_ai_collaboration_service = HumanAICollaborationService()
-            logger.info("Human-AI collaboration service initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize human-AI collaboration service: {str(e)}")
+    def _refresh_active_services(self):
+        """Snapshot the services that are set"""
+        self._core_services = tuple(
+            (name, service) for name, attr in self.CORE_SERVICES
+            if (service := getattr(self, attr)) is not None
+        )
+        self._active_services = self._core_services + tuple(
+            (name, service) for name, attr in self.STRATEGIC_SERVICES
+            if (service := getattr(self, attr)) is not None
+        )
     
-    async def _init_strategic_intelligence(self):
-        """Initialize strategic intelligence service with Real AI"""
-        try:
-            self.strategic_intelligence_service = StrategicIntelligenceService(
-                bricks_context_service=self.bricks_context_service,
-                revenue_analysis_service=self.revenue_analysis_service,
-                strategic_gap_service=self.strategic_gap_service,
-                brick_priority_service=self.brick_priority_service,
-                constraint_prediction_service=self.constraint_prediction_service,
-                multi_model_router=self.multi_model_router
+    async def get_service(self, attr: str) -> Optional[Any]:
+        """Get a service by attribute name, building a Phase 3/4 service on first use
+        
+        Returns None if the service isn't configured or failed to build; a
+        failed build is retried by the next caller.
+        """
+        service = getattr(self, attr)
+        if service is not None or attr not in self._lazy_inits:
+            return service
+        
+        build = self._pending_inits.get(attr)
+        if build is None:
+            build = asyncio.ensure_future(
+                self._with_init_timeout(self._init_service(self._lazy_inits[attr]))
             )
-            logger.info("Strategic intelligence service initialized with Real AI support")
-        except Exception as e:
-            logger.error(f"Failed to initialize strategic intelligence service: {str(e)}")
-    
-    async def _init_church_kit_connector(self):
-        """Initialize Church Kit Generator connector"""
+            self._pending_inits[attr] = build
+            build.add_done_callback(lambda _: self._pending_inits.pop(attr, None))
+        
         try:
-            self.church_kit_connector = ChurchKitConnector()
-            await self.church_kit_connector.initialize()
-            logger.info("Church Kit Generator connector initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Church Kit connector: {str(e)}")
+            await asyncio.shield(build)
+        except asyncio.TimeoutError:
+            logger.error("Service initialization timed out", service=attr)
+        
+        self._refresh_active_services()
+        return getattr(self, attr)
     
-    async def _init_global_sky_connector(self):
-        """Initialize Global Sky AI connector"""
-        try:
-            self.global_sky_connector = GlobalSkyConnector()
-            await self.global_sky_connector.initialize()
-            logger.info("Global Sky AI connector initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Global Sky connector: {str(e)}")
+    async def _with_init_timeout(self, coro):
+        """Await a service initialization, bounded by INIT_TIMEOUT_SECONDS"""
+        return await asyncio.wait_for(coro, timeout=settings.INIT_TIMEOUT_SECONDS)
     
-    async def _init_treasury_optimizer(self):
-        """Initialize Treasury Optimizer"""
+    async def _init_optional_service(self, spec: ServiceSpec):
+        """Initialize a core service, logging a failure or timeout instead of raising"""
         try:
-            self.treasury_optimizer = TreasuryOptimizer()
-            await self.treasury_optimizer.initialize()
-            logger.info("Treasury Optimizer initialized")
+            await self._with_init_timeout(self._init_service(spec))
         except Exception as e:
-            logger.error(f"Failed to initialize Treasury Optimizer: {str(e)}")
+            logger.warning(
+                "Optional service initialization failed, continuing without it",
+                service=spec.name,
+                error=str(e) or type(e).__name__
+            )
     
-    async def _init_autonomous_brick_proposer(self):
-        """Initialize Autonomous BRICK Proposer with Real AI"""
+    async def _init_service(self, spec: ServiceSpec):
+        """Build the service described by spec and attach it to the orchestrator"""
         try:
-            self.autonomous_brick_proposer = AutonomousBRICKProposer(
-                church_kit_connector=self.church_kit_connector,
-                global_sky_connector=self.global_sky_connector,
-                treasury_optimizer=self.treasury_optimizer,
-                strategic_intelligence=self.strategic_intelligence_service,
-                human_ai_collaboration=self.human_ai_collaboration_service,
-                multi_model_router=self.multi_model_router
-            )
-            logger.info("Autonomous BRICK Proposer initialized with Real AI support")
+            kwargs = {}
+            if spec.deps:
+                services = await asyncio.gather(*(self.get_service(attr) for _, attr in spec.deps))
+                kwargs = {kwarg: service for (kwarg, _), service in zip(spec.deps, services)}
+            
+            module_name, class_name = spec.cls.split(":")
+            service = getattr(importlib.import_module(module_name), class_name)(**kwargs)
+            if spec.initialize:
+                await service.initialize()
+            setattr(self, spec.attr, service)
+            logger.debug("Service initialized", service=spec.name)
         except Exception as e:
-            logger.error(f"Failed to initialize Autonomous BRICK Proposer: {str(e)}")
+            if spec.error:
+                raise spec.error(f"Failed to initialize {spec.label}: {str(e)}")
+            logger.error(f"Failed to initialize {spec.label}: {str(e)}")
     
     async def orchestrate_task(
         self,
@@ -305,35 +398,21 @@ class AIOrchestrator:
             session_id=session_id
         )
         
+        # Serialize and hash the context once for the whole task
+        context_digest = _digest(context)
+        digest_token = _context_digest.set((id(context), context_digest))
         try:
-            # Store context in memory
-            if self.mem0_service:
-                try:
-                    await self.mem0_service.store_context(session_id, context)
-                except Exception as e:
-                    logger.warning(f"Failed to store context in Mem0, continuing without memory: {str(e)}")
+            # Store context in memory while the task runs
+            if self.mem0_service and self._memory_changed(session_id, "context", context_digest):
+                self._queue_memory_write(self.mem0_service.store_context, context, "context", session_id)
             
             # Route task to appropriate AI systems
-            results = {}
+            handler = self._task_handlers.get(task_type, self._default_handler)
+            results = await handler(goal, context, session_id)
             
-            if task_type == "strategic_analysis":
-                results = await self._orchestrate_strategic_analysis(goal, context, session_id)
-            elif task_type == "brick_development":
-                results = await self._orchestrate_brick_development(goal, context, session_id)
-            elif task_type == "revenue_optimization":
-                results = await self._orchestrate_revenue_optimization(goal, context, session_id)
-            elif task_type == "gap_analysis":
-                results = await self._orchestrate_gap_analysis(goal, context, session_id)
-            else:
-                # Generic orchestration
-                results = await self._orchestrate_generic_task(goal, context, session_id)
-            
-            # Store results in memory
-            if self.mem0_service:
-                try:
-                    await self.mem0_service.store_result(session_id, results)
-                except Exception as e:
-                    logger.warning(f"Failed to store results in Mem0, continuing without memory: {str(e)}")
+            # Store results in memory off the response path
+            if self.mem0_service and self._memory_changed(session_id, "results", _digest(results)):
+                self._queue_memory_write(self.mem0_service.store_result, results, "results", session_id)
             
             logger.info("Orchestrated task completed successfully", session_id=session_id)
             return results
@@ -341,6 +420,60 @@ class AIOrchestrator:
         except Exception as e:
             logger.error("Orchestrated task failed", error=str(e), session_id=session_id)
             raise AIOrchestrationError(f"Task orchestration failed: {str(e)}")
+        finally:
+            _context_digest.reset(digest_token)
+    
+    def _memory_changed(self, session_id: str, what: str, digest: bytes) -> bool:
+        """Record digest as the session's latest `what`; False if it's already stored"""
+        key = (session_id, what)
+        unchanged = self._stored_digests.get(key) == digest
+        
+        self._stored_digests[key] = digest
+        self._stored_digests.move_to_end(key)
+        while len(self._stored_digests) > 2 * MAX_TRACKED_SESSIONS:
+            self._stored_digests.popitem(last=False)
+        return not unchanged
+    
+    def _queue_memory_write(self, store, payload: Any, what: str, session_id: str):
+        """Queue store(session_id, payload) for the background Mem0 writer"""
+        if self._memory_writer is None or self._memory_writer.done():
+            self._memory_queue = asyncio.Queue(maxsize=MAX_PENDING_MEMORY_WRITES)
+            self._memory_writer = asyncio.create_task(self._drain_memory_writes(self._memory_queue))
+        
+        try:
+            self._memory_queue.put_nowait((store, payload, what, session_id))
+        except asyncio.QueueFull:
+            self._stored_digests.pop((session_id, what), None)
+            logger.warning("Mem0 write queue full, dropping write", what=what, session_id=session_id)
+    
+    async def _drain_memory_writes(self, queue: asyncio.Queue):
+        """Store queued Mem0 writes in order; failures are logged, not raised"""
+        while True:
+            store, payload, what, session_id = await queue.get()
+            try:
+                await store(session_id, payload)
+            except Exception as e:
+                # Not stored after all, so the next identical payload is written again
+                self._stored_digests.pop((session_id, what), None)
+                logger.warning(f"Failed to store {what} in Mem0, continuing without memory: {str(e)}")
+            finally:
+                queue.task_done()
+    
+    async def flush_memory_writes(self, timeout: Optional[float] = None):
+        """Wait for queued Mem0 writes to be stored, then stop the writer"""
+        if self._memory_writer is None:
+            return
+        try:
+            await asyncio.wait_for(self._memory_queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out flushing Mem0 writes", pending=self._memory_queue.qsize())
+        finally:
+            self._memory_writer.cancel()
+            try:
+                await self._memory_writer
+            except asyncio.CancelledError:
+                pass
+            self._memory_writer = None
     
     async def _orchestrate_strategic_analysis(
         self,
@@ -350,10 +483,7 @@ class AIOrchestrator:
     ) -> Dict[str, Any]:
         """TRUE multi-agent orchestration for strategic analysis"""
         
-        logger.info("Starting multi-agent strategic analysis", 
-                   goal=goal, 
-                   session_id=session_id,
-                   agents_available=["multi_model_router", "strategic_intelligence", "revenue_analysis"])
+        logger.debug("Starting multi-agent strategic analysis", goal=goal, session_id=session_id)
         
         agents_involved = []
         results = {
@@ -363,76 +493,63 @@ class AIOrchestrator:
             "agents_involved": agents_involved
         }
         
-        # Step 1: Multi-Model Router - Get diverse AI perspectives
+        # The agents don't depend on each other's output, so they run at once;
+        # each one's failure is recorded under its own result key
+        agent_calls = {}
+        
+        # Multi-Model Router - Get diverse AI perspectives
         if self.multi_model_router:
-            try:
-                logger.info("Agent 1: Multi-Model Router analyzing goal")
-                agents_involved.append("multi_model_router")
-                
-                # Get analysis from GPT-4
-                gpt4_analysis = await self.multi_model_router.route_request(
-                    prompt=f"Provide strategic analysis for: {goal}\nContext: {context}",
-                    task_type="strategic_analysis"
-                )
-                results["gpt4_analysis"] = gpt4_analysis
-                
-                logger.info("Multi-Model Router completed", model_used=gpt4_analysis.get("model_used"))
-            except Exception as e:
-                logger.error("Multi-Model Router failed", error=str(e))
-                results["gpt4_analysis"] = {"error": str(e)}
+            agents_involved.append("multi_model_router")
+            agent_calls["gpt4_analysis"] = self.multi_model_router.route_request(
+                prompt=f"Provide strategic analysis for: {goal}\nContext: {context}",
+                task_type="strategic_analysis"
+            )
         
-        # Step 2: Strategic Intelligence Service - Comprehensive strategic view
-        if self.strategic_intelligence_service:
-            try:
-                logger.info("Agent 2: Strategic Intelligence Service analyzing ecosystem")
-                agents_involved.append("strategic_intelligence")
-                
-                strategic_intel = await self.strategic_intelligence_service.generate_strategic_intelligence(
-                    goal=goal,
-                    context=context
-                )
-                results["strategic_intelligence"] = strategic_intel
-                
-                logger.info("Strategic Intelligence Service completed")
-            except Exception as e:
-                logger.error("Strategic Intelligence Service failed", error=str(e))
-                results["strategic_intelligence"] = {"error": str(e)}
+        strategic_intelligence, revenue_analysis = await asyncio.gather(
+            self.get_service("strategic_intelligence_service"),
+            self.get_service("revenue_analysis_service")
+        )
         
-        # Step 3: Revenue Analysis Service - Financial perspective
-        if self.revenue_analysis_service:
-            try:
-                logger.info("Agent 3: Revenue Analysis Service identifying opportunities")
-                agents_involved.append("revenue_analysis")
-                
-                revenue_opps = await self.revenue_analysis_service.analyze_revenue_opportunities(context)
-                results["revenue_opportunities"] = revenue_opps
-                
-                logger.info("Revenue Analysis Service completed", 
-                           opportunities_found=revenue_opps.get("total_opportunities", 0))
-            except Exception as e:
-                logger.error("Revenue Analysis Service failed", error=str(e))
-                results["revenue_opportunities"] = {"error": str(e)}
+        # Strategic Intelligence Service - Comprehensive strategic view
+        if strategic_intelligence:
+            agents_involved.append("strategic_intelligence")
+            agent_calls["strategic_intelligence"] = strategic_intelligence.generate_strategic_intelligence(
+                goal=goal,
+                context=context
+            )
+        
+        # Revenue Analysis Service - Financial perspective
+        if revenue_analysis:
+            agents_involved.append("revenue_analysis")
+            agent_calls["revenue_opportunities"] = revenue_analysis.analyze_revenue_opportunities(context)
         
-        # Step 4: Mem0 Service - Store orchestration results
+        # Mem0 Service - Store orchestration context
+        memory_write = []
         if self.mem0_service and self.mem0_service.initialized:
-            try:
-                logger.info("Agent 4: Mem0 Service storing orchestration context")
-                agents_involved.append("mem0")
-                
-                await self.mem0_service.store_context(session_id, {
-                    "goal": goal,
-                    "context": context,
-                    "results_summary": {
-                        "agents_used": agents_involved,
-                        "orchestration_type": "multi_agent"
-                    }
-                })
-                
-                logger.info("Mem0 Service stored context successfully")
-            except Exception as e:
-                logger.warning(f"Mem0 Service failed, continuing without memory storage: {str(e)}")
+            agents_involved.append("mem0")
+            memory_write.append(self.mem0_service.store_context(session_id, {
+                "goal": goal,
+                "context": context,
+                "results_summary": {
+                    "agents_used": agents_involved,
+                    "orchestration_type": "multi_agent"
+                }
+            }))
         else:
-            logger.info("Mem0 Service not available, skipping memory storage")
+            logger.debug("Mem0 Service not available, skipping memory storage")
+        
+        outcomes = await asyncio.gather(
+            *agent_calls.values(), *memory_write, return_exceptions=True
+        )
+        
+        for key, outcome in zip(agent_calls, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Strategic analysis agent failed", result=key, error=str(outcome))
+                outcome = {"error": str(outcome)}
+            results[key] = outcome
+        
+        if memory_write and isinstance(outcomes[-1], Exception):
+            logger.warning("Mem0 Service failed, continuing without memory storage", error=str(outcomes[-1]))
         
         # Synthesize results from all agents
         results["synthesis"] = {
@@ -442,9 +559,7 @@ class AIOrchestrator:
             "recommendations": self._synthesize_recommendations(results)
         }
         
-        logger.info("Multi-agent orchestration completed successfully", 
-                   agents_count=len(agents_involved),
-                   agents=agents_involved)
+        logger.debug("Multi-agent orchestration completed", agents=agents_involved)
         
         return results
     
@@ -493,24 +608,28 @@ class AIOrchestrator:
         
         results = {"planning": {}, "development": {}, "testing": {}}
         
-        # Use CrewAI for development planning
-        if self.crewai_service:
-            plan = await self.crewai_service.plan_brick_development(goal, context, session_id)
-            results["planning"]["crewai"] = plan
+        async def planning():
+            # Use CrewAI for development planning
+            if self.crewai_service:
+                plan = await self.crewai_service.plan_brick_development(goal, context, session_id)
+                results["planning"]["crewai"] = plan
         
-        # Use Devin AI for autonomous coding
-        if self.devin_service:
-            development = await self.devin_service.develop_brick(
-                goal, context, session_id
-            )
-            results["development"]["devin"] = development
+        async def development():
+            # Use Devin AI for autonomous coding
+            if self.devin_service:
+                developed = await self.devin_service.develop_brick(
+                    goal, context, session_id
+                )
+                results["development"]["devin"] = developed
         
-        # Use multi-model router for code review
-        if self.multi_model_router:
-            review = await self.multi_model_router.review_code(
-                results.get("development", {}).get("devin", {}).get("code", ""),
-                context
-            )
+        # Devin doesn't use the CrewAI plan, so both run at once; a failure in
+        # either still fails the task as before
+        await asyncio.gather(planning(), development())
+        code = results["development"].get("devin", {}).get("code", "")
+        
+        # Use multi-model router for code review (nothing to review without code)
+        if self.multi_model_router and code:
+            review = await self.multi_model_router.review_code(code, context)
             results["testing"]["code_review"] = review
         
         return results
@@ -525,26 +644,29 @@ class AIOrchestrator:
         
         results = {"opportunities": {}, "analysis": {}, "recommendations": {}}
         
-        # Use CrewAI for business analysis
-        if self.crewai_service:
-            business_analysis = await self.crewai_service.analyze_revenue_opportunities(
-                goal, context, session_id
-            )
-            results["analysis"]["business"] = business_analysis
-        
-        # Use Mem0 to find similar successful strategies
-        if self.mem0_service and self.mem0_service.initialized:
-            try:
-                similar_strategies = await self.mem0_service.find_similar_strategies(
-                    goal, context
+        async def business_analysis():
+            # Use CrewAI for business analysis
+            if self.crewai_service:
+                results["analysis"]["business"] = await self.crewai_service.analyze_revenue_opportunities(
+                    goal, context, session_id
                 )
-                results["analysis"]["similar_strategies"] = similar_strategies
-            except Exception as e:
-                logger.warning(f"Mem0 find_similar_strategies failed, continuing without: {str(e)}")
-                results["analysis"]["similar_strategies"] = {"error": "Mem0 not available"}
-        else:
-            logger.info("Mem0 service not available, skipping similar strategies")
-            results["analysis"]["similar_strategies"] = {"message": "Mem0 service not available"}
+        
+        async def similar_strategies():
+            # Use Mem0 to find similar successful strategies
+            if self.mem0_service and self.mem0_service.initialized:
+                try:
+                    results["analysis"]["similar_strategies"] = await self._find_similar_strategies(
+                        goal, context
+                    )
+                except Exception as e:
+                    logger.warning(f"Mem0 find_similar_strategies failed, continuing without: {str(e)}")
+                    results["analysis"]["similar_strategies"] = {"error": "Mem0 not available"}
+            else:
+                logger.debug("Mem0 service not available, skipping similar strategies")
+                results["analysis"]["similar_strategies"] = {"message": "Mem0 service not available"}
+        
+        # Independent lookups; a CrewAI failure still fails the task as before
+        await asyncio.gather(business_analysis(), similar_strategies())
         
         return results
     
@@ -594,88 +716,101 @@ class AIOrchestrator:
         return results
     
     async def get_system_status(self) -> Dict[str, Any]:
-        """Get status of all AI systems"""
+        """Get status of all AI systems
+        
+        Results are reused for STATUS_TTL_SECONDS, and concurrent callers share
+        one probe, so dashboard and health-check bursts don't fan out to every
+        service per request.
+        """
+        cached = self._status_cache
+        if cached and time.monotonic() - cached[0] < settings.STATUS_TTL_SECONDS:
+            return cached[1]
+        
+        if self._status_probe is None:
+            self._status_probe = asyncio.ensure_future(self._collect_system_status())
+            self._status_probe.add_done_callback(self._store_system_status)
+        
+        # Shielded so a cancelled caller doesn't cancel the probe for the others
+        return await asyncio.shield(self._status_probe)
+    
+    def _store_system_status(self, probe: asyncio.Future):
+        """Cache a finished status probe"""
+        self._status_probe = None
+        if not probe.cancelled() and probe.exception() is None:
+            self._status_cache = (time.monotonic(), probe.result())
+    
+    async def _collect_system_status(self) -> Dict[str, Any]:
+        """Probe every AI system for its status"""
         
         status = {
             "orchestrator": "healthy" if self.initialized else "not_initialized",
             "services": {}
         }
         
-        # Phase 2 Services
-        if self.crewai_service:
-            status["services"]["crewai"] = await self.crewai_service.get_status()
-        if self.mem0_service:
-            status["services"]["mem0"] = await self.mem0_service.get_status()
-        if self.devin_service:
-            status["services"]["devin"] = await self.devin_service.get_status()
-        if self.copilot_service:
-            status["services"]["copilot"] = await self.copilot_service.get_status()
-        if self.github_copilot_service:
-            status["services"]["github_copilot"] = await self.github_copilot_service.get_status()
-        if self.multi_model_router:
-            status["services"]["multi_model_router"] = await self.multi_model_router.get_status()
-        
-        # Phase 3 Services - Strategic Intelligence
-        if self.bricks_context_service:
-            status["services"]["bricks_context"] = await self.bricks_context_service.get_status()
-        if self.revenue_analysis_service:
-            status["services"]["revenue_analysis"] = await self.revenue_analysis_service.get_status()
-        if self.strategic_gap_service:
-            status["services"]["strategic_gap"] = await self.strategic_gap_service.get_status()
-        if self.brick_priority_service:
-            status["services"]["brick_priority"] = await self.brick_priority_service.get_status()
-        if self.constraint_prediction_service:
-            status["services"]["constraint_prediction"] = await self.constraint_prediction_service.get_status()
-        if self.human_ai_collaboration_service:
-            status["services"]["human_ai_collaboration"] = await self.human_ai_collaboration_service.get_status()
-        if self.strategic_intelligence_service:
-            status["services"]["strategic_intelligence"] = await self.strategic_intelligence_service.get_status()
-        
-        # Phase 4 Services - Revenue Integration Loop
-        if self.church_kit_connector:
-            status["services"]["church_kit_generator"] = await self.church_kit_connector.get_status()
-        if self.global_sky_connector:
-            status["services"]["global_sky_ai"] = await self.global_sky_connector.get_status()
-        if self.treasury_optimizer:
-            status["services"]["treasury_optimization"] = await self.treasury_optimizer.get_status()
-        if self.autonomous_brick_proposer:
-            status["services"]["autonomous_brick_proposer"] = await self.autonomous_brick_proposer.get_status()
+        # Probe every service at once so one slow service doesn't stall the rest
+        results = await asyncio.gather(
+            *(self._probe_status(service) for _, service in self._active_services),
+            return_exceptions=True
+        )
+        for (name, _), result in zip(self._active_services, results):
+            if isinstance(result, Exception):
+                result = {"status": "error", "error": str(result) or type(result).__name__}
+            status["services"][name] = result
         
         return status
     
+    async def _probe_status(self, service: Any) -> Dict[str, Any]:
+        """Get a service's status, bounded by STATUS_PROBE_TIMEOUT_SECONDS"""
+        return await asyncio.wait_for(
+            service.get_status(),
+            timeout=settings.STATUS_PROBE_TIMEOUT_SECONDS
+        )
+    
     async def health_check(self) -> str:
-        """Perform health check on all systems"""
+        """Perform health check on all systems
+        
+        Like get_system_status(), results are reused for HEALTH_TTL_SECONDS
+        and concurrent callers share one check.
+        """
+        if not self.initialized:
+            return "not_initialized"
+        
+        cached = self._health_cache
+        if cached and time.monotonic() - cached[0] < settings.HEALTH_TTL_SECONDS:
+            return cached[1]
+        
+        if self._health_probe is None:
+            self._health_probe = asyncio.ensure_future(self._check_health())
+            self._health_probe.add_done_callback(self._store_health)
+        
+        return await asyncio.shield(self._health_probe)
+    
+    def _store_health(self, probe: asyncio.Future):
+        """Cache a finished health check"""
+        self._health_probe = None
+        if not probe.cancelled() and probe.exception() is None:
+            self._health_cache = (time.monotonic(), probe.result())
+    
+    async def _check_health(self) -> str:
+        """Probe the core AI services and grade their health"""
         
         try:
-            if not self.initialized:
-                return "not_initialized"
-            
-            # Check each service
-            healthy_services = 0
-            total_services = 0
-            
-            services = [
-                self.crewai_service,
-                self.mem0_service,
-                self.devin_service,
-                self.copilot_service,
-                self.github_copilot_service,
-                self.multi_model_router
-            ]
-            
-            for service in services:
-                if service:
-                    total_services += 1
-                    try:
-                        status = await service.get_status()
-                        if status.get("status") == "healthy":
-                            healthy_services += 1
-                    except Exception:
-                        pass
+            # Snapshot of the set core services, rebuilt only when one starts
+            services = self._core_services
             
+            total_services = len(services)
             if total_services == 0:
                 return "no_services"
             
+            statuses = await asyncio.gather(
+                *(self._probe_status(service) for _, service in services),
+                return_exceptions=True
+            )
+            healthy_services = sum(
+                1 for status in statuses
+                if isinstance(status, dict) and status.get("status") == "healthy"
+            )
+            
             health_ratio = healthy_services / total_services
             if health_ratio >= 0.8:
                 return "healthy"
@@ -693,23 +828,24 @@ class AIOrchestrator:
         try:
             logger.info("Cleaning up AI Orchestrator")
             
-            cleanup_tasks = []
+            # Let pending Mem0 writes finish before services shut down
+            await self.flush_memory_writes(timeout=settings.SERVICE_CLEANUP_TIMEOUT_SECONDS)
             
-            if self.crewai_service:
-                cleanup_tasks.append(self.crewai_service.cleanup())
-            if self.mem0_service:
-                cleanup_tasks.append(self.mem0_service.cleanup())
-            if self.devin_service:
-                cleanup_tasks.append(self.devin_service.cleanup())
-            if self.copilot_service:
-                cleanup_tasks.append(self.copilot_service.cleanup())
-            if self.github_copilot_service:
-                cleanup_tasks.append(self.github_copilot_service.cleanup())
-            if self.multi_model_router:
-                cleanup_tasks.append(self.multi_model_router.cleanup())
+            # A service that hangs on shutdown must not block process exit
+            services = self._core_services
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(service.cleanup(), timeout=settings.SERVICE_CLEANUP_TIMEOUT_SECONDS)
+                    for _, service in services
+                ),
+                return_exceptions=True
+            )
+            for (name, _), result in zip(services, results):
+                if isinstance(result, Exception):
+                    logger.warning("Service cleanup failed", service=name, error=repr(result))
             
-            if cleanup_tasks:
-                await asyncio.gather(*cleanup_tasks, return_exceptions=True)
+            # Last, once no service is using it
+            await close_http_pool()
             
             self.initialized = False
             logger.info("AI Orchestrator cleanup completed")
@@ -8,6 +8,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload, undefer_group
 from app.core.database import AsyncSessionLocal
 from app.models.strategic import BRICKEcosystem
 
@@ -27,7 +28,10 @@ class BRICKSContextService:
         try:
             async with AsyncSessionLocal() as db:
                 # Fetch all BRICKs from database
-                result = await db.execute(select(BRICKEcosystem))
+                # Full brick details are read here, but not the child collections
+                result = await db.execute(
+                    select(BRICKEcosystem).options(undefer_group("details"), raiseload("*"))
+                )
                 bricks = result.scalars().all()
                 
                 ecosystem = {
@@ -6,10 +6,10 @@ Integrates with Church Kit Generator for revenue-connected BRICK development
 import structlog
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import httpx
 import os
 from sqlalchemy import select
 from app.core.database import AsyncSessionLocal
+from app.core.http import http_client
 from app.models.strategic import BRICKEcosystem, IncomeStream
 
 logger = structlog.get_logger(__name__)
@@ -40,7 +40,7 @@ class ChurchKitConnector:
     async def initialize(self):
         """Initialize connection to Church Kit Generator"""
         try:
-            self.client = httpx.AsyncClient(timeout=30.0)
+            self.client = http_client()
             
             # Try to connect if API key is provided
             if self.api_key:
@@ -310,5 +310,5 @@ class ChurchKitConnector:
     
     async def cleanup(self):
         """Cleanup resources"""
-        if self.client:
-            await self.client.aclose()
+        # The connection pool is shared and closed by the orchestrator
+        self.client = None
@@ -11,6 +11,7 @@ from datetime import datetime
 import json
 
 from app.core.config import settings
+from app.core.http import http_client
 from app.core.exceptions import BusinessSystemError
 
 logger = structlog.get_logger(__name__)
@@ -244,14 +245,13 @@ class RealCopilotClient:
         self.http_client = None
         
     async def initialize(self):
-        """Initialize HTTP client"""
-        self.http_client = httpx.AsyncClient(
+        """Initialize HTTP client on the shared connection pool"""
+        self.http_client = http_client(
             base_url=self.base_url,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
-            },
-            timeout=30.0
+            }
         )
         
     async def execute_workflow(self, workflow_name: str, parameters: Dict[str, Any], session_id: str) -> Dict[str, Any]:
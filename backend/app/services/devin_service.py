@@ -12,6 +12,7 @@ import json
 import os
 
 from app.core.config import settings
+from app.core.http import http_client
 from app.core.exceptions import DevinAIError
 
 logger = structlog.get_logger(__name__)
@@ -238,14 +239,13 @@ class RealDevinClient:
         self.http_client = None
         
     async def initialize(self):
-        """Initialize HTTP client"""
-        self.http_client = httpx.AsyncClient(
+        """Initialize HTTP client on the shared connection pool"""
+        self.http_client = http_client(
             base_url=self.base_url,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
-            },
-            timeout=30.0
+            }
         )
         
     async def develop_feature(self, description: str, context: Dict[str, Any], session_id: str) -> Dict[str, Any]:
@@ -11,6 +11,7 @@ from datetime import datetime
 import json
 
 from app.core.config import settings
+from app.core.http import http_client
 from app.core.exceptions import BusinessSystemError
 
 logger = structlog.get_logger(__name__)
@@ -194,15 +195,14 @@ class RealGitHubCopilotClient:
         self.http_client = None
         
     async def initialize(self):
-        """Initialize HTTP client"""
-        self.http_client = httpx.AsyncClient(
+        """Initialize HTTP client on the shared connection pool"""
+        self.http_client = http_client(
             base_url=self.base_url,
             headers={
                 "Authorization": f"token {self.api_key}",
                 "Accept": "application/vnd.github.v3+json",
                 "Content-Type": "application/json"
-            },
-            timeout=30.0
+            }
         )
         
     async def generate_code(self, prompt: str, context: Dict[str, Any], session_id: str) -> Dict[str, Any]:
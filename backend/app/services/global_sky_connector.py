@@ -6,10 +6,10 @@ Connects with Global Sky AI for AI capability integration and revenue tracking
 import structlog
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import httpx
 import os
 from sqlalchemy import select
 from app.core.database import AsyncSessionLocal
+from app.core.http import http_client
 from app.models.strategic import BRICKEcosystem, IncomeStream
 
 logger = structlog.get_logger(__name__)
@@ -41,7 +41,7 @@ class GlobalSkyConnector:
     async def initialize(self):
         """Initialize connection to Global Sky AI"""
         try:
-            self.client = httpx.AsyncClient(timeout=30.0)
+            self.client = http_client()
             
             # Try to connect if API key is provided
             if self.api_key:
@@ -300,5 +300,5 @@ class GlobalSkyConnector:
     
     async def cleanup(self):
         """Cleanup resources"""
-        if self.client:
-            await self.client.aclose()
+        # The connection pool is shared and closed by the orchestrator
+        self.client = None
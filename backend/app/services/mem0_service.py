@@ -39,7 +39,7 @@ class Mem0Service:
             try:
                 import redis.asyncio as redis
                 redis_url = getattr(settings, 'REDIS_URL', "redis://redis:6379")
-                self.redis_client = redis.from_url(redis_url, decode_responses=True)
+                self.redis_client = redis.from_url(redis_url)
                 await self.redis_client.ping()
                 logger.info("Redis client initialized successfully for I MEMORY")
             except Exception as e:
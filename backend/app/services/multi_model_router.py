@@ -45,15 +45,17 @@ class MultiModelRouter:
         if settings.OPENAI_API_KEY:
             try:
                 import openai
+                # One client (and connection pool) for every OpenAI model
+                client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
                 self.models["gpt-4"] = {
-                    "client": openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY),
+                    "client": client,
                     "model": "gpt-4",
                     "capabilities": ["reasoning", "analysis", "creative_writing"],
                     "cost": "high",
                     "speed": "medium"
                 }
                 self.models["gpt-3.5-turbo"] = {
-                    "client": openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY),
+                    "client": client,
                     "model": "gpt-3.5-turbo",
                     "capabilities": ["general", "fast_response"],
                     "cost": "medium",
@@ -550,17 +552,7 @@ class MultiModelRouter:
         budget_limit = self.cost_optimization["budget_limit"]
         
         # Calculate performance metrics
-        performance_summary = {}
-        for model_name in self.models.keys():
-            if model_name in self.performance_metrics["response_times"]:
-                response_times = self.performance_metrics["response_times"][model_name]
-                success_data = self.performance_metrics["success_rates"].get(model_name, {"success": 0, "total": 0})
-                
-                performance_summary[model_name] = {
-                    "avg_response_time": sum(response_times) / len(response_times) if response_times else 0,
-                    "success_rate": (success_data["success"] / success_data["total"]) * 100 if success_data["total"] > 0 else 0,
-                    "total_requests": success_data["total"]
-                }
+        performance_summary = self.get_statuses_bulk()
         
         return {
             "status": "healthy" if self.initialized else "not_initialized",
@@ -583,6 +575,29 @@ class MultiModelRouter:
             "last_updated": datetime.now().isoformat()
         }
     
+    def get_statuses_bulk(self, model_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get performance status for many models in one call
+        
+        Answered from locally tracked metrics, so one probe covers every
+        upstream model without a request per model. Defaults to all models;
+        models with no tracked requests are omitted.
+        """
+        response_times = self.performance_metrics["response_times"]
+        success_rates = self.performance_metrics["success_rates"]
+        
+        statuses = {}
+        for model_name in (self.models.keys() if model_names is None else model_names):
+            times = response_times.get(model_name)
+            if times is None:
+                continue
+            success_data = success_rates.get(model_name, {"success": 0, "total": 0})
+            statuses[model_name] = {
+                "avg_response_time": sum(times) / len(times) if times else 0,
+                "success_rate": (success_data["success"] / success_data["total"]) * 100 if success_data["total"] > 0 else 0,
+                "total_requests": success_data["total"]
+            }
+        return statuses
+    
     def _get_budget_status(self, daily_cost: float, budget_limit: float) -> str:
         """Get budget status string"""
         utilization = daily_cost / budget_limit
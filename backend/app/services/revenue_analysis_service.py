@@ -3,16 +3,21 @@ Revenue Opportunity Analysis Engine
 Maps income streams and identifies revenue opportunities across BRICKS ecosystem
 """
 
+import asyncio
 import structlog
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import json
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.core.database import AsyncSessionLocal
 from app.models.strategic import IncomeStream, BRICKEcosystem
 
 logger = structlog.get_logger(__name__)
 
+# Oldest roll-up snapshot served before a concurrent refresh is triggered
+ROLLUP_MAX_STALENESS_SECONDS = 300
+
 
 class RevenueAnalysisService:
     """Service for analyzing revenue opportunities and income stream mapping"""
@@ -20,6 +25,8 @@ class RevenueAnalysisService:
     def __init__(self):
         self.revenue_streams = self._initialize_revenue_streams()
         self.analysis_cache = {}
+        # In-flight roll-up refresh; one per process at a time
+        self._rollup_refresh: Optional[asyncio.Task] = None
         logger.info("Revenue Analysis Service initialized")
     
     def _initialize_revenue_streams(self) -> Dict[str, Any]:
@@ -130,6 +137,97 @@ class RevenueAnalysisService:
                 "message": str(e)
             }
     
+    async def get_revenue_rollup(
+        self,
+        max_staleness_seconds: float = ROLLUP_MAX_STALENESS_SECONDS
+    ) -> Dict[str, Any]:
+        """Revenue totals by status and opportunity type from the materialized roll-up
+        
+        Once the last refresh is older than max_staleness_seconds (or was never
+        recorded) a concurrent refresh is started in the background; the
+        current, possibly stale, rows are served meanwhile.
+        """
+        try:
+            from app.models.strategic import RevenueRollup, MaterializedViewRefresh, REVENUE_ROLLUP_VIEW
+            
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(select(RevenueRollup))).scalars().all()
+                refreshed_at = await db.scalar(
+                    select(MaterializedViewRefresh.refreshed_at)
+                    .where(MaterializedViewRefresh.view_name == REVENUE_ROLLUP_VIEW)
+                )
+            
+            staleness = self._rollup_staleness(refreshed_at)
+            if staleness is None or staleness > max_staleness_seconds:
+                self._schedule_rollup_refresh()
+            
+            by_status = [
+                {
+                    "status": row.status,
+                    "opportunity_type": row.opportunity_type,
+                    "opportunity_count": row.opportunity_count,
+                    "total_potential_revenue": row.total_potential_revenue or 0,
+                    "avg_probability": row.avg_probability
+                }
+                for row in rows
+            ]
+            
+            return {
+                "status": "success",
+                "by_status": by_status,
+                "total_potential_revenue": sum(r["total_potential_revenue"] for r in by_status),
+                "staleness_seconds": staleness,
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        except Exception as e:
+            logger.error("Failed to load revenue roll-up", error=str(e))
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
+    def _schedule_rollup_refresh(self) -> None:
+        """Start a background roll-up refresh unless one is already running in this process"""
+        if self._rollup_refresh is None or self._rollup_refresh.done():
+            self._rollup_refresh = asyncio.create_task(self._refresh_rollup())
+    
+    async def _refresh_rollup(self) -> bool:
+        """Refresh the roll-up and record when; returns False if another worker holds the refresh
+        
+        The transaction-scoped advisory lock keeps concurrent workers from
+        queueing up identical refreshes; it is released on commit.
+        """
+        from app.models.strategic import MaterializedViewRefresh, REVENUE_ROLLUP_VIEW
+        
+        try:
+            async with AsyncSessionLocal() as db:
+                locked = await db.scalar(
+                    text("SELECT pg_try_advisory_xact_lock(hashtext(:view))"), {"view": REVENUE_ROLLUP_VIEW}
+                )
+                if not locked:
+                    return False
+                
+                await db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {REVENUE_ROLLUP_VIEW}"))
+                refreshed_at = datetime.now(timezone.utc)
+                await db.execute(
+                    pg_insert(MaterializedViewRefresh)
+                    .values(view_name=REVENUE_ROLLUP_VIEW, refreshed_at=refreshed_at)
+                    .on_conflict_do_update(index_elements=["view_name"], set_={"refreshed_at": refreshed_at})
+                )
+                await db.commit()
+                return True
+        except Exception as e:
+            logger.error("Failed to refresh revenue roll-up", error=str(e))
+            return False
+    
+    @staticmethod
+    def _rollup_staleness(refreshed_at: Optional[datetime]) -> Optional[float]:
+        """Seconds since the roll-up was last refreshed, or None when no refresh is recorded"""
+        if refreshed_at is None:
+            return None
+        return (datetime.now(timezone.utc) - refreshed_at).total_seconds()
+    
     def _analyze_cross_selling(self) -> Dict[str, Any]:
         """Analyze cross-selling opportunities"""
         # Church Kit Generator customers could use Global Sky AI
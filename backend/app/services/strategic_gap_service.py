@@ -86,10 +86,13 @@ class StrategicGapService:
             from app.core.database import AsyncSessionLocal
             from app.models.strategic import StrategicGap
             from sqlalchemy import select
+            from sqlalchemy.orm import undefer
             
             async with AsyncSessionLocal() as db:
                 result = await db.execute(
-                    select(StrategicGap).where(StrategicGap.status != 'completed')
+                    select(StrategicGap)
+                    .options(undefer(StrategicGap.mitigation_strategy))
+                    .where(StrategicGap.status != 'completed')
                 )
                 db_gaps = result.scalars().all()
             
@@ -6,10 +6,10 @@ Analyzes financial integration and optimization opportunities
 import structlog
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import httpx
 import os
 from sqlalchemy import select, func as sql_func
 from app.core.database import AsyncSessionLocal
+from app.core.http import http_client
 from app.models.strategic import BRICKEcosystem, IncomeStream
 
 logger = structlog.get_logger(__name__)
@@ -40,7 +40,7 @@ class TreasuryOptimizer:
     async def initialize(self):
         """Initialize treasury optimization service"""
         try:
-            self.client = httpx.AsyncClient(timeout=30.0)
+            self.client = http_client()
             
             if self.api_key:
                 self.connection_status = "connected"
@@ -58,24 +58,18 @@ class TreasuryOptimizer:
         try:
             # Fetch total revenue from VPS database
             async with AsyncSessionLocal() as db:
-                # Sum all revenue from income streams
-                total_revenue_result = await db.execute(
-                    select(sql_func.sum(IncomeStream.current_monthly))
-                )
-                total_monthly_revenue = total_revenue_result.scalar() or 4300
-                
-                # Count revenue streams
-                stream_count_result = await db.execute(
-                    select(sql_func.count(IncomeStream.stream_id))
-                )
-                stream_count = stream_count_result.scalar() or 2
-                
-                # Calculate recurring revenue
-                recurring_result = await db.execute(
-                    select(sql_func.sum(IncomeStream.current_monthly))
-                    .where(IncomeStream.recurring == True)
-                )
-                recurring_revenue = recurring_result.scalar() or 2500
+                # Total revenue, stream count and recurring revenue in one scan,
+                # aggregated by the database rather than row by row in Python
+                totals = (await db.execute(
+                    select(
+                        sql_func.sum(IncomeStream.current_monthly),
+                        sql_func.count(IncomeStream.stream_id),
+                        sql_func.sum(IncomeStream.current_monthly).filter(IncomeStream.recurring == True)
+                    )
+                )).one()
+                total_monthly_revenue = totals[0] or 4300
+                stream_count = totals[1] or 2
+                recurring_revenue = totals[2] or 2500
                 
                 logger.info("Financial health data loaded from VPS database", 
                            total_revenue=total_monthly_revenue)
@@ -324,5 +318,5 @@ class TreasuryOptimizer:
     
     async def cleanup(self):
         """Cleanup resources"""
-        if self.client:
-            await self.client.aclose()
+        # The connection pool is shared and closed by the orchestrator
+        self.client = None
@@ -13,119 +13,127 @@ SET timezone = 'UTC';
 
 -- Create users table
 CREATE TABLE IF NOT EXISTS users (
-    id SERIAL PRIMARY KEY,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     username VARCHAR(50) UNIQUE NOT NULL,
     email VARCHAR(100) UNIQUE NOT NULL,
     hashed_password VARCHAR(255) NOT NULL,
     is_active BOOLEAN DEFAULT TRUE,
     is_admin BOOLEAN DEFAULT FALSE,
     full_name VARCHAR(100),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create orchestration sessions table
 CREATE TABLE IF NOT EXISTS orchestration_sessions (
-    id SERIAL PRIMARY KEY,
-    session_id VARCHAR(100) UNIQUE NOT NULL,
-    user_id INTEGER REFERENCES users(id),
-    status VARCHAR(50) DEFAULT 'active',
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    session_id TEXT UNIQUE NOT NULL,
+    user_id BIGINT REFERENCES users(id),
+    status TEXT DEFAULT 'active' CHECK (status IN ('active', 'completed', 'failed', 'cancelled')),
     goal TEXT,
     context JSONB,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
     completed_at TIMESTAMP WITH TIME ZONE
 );
 
 -- Create orchestration tasks table
 CREATE TABLE IF NOT EXISTS orchestration_tasks (
-    id SERIAL PRIMARY KEY,
-    task_id VARCHAR(100) UNIQUE NOT NULL,
-    session_id INTEGER REFERENCES orchestration_sessions(id),
-    ai_system VARCHAR(50) NOT NULL,
-    task_type VARCHAR(50) NOT NULL,
-    status VARCHAR(50) DEFAULT 'pending',
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    task_id TEXT UNIQUE NOT NULL,
+    session_id BIGINT REFERENCES orchestration_sessions(id),
+    ai_system TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
     input_data JSONB,
     output_data JSONB,
     error_message TEXT,
     execution_time_ms INTEGER,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
     started_at TIMESTAMP WITH TIME ZONE,
     completed_at TIMESTAMP WITH TIME ZONE
 );
 
 -- Create task logs table
 CREATE TABLE IF NOT EXISTS task_logs (
-    id SERIAL PRIMARY KEY,
-    task_id INTEGER REFERENCES orchestration_tasks(id),
-    log_level VARCHAR(20) NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY,
+    task_id BIGINT REFERENCES orchestration_tasks(id),
+    log_level TEXT NOT NULL CHECK (log_level IN ('debug', 'info', 'warning', 'error')),
     message TEXT NOT NULL,
     metadata JSONB,
-    timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-);
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT clock_timestamp(),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+-- Catch-all partition; the application creates monthly partitions on startup
+CREATE TABLE IF NOT EXISTS task_logs_default PARTITION OF task_logs DEFAULT;
 
 -- Create AI interactions table
 CREATE TABLE IF NOT EXISTS ai_interactions (
-    id SERIAL PRIMARY KEY,
-    session_id INTEGER REFERENCES orchestration_sessions(id),
-    from_ai_system VARCHAR(50) NOT NULL,
-    to_ai_system VARCHAR(50) NOT NULL,
-    interaction_type VARCHAR(50) NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY,
+    session_id BIGINT REFERENCES orchestration_sessions(id),
+    from_ai_system TEXT NOT NULL,
+    to_ai_system TEXT NOT NULL,
+    interaction_type TEXT NOT NULL,
     message TEXT NOT NULL,
     metadata JSONB,
-    timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-);
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT clock_timestamp(),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+-- Catch-all partition; the application creates monthly partitions on startup
+CREATE TABLE IF NOT EXISTS ai_interactions_default PARTITION OF ai_interactions DEFAULT;
 
 -- Create memories table
 CREATE TABLE IF NOT EXISTS memories (
-    id SERIAL PRIMARY KEY,
-    memory_id VARCHAR(100) UNIQUE NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    memory_id TEXT UNIQUE NOT NULL,
     content TEXT NOT NULL,
-    memory_type VARCHAR(50) NOT NULL,
+    memory_type TEXT NOT NULL,
     importance_score FLOAT DEFAULT 0.5,
     tags JSONB,
-    source_system VARCHAR(50),
+    source_system TEXT,
     metadata JSONB,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
     last_accessed TIMESTAMP WITH TIME ZONE,
     access_count INTEGER DEFAULT 0
 );
 
 -- Create contexts table
 CREATE TABLE IF NOT EXISTS contexts (
-    id SERIAL PRIMARY KEY,
-    context_id VARCHAR(100) UNIQUE NOT NULL,
-    session_id VARCHAR(100),
-    context_type VARCHAR(50) NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    context_id TEXT NOT NULL,
+    session_id TEXT,
+    context_type TEXT NOT NULL,
     content JSONB NOT NULL,
     is_active BOOLEAN DEFAULT TRUE,
     expires_at TIMESTAMP WITH TIME ZONE,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create knowledge graph table
 CREATE TABLE IF NOT EXISTS knowledge_graph (
-    id SERIAL PRIMARY KEY,
-    source_entity VARCHAR(200) NOT NULL,
-    relationship VARCHAR(100) NOT NULL,
-    target_entity VARCHAR(200) NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    source_entity TEXT NOT NULL,
+    relationship TEXT NOT NULL,
+    target_entity TEXT NOT NULL,
     strength FLOAT DEFAULT 1.0,
     metadata JSONB,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create bricks table
 CREATE TABLE IF NOT EXISTS bricks (
-    id SERIAL PRIMARY KEY,
-    brick_id VARCHAR(100) UNIQUE NOT NULL,
-    name VARCHAR(200) NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    brick_id TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
     description TEXT,
-    category VARCHAR(100) NOT NULL,
-    status VARCHAR(50) DEFAULT 'development',
+    category TEXT NOT NULL,
+    status TEXT DEFAULT 'development' CHECK (status IN ('development', 'testing', 'production', 'deprecated')),
     priority INTEGER DEFAULT 5,
     complexity INTEGER DEFAULT 5,
     estimated_development_hours INTEGER,
@@ -134,40 +142,40 @@ CREATE TABLE IF NOT EXISTS bricks (
     dependencies JSONB,
     capabilities JSONB,
     integration_points JSONB,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
     deployed_at TIMESTAMP WITH TIME ZONE
 );
 
 -- Create brick developments table
 CREATE TABLE IF NOT EXISTS brick_developments (
-    id SERIAL PRIMARY KEY,
-    brick_id INTEGER REFERENCES bricks(id),
-    development_type VARCHAR(50) NOT NULL,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    brick_id BIGINT REFERENCES bricks(id),
+    development_type TEXT NOT NULL,
     description TEXT,
     progress_percentage INTEGER DEFAULT 0,
-    ai_system_used VARCHAR(50),
+    ai_system_used TEXT,
     output JSONB,
     time_spent_minutes INTEGER,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create brick analyses table
 CREATE TABLE IF NOT EXISTS brick_analyses (
-    id SERIAL PRIMARY KEY,
-    brick_id INTEGER REFERENCES bricks(id),
-    analysis_type VARCHAR(50) NOT NULL,
-    ai_system_used VARCHAR(50),
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    brick_id BIGINT REFERENCES bricks(id),
+    analysis_type TEXT NOT NULL,
+    ai_system_used TEXT,
     findings TEXT,
     recommendations TEXT,
     confidence_score FLOAT,
     impact_assessment JSONB,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create revenue opportunities table
 CREATE TABLE IF NOT EXISTS revenue_opportunities (
-    id SERIAL PRIMARY KEY,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     opportunity_id VARCHAR(100) UNIQUE NOT NULL,
     title VARCHAR(200) NOT NULL,
     description TEXT,
@@ -179,13 +187,13 @@ CREATE TABLE IF NOT EXISTS revenue_opportunities (
     related_bricks JSONB,
     ai_system_identified VARCHAR(50),
     status VARCHAR(50) DEFAULT 'identified',
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create strategic gaps table
 CREATE TABLE IF NOT EXISTS strategic_gaps (
-    id SERIAL PRIMARY KEY,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     gap_id VARCHAR(100) UNIQUE NOT NULL,
     title VARCHAR(200) NOT NULL,
     description TEXT,
@@ -195,8 +203,8 @@ CREATE TABLE IF NOT EXISTS strategic_gaps (
     suggested_solutions JSONB,
     ai_system_identified VARCHAR(50),
     status VARCHAR(50) DEFAULT 'identified',
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp()
 );
 
 -- Create indexes for better performance
@@ -212,12 +220,16 @@ CREATE INDEX IF NOT EXISTS idx_orchestration_tasks_task_type ON orchestration_ta
 
 CREATE INDEX IF NOT EXISTS idx_task_logs_task_id ON task_logs(task_id);
 CREATE INDEX IF NOT EXISTS idx_task_logs_log_level ON task_logs(log_level);
-CREATE INDEX IF NOT EXISTS idx_task_logs_timestamp ON task_logs(timestamp);
+CREATE INDEX IF NOT EXISTS ix_task_logs_ts_brin ON task_logs USING BRIN(timestamp) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_task_logs_task_ts ON task_logs(task_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS ix_task_logs_metadata_gin ON task_logs USING GIN(metadata jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS ix_task_logs_alerts ON task_logs(task_id, timestamp DESC) WHERE log_level IN ('warning', 'error');
 
 CREATE INDEX IF NOT EXISTS idx_ai_interactions_session_id ON ai_interactions(session_id);
 CREATE INDEX IF NOT EXISTS idx_ai_interactions_from_system ON ai_interactions(from_ai_system);
 CREATE INDEX IF NOT EXISTS idx_ai_interactions_to_system ON ai_interactions(to_ai_system);
-CREATE INDEX IF NOT EXISTS idx_ai_interactions_timestamp ON ai_interactions(timestamp);
+CREATE INDEX IF NOT EXISTS ix_ai_interactions_ts_brin ON ai_interactions USING BRIN(timestamp) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_ai_interactions_session_ts ON ai_interactions(session_id, timestamp DESC);
 
 CREATE INDEX IF NOT EXISTS idx_memories_memory_id ON memories(memory_id);
 CREATE INDEX IF NOT EXISTS idx_memories_memory_type ON memories(memory_type);
@@ -226,18 +238,22 @@ CREATE INDEX IF NOT EXISTS idx_memories_source_system ON memories(source_system)
 CREATE INDEX IF NOT EXISTS idx_memories_tags ON memories USING GIN(tags);
 
 CREATE INDEX IF NOT EXISTS idx_contexts_context_id ON contexts(context_id);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_contexts_active_context_id ON contexts(context_id) WHERE is_active;
 CREATE INDEX IF NOT EXISTS idx_contexts_session_id ON contexts(session_id);
 CREATE INDEX IF NOT EXISTS idx_contexts_context_type ON contexts(context_type);
 CREATE INDEX IF NOT EXISTS idx_contexts_is_active ON contexts(is_active);
 
-CREATE INDEX IF NOT EXISTS idx_knowledge_graph_source ON knowledge_graph(source_entity);
-CREATE INDEX IF NOT EXISTS idx_knowledge_graph_target ON knowledge_graph(target_entity);
-CREATE INDEX IF NOT EXISTS idx_knowledge_graph_relationship ON knowledge_graph(relationship);
+CREATE INDEX IF NOT EXISTS ix_kg_fwd ON knowledge_graph(source_entity, relationship, target_entity);
+CREATE INDEX IF NOT EXISTS ix_kg_rev ON knowledge_graph(target_entity, relationship, source_entity);
+CREATE INDEX IF NOT EXISTS ix_kg_src_trgm ON knowledge_graph USING GIN(source_entity gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_kg_strong ON knowledge_graph(source_entity, strength DESC) WHERE strength > 0.5;
 
 CREATE INDEX IF NOT EXISTS idx_bricks_brick_id ON bricks(brick_id);
 CREATE INDEX IF NOT EXISTS idx_bricks_category ON bricks(category);
-CREATE INDEX IF NOT EXISTS idx_bricks_status ON bricks(status);
 CREATE INDEX IF NOT EXISTS idx_bricks_priority ON bricks(priority);
+CREATE INDEX IF NOT EXISTS ix_bricks_status_priority_covering ON bricks(status, priority) INCLUDE (name, category, revenue_potential);
+CREATE INDEX IF NOT EXISTS ix_bricks_capabilities_gin ON bricks USING GIN(capabilities);
+CREATE INDEX IF NOT EXISTS ix_bricks_dependencies_gin ON bricks USING GIN(dependencies);
 
 CREATE INDEX IF NOT EXISTS idx_brick_developments_brick_id ON brick_developments(brick_id);
 CREATE INDEX IF NOT EXISTS idx_brick_developments_type ON brick_developments(development_type);
@@ -253,11 +269,19 @@ CREATE INDEX IF NOT EXISTS idx_strategic_gaps_gap_id ON strategic_gaps(gap_id);
 CREATE INDEX IF NOT EXISTS idx_strategic_gaps_gap_type ON strategic_gaps(gap_type);
 CREATE INDEX IF NOT EXISTS idx_strategic_gaps_severity ON strategic_gaps(severity);
 
+-- LZ4 TOAST compression for large free-text columns (decompresses faster than pglz).
+-- Audit with: SELECT pg_column_size(findings), octet_length(findings) FROM brick_analyses LIMIT 100;
+ALTER TABLE brick_analyses ALTER COLUMN findings SET COMPRESSION lz4;
+ALTER TABLE brick_analyses ALTER COLUMN recommendations SET COMPRESSION lz4;
+ALTER TABLE orchestration_tasks ALTER COLUMN error_message SET COMPRESSION lz4;
+ALTER TABLE task_logs ALTER COLUMN message SET COMPRESSION lz4;
+ALTER TABLE ai_interactions ALTER COLUMN message SET COMPRESSION lz4;
+
 -- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = NOW();
+    NEW.updated_at = clock_timestamp();
     RETURN NEW;
 END;
 $$ language 'plpgsql';
@@ -6,13 +6,13 @@ FastAPI Main Application Entry Point
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
 import structlog
 import uvicorn
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, close_db
 from app.core.logging import setup_logging
 from app.api.v1.api import api_router
 from app.core.exceptions import BrickOrchestrationException
@@ -63,6 +63,10 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down I PROACTIVE BRICK Orchestration Intelligence")
     if hasattr(app.state, 'orchestrator'):
         await app.state.orchestrator.cleanup()
+    
+    from app.core.fast_writer import task_log_writer
+    await task_log_writer.flush()
+    await close_db()
 
 
 # Create FastAPI application
@@ -72,6 +76,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -101,7 +106,7 @@ async def brick_orchestration_exception_handler(request, exc: BrickOrchestration
         status_code=exc.status_code,
         path=request.url.path
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail, "type": "brick_orchestration_error"}
     )
@@ -116,7 +121,7 @@ async def http_exception_handler(request, exc: HTTPException):
         detail=exc.detail,
         path=request.url.path
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail, "type": "http_error"}
     )
@@ -131,7 +136,7 @@ async def general_exception_handler(request, exc: Exception):
         path=request.url.path,
         exc_info=True
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -181,8 +186,8 @@ async def metrics():
         raise HTTPException(status_code=404, detail="Metrics disabled")
     
     try:
-        from app.core.metrics import generate_metrics
-        return generate_metrics()
+        from app.core.metrics import generate_metrics, CONTENT_TYPE_LATEST
+        return Response(content=generate_metrics(), media_type=CONTENT_TYPE_LATEST)
     except Exception as e:
         logger.error("Failed to generate metrics", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to generate metrics")
@@ -105,6 +105,19 @@ class TestSettings:
         assert "ANTHROPIC_API_KEY" in validation_result["missing_keys"]
         assert "MEM0_API_KEY" in validation_result["missing_keys"]
     
+    def test_api_keys_status_is_read_only_and_current(self):
+        """Test API key status can't be mutated and follows key changes."""
+        settings = Settings(ANTHROPIC_API_KEY="sk-test", MEM0_API_KEY="m0-test")
+        status = settings.api_keys_status
+        with pytest.raises(TypeError):
+            status["valid"] = False
+        
+        settings.validate_api_keys()["missing_keys"].append("MEM0_API_KEY")
+        assert settings.validate_api_keys()["missing_keys"] == []
+        
+        settings.MEM0_API_KEY = None
+        assert settings.api_keys_status["missing_keys"] == ["MEM0_API_KEY"]
+    
     def test_database_url_validation(self):
         """Test database URL is properly configured."""
         settings = Settings()
@@ -2,13 +2,17 @@
 Tests for core modules (database, logging, exceptions)
 """
 
+import asyncio
 import pytest
 import sys
 import os
+from types import SimpleNamespace
+import structlog.testing
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from app.core.database import get_db, init_db, Base
 from app.core.logging import setup_logging, get_logger
+from app.core.cache import CacheManager, async_lru
 from app.core.exceptions import (
     BrickOrchestrationException, AIOrchestrationError, CrewAIError, Mem0Error,
     DevinAIError, BusinessSystemError, ConfigurationError, ValidationError,
@@ -37,13 +41,109 @@ class TestDatabase:
     
     def test_database_session_creation(self):
         """Test database session creation."""
-        from app.core.database import create_engine, sessionmaker
+        from app.core.database import create_engine
         engine = create_engine("sqlite:///./test.db", poolclass=StaticPool)
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
         session = SessionLocal()
         assert session is not None
         session.close()
 
+    def test_clock_timestamp_compiles_per_dialect(self):
+        """Test clock_timestamp renders natively on PostgreSQL and portably elsewhere."""
+        from sqlalchemy.dialects import postgresql, sqlite
+        from app.core.database import clock_timestamp
+
+        assert str(clock_timestamp().compile(dialect=postgresql.dialect())) == "clock_timestamp()"
+        assert str(clock_timestamp().compile(dialect=sqlite.dialect())) == "CURRENT_TIMESTAMP"
+
+    def test_column_compression_applied_on_create(self):
+        """Test columns tagged with info["compression"] get SET COMPRESSION DDL."""
+        from types import SimpleNamespace
+        from app.core.database import _apply_column_compression
+        import app.models.brick  # noqa: F401 - registers brick_analyses
+
+        statements = []
+        connection = SimpleNamespace(
+            dialect=SimpleNamespace(name="postgresql"),
+            execute=lambda statement: statements.append(str(statement)),
+        )
+        _apply_column_compression(Base.metadata, connection)
+
+        assert (
+            "ALTER TABLE brick_analyses ALTER COLUMN findings SET COMPRESSION lz4" in statements
+        )
+
+    @pytest.mark.asyncio
+    async def test_ensure_monthly_partitions(self):
+        """Test partitioned tables get a default plus one partition per month, each in its own transaction."""
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace
+        from app.core.database import ensure_monthly_partitions
+        import app.models.orchestration  # noqa: F401 - registers partitioned tables
+
+        class FakeConnection:
+            def __init__(self, scalars=()):
+                self.statements = []
+                self.scalars = list(scalars)
+
+            async def execute(self, statement, params=None):
+                self.statements.append(str(statement))
+
+            async def scalar(self, statement, params=None):
+                return self.scalars.pop(0) if self.scalars else None
+
+        class FakeEngine:
+            dialect = SimpleNamespace(name="postgresql")
+
+            def __init__(self):
+                self.transactions = []
+
+            @asynccontextmanager
+            async def begin(self):
+                conn = FakeConnection()
+                self.transactions.append(conn.statements)
+                yield conn
+
+        bind = FakeEngine()
+        await ensure_monthly_partitions(bind, months_ahead=1)
+
+        task_log_ddl = [s for tx in bind.transactions for s in tx if "PARTITION OF task_logs " in s]
+        assert len(task_log_ddl) == 3
+        assert task_log_ddl[0].endswith("DEFAULT")
+        assert all("FOR VALUES FROM" in s for s in task_log_ddl[1:])
+        assert all(len(tx) == 1 for tx in bind.transactions)
+
+    @pytest.mark.asyncio
+    async def test_month_partition_moves_rows_out_of_default(self):
+        """Test rows stranded in the default partition are moved into the new month's partition."""
+        from datetime import date
+        from app.core.database import _create_month_partition
+        import app.models.orchestration  # noqa: F401 - registers partitioned tables
+
+        class FakeConnection:
+            def __init__(self):
+                self.statements = []
+                # to_regclass: partition missing; EXISTS: default holds rows
+                self.scalars = [None, True]
+
+            async def execute(self, statement, params=None):
+                self.statements.append(str(statement))
+
+            async def scalar(self, statement, params=None):
+                return self.scalars.pop(0)
+
+        conn = FakeConnection()
+        table = Base.metadata.tables["task_logs"]
+        await _create_month_partition(conn, table, date(2026, 1, 1), date(2026, 2, 1))
+
+        statements = conn.statements
+
+        assert statements[0] == "ALTER TABLE task_logs DETACH PARTITION task_logs_default"
+        assert "task_logs_2026_01 PARTITION OF task_logs" in statements[1]
+        assert statements[2].startswith("INSERT INTO task_logs OVERRIDING SYSTEM VALUE SELECT * FROM task_logs_default")
+        assert statements[3].startswith("DELETE FROM task_logs_default")
+        assert statements[4] == "ALTER TABLE task_logs ATTACH PARTITION task_logs_default DEFAULT"
+
 
 class TestLogging:
     """Test logging functionality."""
@@ -122,6 +222,14 @@ class TestExceptions:
         assert error.detail == "Access denied"
         assert isinstance(error, BrickOrchestrationException)
     
+    def test_status_codes_are_class_attributes(self):
+        """Test status codes come from the class unless overridden."""
+        assert AuthenticationError.status_code == 401
+        assert AuthenticationError("Token expired").status_code == 401
+        assert CrewAIError("down").status_code == 503
+        assert AuthorizationError().status_code == 403
+        assert BrickOrchestrationException("Teapot", status_code=418).status_code == 418
+    
     def test_business_system_error(self):
         """Test BusinessSystemError exception."""
         error = BusinessSystemError("Business system down")
@@ -135,6 +243,217 @@ class TestExceptions:
         assert isinstance(error, BrickOrchestrationException)
 
 
+class FakePipeline:
+    """Minimal stand-in for a non-transactional Redis pipeline."""
+    
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.commands = []
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+    
+    async def execute(self):
+        self.redis.pipeline_batches.append(len(self.commands))
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the async Redis client."""
+    
+    def __init__(self):
+        self.store = {}
+        self.pipeline_batches = []
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    async def set(self, key, value, ex=None):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def delete(self, key):
+        self.store.pop(key, None)
+    
+    async def exists(self, key):
+        return int(key in self.store)
+
+
+class TestCacheManager:
+    """Test cache manager serialization."""
+    
+    @pytest.mark.asyncio
+    async def test_json_round_trip(self):
+        """Test structured values survive a MessagePack round trip."""
+        cache = CacheManager(FakeRedis())
+        payload = {"metrics": {"latency_ms": 12.5, "count": 3}, "tags": ["a", "b"]}
+        
+        await cache.set_json("session", payload)
+        
+        assert await cache.get_json("session") == payload
+        assert await cache.get_json("missing") is None
+    
+    @pytest.mark.asyncio
+    async def test_legacy_json_values_ignored(self):
+        """Test values written without the versioned prefix are not decoded."""
+        redis_client = FakeRedis()
+        redis_client.store["session"] = b'{"legacy": true}'
+        cache = CacheManager(redis_client)
+        
+        assert await cache.get_json("session") is None
+    
+    @pytest.mark.asyncio
+    async def test_string_values_decoded(self):
+        """Test the string API returns str values."""
+        cache = CacheManager(FakeRedis())
+        await cache.set("greeting", "hello")
+        
+        assert await cache.get("greeting") == "hello"
+    
+    @pytest.mark.asyncio
+    async def test_get_with_exists_single_pipeline(self):
+        """Test existence and value are fetched in one pipelined round trip."""
+        redis_client = FakeRedis()
+        cache = CacheManager(redis_client)
+        await cache.set("greeting", "hello")
+        
+        assert await cache.get_with_exists("greeting") == (1, "hello")
+        assert await cache.get_with_exists("missing") == (0, None)
+        assert redis_client.pipeline_batches == [2, 2]
+        assert await cache.exists("greeting") == 1
+    
+    @pytest.mark.asyncio
+    async def test_set_async_batches_writes(self):
+        """Test fire-and-forget writes are flushed through one pipeline."""
+        redis_client = FakeRedis()
+        cache = CacheManager(redis_client)
+        
+        for i in range(5):
+            await cache.set_async(f"metric:{i}", str(i))
+        await cache.flush()
+        
+        assert redis_client.store["metric:4"] == b"4"
+        assert redis_client.pipeline_batches == [5]
+    
+    @pytest.mark.asyncio
+    async def test_async_lru_shares_calls(self):
+        """Test concurrent and repeated calls share one upstream call within the TTL."""
+        calls = []
+        
+        @async_lru(maxsize=2, ttl=60)
+        async def lookup(query):
+            calls.append(query)
+            await asyncio.sleep(0.01)
+            return query.upper()
+        
+        assert await asyncio.gather(lookup("a"), lookup("a")) == ["A", "A"]
+        assert await lookup("a") == "A"
+        assert calls == ["a"]
+        
+        # "a" is least recently used once "b" and "c" are cached
+        await lookup("b")
+        await lookup("c")
+        await lookup("a")
+        assert calls == ["a", "b", "c", "a"]
+    
+    @pytest.mark.asyncio
+    async def test_async_lru_expiry_and_failures(self):
+        """Test expired entries and failed calls are not reused."""
+        calls = []
+        
+        @async_lru(ttl=0)
+        async def expired(query):
+            calls.append(query)
+            return query
+        
+        await expired("a")
+        await expired("a")
+        assert calls == ["a", "a"]
+        
+        @async_lru(ttl=60)
+        async def failing(query):
+            calls.append(query)
+            raise RuntimeError("search down")
+        
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await failing("b")
+        assert calls == ["a", "a", "b", "b"]
+
+
+class TestHTTPPool:
+    """Test the shared downstream HTTP connection pool."""
+    
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool(self):
+        """Test service clients reuse one transport until the pool is closed."""
+        from app.core import http
+        
+        first = http.http_client(base_url="https://api.devin.ai/v1", headers={"Authorization": "Bearer k"})
+        second = http.http_client()
+        assert first._transport is second._transport
+        assert first.base_url == "https://api.devin.ai/v1/"
+        assert second.timeout == http.HTTP_TIMEOUT
+        
+        await http.close_http_pool()
+        assert http._transport is None
+        assert http.http_client()._transport is not first._transport
+        await http.close_http_pool()
+
+
+class TestTaskLogWriter:
+    """Test the COPY-based task log writer."""
+
+    @pytest.mark.asyncio
+    async def test_queued_logs_flushed_in_one_copy(self):
+        """Test queued rows are written as a single COPY batch."""
+        from app.core.fast_writer import TaskLogWriter, TASK_LOG_COLUMNS
+
+        batches = []
+
+        class RecordingWriter(TaskLogWriter):
+            async def _write(self, batch):
+                batches.append(list(batch))
+
+        writer = RecordingWriter()
+        for i in range(3):
+            writer.log(1, "info", f"step {i}", {"step": i})
+        await writer.flush()
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 3
+        assert len(batches[0][0]) == len(TASK_LOG_COLUMNS)
+        assert batches[0][2][3] == '{"step":2}'
+
+    @pytest.mark.asyncio
+    async def test_flush_resets_writer(self):
+        """Test a flushed writer starts a fresh drain task on the next log."""
+        from app.core.fast_writer import TaskLogWriter
+
+        batches = []
+
+        class RecordingWriter(TaskLogWriter):
+            async def _write(self, batch):
+                batches.append(list(batch))
+
+        writer = RecordingWriter()
+        writer.log(1, "info", "first")
+        await writer.flush()
+        assert writer._writer_task is None
+
+        writer.log(1, "info", "second")
+        await writer.flush()
+        assert [row[2] for batch in batches for row in batch] == ["first", "second"]
+
+
 class TestModels:
     """Test data models."""
     
@@ -153,6 +472,127 @@ class TestModels:
         from app.models.ubic import UBICMessage
         assert UBICMessage is not None
     
+    def test_relationship_loader_strategies(self):
+        """Test collection relationships declare explicit loader strategies."""
+        from app.models.brick import Brick
+        from app.models.orchestration import OrchestrationSession, OrchestrationTask
+
+        assert Brick.developments.property.lazy == "raise"
+        assert Brick.analyses.property.lazy == "raise"
+        assert OrchestrationSession.tasks.property.lazy == "raise"
+        assert OrchestrationTask.logs.property.lazy == "selectin"
+    
+    def test_brick_ecosystem_children_load_in_one_query(self):
+        """Test BRICK child collections are selectin-loaded through the brick_id FK."""
+        from sqlalchemy import event, select
+        from app.models.strategic import BRICKEcosystem, BRICKPriority, ConstraintPrediction, IncomeStream
+        
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine, tables=[
+            BRICKEcosystem.__table__, BRICKPriority.__table__,
+            ConstraintPrediction.__table__, IncomeStream.__table__
+        ])
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            for n in range(3):
+                session.add(BRICKEcosystem(
+                    brick_id=f"b{n}", brick_name=f"B{n}", brick_type="existing", status="production",
+                    priorities=[BRICKPriority(brick_name=f"B{n}", priority_score=n, priority_level="high")]
+                ))
+            session.commit()
+        
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        with Session() as session:
+            bricks = session.execute(select(BRICKEcosystem)).scalars().all()
+            priorities = [p.brick_id for b in bricks for p in b.priorities]
+        
+        assert sorted(priorities) == ["b0", "b1", "b2"]
+        # bricks + one query per child collection, regardless of row count
+        assert len(statements) == 4
+
+    def test_task_log_insert_through_orm_on_sqlite(self):
+        """Test TaskLog and AIInteraction rows get autoincremented ids on sqlite."""
+        from app.models.orchestration import (
+            AIInteraction, OrchestrationSession, OrchestrationTask, TaskLog
+        )
+        
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine, tables=[
+            OrchestrationSession.__table__, OrchestrationTask.__table__,
+            TaskLog.__table__, AIInteraction.__table__
+        ])
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            logs = [TaskLog(task_id=1, log_level="info", message=f"m{n}") for n in range(2)]
+            interaction = AIInteraction(
+                from_ai_system="crewai", to_ai_system="mem0", interaction_type="request", message="m"
+            )
+            session.add_all([*logs, interaction])
+            session.commit()
+            
+            assert [log.id for log in logs] == [1, 2]
+            assert interaction.id == 1
+            assert logs[0].timestamp is not None
+
+    def test_updated_at_set_on_update_on_sqlite(self):
+        """Test updated_at is set by the ORM onupdate fallback where there is no trigger."""
+        from app.models.user import User
+        
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine, tables=[User.__table__])
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            user = User(username="u", email="u@example.com", hashed_password="x")
+            session.add(user)
+            session.commit()
+            assert user.updated_at is None
+            
+            user.full_name = "User"
+            session.commit()
+            assert user.updated_at is not None
+        
+        assert User.__table__.c.updated_at.server_onupdate is not None
+
+    def test_partitioned_primary_key_includes_partition_key_on_postgresql(self):
+        """Test the partition key joins the primary key in PostgreSQL DDL only."""
+        from sqlalchemy.dialects import postgresql, sqlite
+        from sqlalchemy.schema import CreateTable
+        from app.models.orchestration import TaskLog, OrchestrationTask
+        
+        assert "PRIMARY KEY (id, timestamp)" in str(
+            CreateTable(TaskLog.__table__).compile(dialect=postgresql.dialect())
+        )
+        assert "PRIMARY KEY (id)" in str(
+            CreateTable(TaskLog.__table__).compile(dialect=sqlite.dialect())
+        )
+        assert "PRIMARY KEY (id)" in str(
+            CreateTable(OrchestrationTask.__table__).compile(dialect=postgresql.dialect())
+        )
+
+    def test_wide_strategic_columns_are_deferred(self):
+        """Test list queries skip the "details" column group unless undeferred."""
+        from sqlalchemy import select
+        from sqlalchemy.orm import undefer_group
+        from app.models.strategic import BRICKEcosystem, StrategicGap
+        
+        listing = str(select(BRICKEcosystem))
+        assert "monthly_revenue" in listing
+        assert "technology_stack" not in listing
+        assert "value_proposition" not in listing
+        assert "mitigation_strategy" not in str(select(StrategicGap))
+        
+        detail = str(select(BRICKEcosystem).options(undefer_group("details")))
+        assert "technology_stack" in detail
+        assert "brick_metadata" in detail
+
+    def test_revenue_rollup_view_not_created_as_table(self):
+        """Test the revenue roll-up view mapping stays out of create_all."""
+        from app.models.strategic import RevenueRollup, REVENUE_ROLLUP_VIEW
+
+        assert RevenueRollup.__table__.name == REVENUE_ROLLUP_VIEW
+        assert REVENUE_ROLLUP_VIEW not in Base.metadata.tables
+
     def test_memory_model_creation(self):
         """Test Memory model creation."""
         from app.models.memory import Memory
@@ -262,6 +702,432 @@ class TestServices:
         assert hasattr(service, 'ai_code_review')
         assert hasattr(service, 'calculate_payment_recommendation')
         assert hasattr(service, 'claude_client')
+    
+    @pytest.mark.asyncio
+    async def test_revenue_rollup_refresh_is_single_flight(self):
+        """Test only one roll-up refresh runs per process while callers keep being served."""
+        from app.services.revenue_analysis_service import RevenueAnalysisService
+        
+        service = RevenueAnalysisService()
+        release = asyncio.Event()
+        calls = []
+        
+        async def slow_refresh():
+            calls.append(1)
+            await release.wait()
+            return True
+        
+        service._refresh_rollup = slow_refresh
+        service._schedule_rollup_refresh()
+        first = service._rollup_refresh
+        await asyncio.sleep(0)
+        service._schedule_rollup_refresh()
+        
+        assert service._rollup_refresh is first
+        release.set()
+        await first
+        assert calls == [1]
+        assert service._rollup_staleness(None) is None
+
+
+class TestUBICModelConstruction:
+    """Test UBIC model identifiers and construction paths."""
+    
+    def test_fast_uuid4_is_valid_and_unique(self):
+        """Test pooled UUIDs are RFC 4122 version 4 and unique across refills."""
+        import uuid
+        from app.core.uuid_pool import POOL_BYTES, fast_uuid4
+        
+        values = [fast_uuid4() for _ in range(POOL_BYTES // 16 * 3)]
+        assert len(set(values)) == len(values)
+        for value in values[:50]:
+            parsed = uuid.UUID(value)
+            assert str(parsed) == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+    
+    def test_ubic_models_use_pooled_ids(self):
+        """Test UBIC messages get distinct generated identifiers."""
+        from app.models.ubic import UBICMessage
+        
+        first = UBICMessage(source="a", target="b", message_type="ping")
+        second = UBICMessage(source="a", target="b", message_type="ping")
+        assert len(first.idempotency_key) == 36
+        assert first.idempotency_key != second.idempotency_key
+        assert first.trace_id != first.idempotency_key
+    
+    def test_fast_build_skips_validation_but_applies_defaults(self):
+        """Test fast_build fills defaults and matches validated output."""
+        from app.models.ubic import Status, StateMetrics, UBICMessage, UBICResponse
+        
+        response = UBICResponse.fast_build(status=Status.SUCCESS, message="ok")
+        assert response.details == {}
+        assert response.error_code is None
+        assert response.model_dump() == UBICResponse(status=Status.SUCCESS, message="ok").model_dump()
+        
+        assert StateMetrics.fast_build(requests_total=3).last_updated is not None
+        assert len(UBICMessage.fast_build(source="a", target="b", message_type="ping").trace_id) == 36
+    
+    def test_ubic_models_are_frozen(self):
+        """Test UBIC model instances reject field reassignment."""
+        from pydantic import ValidationError as PydanticValidationError
+        from app.models.ubic import UBICMessage
+        
+        message = UBICMessage(source="a", target="b", message_type="ping")
+        with pytest.raises(PydanticValidationError):
+            message.target = "c"
+    
+    def test_default_timestamps_are_utc_aware(self):
+        """Test UBIC timestamp defaults are timezone-aware UTC."""
+        from datetime import timedelta
+        from app.models.ubic import AuditLogEntry, Status
+        
+        entry = AuditLogEntry(request_id="r1", action="reload", result=Status.SUCCESS)
+        assert entry.timestamp.utcoffset() == timedelta(0)
+
+
+class TestAIOrchestratorStatus:
+    """Test orchestrator status probes."""
+    
+    @staticmethod
+    def _service(status="healthy", delay=0.0):
+        async def get_status():
+            await asyncio.sleep(delay)
+            return {"status": status}
+        return SimpleNamespace(get_status=get_status)
+    
+    @pytest.mark.asyncio
+    async def test_status_probes_run_concurrently(self, monkeypatch):
+        """Test a hung service times out without stalling the others."""
+        from app.core.config import settings
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        monkeypatch.setattr(settings, "STATUS_PROBE_TIMEOUT_SECONDS", 0.2)
+        orchestrator = AIOrchestrator()
+        orchestrator.initialized = True
+        orchestrator.crewai_service = self._service(delay=0.1)
+        orchestrator.mem0_service = self._service(delay=0.1)
+        orchestrator.devin_service = self._service(delay=10)
+        orchestrator._refresh_active_services()
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        status = await orchestrator.get_system_status()
+        assert loop.time() - started < 1
+        
+        assert status["services"]["crewai"] == {"status": "healthy"}
+        assert status["services"]["mem0"] == {"status": "healthy"}
+        assert status["services"]["devin"]["status"] == "error"
+        assert "copilot" not in status["services"]
+        
+        # 2 of 3 healthy
+        assert await orchestrator.health_check() == "degraded"
+    
+    @pytest.mark.asyncio
+    async def test_health_is_shared_and_cached(self):
+        """Test concurrent health checks share one probe and reuse it within the TTL."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        calls = []
+        
+        async def get_status():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"status": "healthy"}
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.initialized = True
+        orchestrator.crewai_service = SimpleNamespace(get_status=get_status)
+        orchestrator._refresh_active_services()
+        
+        results = await asyncio.gather(*(orchestrator.health_check() for _ in range(5)))
+        assert results == ["healthy"] * 5
+        assert await orchestrator.health_check() == "healthy"
+        assert len(calls) == 1
+        
+        orchestrator._health_cache = None
+        await orchestrator.health_check()
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_status_is_shared_and_cached(self):
+        """Test concurrent callers share one probe and reuse it within the TTL."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        calls = 0
+        
+        async def get_status():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"status": "healthy"}
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.crewai_service = SimpleNamespace(get_status=get_status)
+        orchestrator._refresh_active_services()
+        
+        first, second = await asyncio.gather(
+            orchestrator.get_system_status(),
+            orchestrator.get_system_status()
+        )
+        assert first is second
+        assert await orchestrator.get_system_status() is first
+        assert calls == 1
+        
+        orchestrator._status_cache = None
+        await orchestrator.get_system_status()
+        assert calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_memory_writes_do_not_fail_task(self):
+        """Test Mem0 writes are queued off the request path and failures are only logged."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        stored = []
+        
+        async def store_context(session_id, context):
+            stored.append("context")
+        
+        async def store_result(session_id, result):
+            stored.append("results")
+            raise RuntimeError("mem0 down")
+        
+        async def handler(goal, context, session_id):
+            return {"goal": goal}
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.initialized = True
+        orchestrator.mem0_service = SimpleNamespace(
+            store_context=store_context,
+            store_result=store_result
+        )
+        orchestrator._task_handlers["custom"] = handler
+        
+        results = await orchestrator.orchestrate_task("custom", "ship", {}, "s1")
+        assert results == {"goal": "ship"}
+        assert stored == []
+        
+        await orchestrator._memory_queue.join()
+        assert stored == ["context", "results"]
+        
+        # Unchanged context isn't stored again; the failed results write is retried
+        await orchestrator.orchestrate_task("custom", "ship", {}, "s1")
+        await orchestrator._memory_queue.join()
+        assert stored == ["context", "results", "results"]
+        
+        await orchestrator.orchestrate_task("custom", "ship", {"brick": "b1"}, "s1")
+        await orchestrator.orchestrate_task("custom", "ship", {}, "s2")
+        writer = orchestrator._memory_writer
+        await orchestrator.flush_memory_writes()
+        assert stored.count("context") == 3
+        assert orchestrator._memory_writer is None
+        assert writer.cancelled()
+    
+    @pytest.mark.asyncio
+    async def test_context_hashed_once_per_task(self, monkeypatch):
+        """Test the Mem0 dedupe and the strategy lookup key share one context digest."""
+        from app.services import ai_orchestrator
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        digested = []
+        digest = ai_orchestrator._digest
+        monkeypatch.setattr(ai_orchestrator, "_digest", lambda payload: digested.append(payload) or digest(payload))
+        
+        async def noop(*args):
+            return {}
+        
+        async def find_similar_strategies(goal, context):
+            return {"similar_strategies": []}
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.initialized = True
+        orchestrator.mem0_service = SimpleNamespace(
+            initialized=True,
+            store_context=noop,
+            store_result=noop,
+            find_similar_strategies=find_similar_strategies
+        )
+        context = {"brick": "b1", "budget": 10}
+        
+        await orchestrator.orchestrate_task("revenue_optimization", "grow", context, "s1")
+        await orchestrator.flush_memory_writes()
+        assert [payload is context for payload in digested] == [True, False]
+    
+    @pytest.mark.asyncio
+    async def test_registered_task_handler(self, monkeypatch):
+        """Test task types registered on the class are dispatched per instance."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        async def echo(orchestrator, goal, context, session_id):
+            return {"orchestrator": orchestrator, "goal": goal}
+        
+        monkeypatch.setattr(AIOrchestrator, "_DISPATCH", AIOrchestrator._DISPATCH)
+        AIOrchestrator.register_task("echo", echo)
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.initialized = True
+        results = await orchestrator.orchestrate_task("echo", "ship", {}, "s1")
+        assert results == {"orchestrator": orchestrator, "goal": "ship"}
+        assert orchestrator._task_handlers["gap_analysis"] == orchestrator._orchestrate_gap_analysis
+    
+    @pytest.mark.asyncio
+    async def test_hung_services_do_not_block_startup_or_shutdown(self, monkeypatch):
+        """Test optional service init and cleanup are bounded by their timeouts."""
+        from app.core.config import settings
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        async def hang(*args):
+            await asyncio.sleep(10)
+        
+        async def init_service(spec):
+            if spec.name == "crewai":
+                await hang()
+        
+        monkeypatch.setattr(settings, "CREWAI_API_KEY", "test-key")
+        monkeypatch.setattr(settings, "INIT_TIMEOUT_SECONDS", 0.1)
+        monkeypatch.setattr(settings, "SERVICE_CLEANUP_TIMEOUT_SECONDS", 0.1)
+        orchestrator = AIOrchestrator()
+        monkeypatch.setattr(orchestrator, "_init_service", init_service)
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with structlog.testing.capture_logs() as logs:
+            await orchestrator.initialize()
+        assert orchestrator.initialized is True
+        assert [
+            log["service"] for log in logs
+            if log["event"] == "Optional service initialization failed, continuing without it"
+        ] == ["crewai"]
+        
+        async def fail():
+            raise RuntimeError("socket closed")
+        
+        orchestrator.crewai_service = SimpleNamespace(cleanup=hang)
+        orchestrator.devin_service = SimpleNamespace(cleanup=fail)
+        orchestrator._refresh_active_services()
+        with structlog.testing.capture_logs() as logs:
+            await orchestrator.cleanup()
+        assert orchestrator.initialized is False
+        assert loop.time() - started < 5
+        
+        failures = {log["service"]: log["error"] for log in logs if log["event"] == "Service cleanup failed"}
+        assert set(failures) == {"crewai", "devin"}
+        assert "socket closed" in failures["devin"]
+    
+    @pytest.mark.asyncio
+    async def test_code_review_only_runs_with_code(self):
+        """Test the router code review is skipped when there is no code."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        reviewed = []
+        
+        async def review_code(code, context):
+            reviewed.append(code)
+            return {"approved": True}
+        
+        async def develop_brick(goal, context, session_id):
+            await asyncio.sleep(0.2)
+            return {"code": "print('brick')"}
+        
+        async def plan_brick_development(goal, context, session_id):
+            await asyncio.sleep(0.2)
+            return {"steps": ["build"]}
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.multi_model_router = SimpleNamespace(review_code=review_code)
+        
+        results = await orchestrator._orchestrate_brick_development("g", {}, "s1")
+        assert reviewed == []
+        assert results["testing"] == {}
+        
+        orchestrator.devin_service = SimpleNamespace(develop_brick=develop_brick)
+        orchestrator.crewai_service = SimpleNamespace(plan_brick_development=plan_brick_development)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await orchestrator._orchestrate_brick_development("g", {}, "s1")
+        # Planning and development overlap
+        assert loop.time() - started < 0.35
+        assert results["planning"]["crewai"] == {"steps": ["build"]}
+        assert reviewed == ["print('brick')"]
+        assert results["testing"]["code_review"] == {"approved": True}
+    
+    @pytest.mark.asyncio
+    async def test_strategic_analysis_agents_run_concurrently(self):
+        """Test strategic analysis agents overlap and fail independently."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        async def route_request(prompt, task_type):
+            await asyncio.sleep(0.2)
+            return {"response": "analysis", "model_used": "gpt-4"}
+        
+        async def analyze_revenue_opportunities(context):
+            await asyncio.sleep(0.2)
+            raise RuntimeError("revenue service down")
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.multi_model_router = SimpleNamespace(route_request=route_request)
+        orchestrator.revenue_analysis_service = SimpleNamespace(
+            analyze_revenue_opportunities=analyze_revenue_opportunities
+        )
+        orchestrator._lazy_inits.clear()
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await orchestrator._orchestrate_strategic_analysis("grow", {}, "s1")
+        assert loop.time() - started < 0.35
+        
+        assert results["gpt4_analysis"]["model_used"] == "gpt-4"
+        assert results["revenue_opportunities"] == {"error": "revenue service down"}
+        assert results["agents_involved"] == ["multi_model_router", "revenue_analysis"]
+    
+    @pytest.mark.asyncio
+    async def test_lazy_service_built_once(self, monkeypatch):
+        """Test concurrent first callers share one lazy service build."""
+        from app.services.ai_orchestrator import AIOrchestrator
+        
+        orchestrator = AIOrchestrator()
+        builds = []
+        
+        async def init_service(spec):
+            builds.append(spec.attr)
+            await asyncio.sleep(0.05)
+            setattr(orchestrator, spec.attr, self._service())
+        
+        monkeypatch.setattr(orchestrator, "_init_service", init_service)
+        assert orchestrator.treasury_optimizer is None
+        
+        services = await asyncio.gather(
+            *(orchestrator.get_service("treasury_optimizer") for _ in range(5))
+        )
+        assert builds == ["treasury_optimizer"]
+        assert all(service is orchestrator.treasury_optimizer for service in services)
+        assert ("treasury_optimization", orchestrator.treasury_optimizer) in orchestrator._active_services
+        
+        await orchestrator.get_service("treasury_optimizer")
+        assert builds == ["treasury_optimizer"]
+        assert orchestrator._pending_inits == {}
+    
+    @pytest.mark.asyncio
+    async def test_service_built_from_spec(self):
+        """Test a service spec's dependencies are passed to its constructor."""
+        from app.core.exceptions import CrewAIError
+        from app.services.ai_orchestrator import AIOrchestrator, ServiceSpec
+        
+        orchestrator = AIOrchestrator()
+        orchestrator.multi_model_router = router = object()
+        orchestrator._lazy_inits.clear()
+        
+        spec = ServiceSpec(
+            "treasury_optimization", "treasury_optimizer", "types:SimpleNamespace",
+            "Treasury Optimizer", initialize=False, deps=(("router", "multi_model_router"),)
+        )
+        await orchestrator._init_service(spec)
+        assert orchestrator.treasury_optimizer.router is router
+        
+        failing = spec._replace(attr="crewai_service", initialize=True, error=CrewAIError)
+        with pytest.raises(CrewAIError):
+            await orchestrator._init_service(failing)
+        assert orchestrator.crewai_service is None
 
 
 if __name__ == "__main__":
@@ -91,6 +91,53 @@ class TestAssessServiceCoverage:
         service = AssessService()
         assert service is not None
     
+    def test_claude_client_shared_across_instances(self, monkeypatch):
+        """Test every AssessService reuses one Claude client"""
+        from app.services import assess_service
+        
+        created = []
+        
+        def fake_anthropic(**kwargs):
+            created.append(kwargs)
+            return Mock()
+        
+        monkeypatch.setattr(assess_service.settings, "ANTHROPIC_API_KEY", "sk-test")
+        monkeypatch.setattr(assess_service.anthropic, "AsyncAnthropic", fake_anthropic)
+        assess_service._claude_client.cache_clear()
+        try:
+            first, second = AssessService(), AssessService()
+            assert first.claude_client is second.claude_client
+            assert len(created) == 1
+        finally:
+            assess_service._claude_client.cache_clear()
+    
+    @pytest.mark.asyncio
+    async def test_ai_code_review_awaits_claude(self, tmp_path, monkeypatch):
+        """Test the Claude review call is awaited rather than blocking the loop"""
+        from collections import OrderedDict
+        from app.services import assess_service
+        
+        monkeypatch.setattr(assess_service, "_audit_cache", OrderedDict())
+        service = AssessService()
+        service.claude_client = Mock()
+        service.claude_client.messages.create = AsyncMock(return_value=Mock(
+            content=[Mock(text="Code Quality Score: 9/10\nProduction ready: YES")]
+        ))
+        (tmp_path / "main.py").write_text("app = None\n")
+        ubic = {"compliant": True, "found": 9, "total_required": 9, "missing": []}
+        tests = {"coverage_percent": 50.0, "meets_80_threshold": False}
+        
+        result = await service.ai_code_review(str(tmp_path), ubic, tests)
+        
+        service.claude_client.messages.create.assert_awaited_once()
+        assert result["quality_score"] == 9
+        assert result["production_ready"] is True
+        
+        # Same code and results: the review is reused without another call
+        again = await service.ai_code_review(str(tmp_path), ubic, tests)
+        service.claude_client.messages.create.assert_awaited_once()
+        assert again == result
+    
     @pytest.mark.asyncio
     async def test_check_ubic_compliance(self):
         """Test UBIC compliance checking"""
@@ -104,6 +151,138 @@ class TestAssessServiceCoverage:
         assert "total_required" in result
         assert result["total_required"] == 9  # 9 required endpoints per BRICK
     
+    @pytest.mark.asyncio
+    async def test_check_ubic_compliance_route_styles(self, tmp_path):
+        """Test route decorators and app/router calls are all detected"""
+        service = AssessService()
+        (tmp_path / "routes.py").write_text(
+            '@router.get("/health")\n'
+            "@api.post('/send')\n"
+            'app.get( "/state")\n'
+            'router.put("/state")\n'
+            'router.delete ("/shutdown")\n'
+            '@router.get("/healthz")\n'
+        )
+        
+        result = await service.check_ubic_compliance(str(tmp_path))
+        
+        assert result["found_endpoints"] == ["/health", "/send", "/shutdown", "/state"]
+        assert result["found"] == 4
+        assert "/healthz" not in result["found_endpoints"]
+        assert result["missing"] == sorted(result["missing"])
+        assert len(result["missing"]) == 5
+    
+    @pytest.mark.asyncio
+    async def test_check_ubic_compliance_stops_when_all_found(self, tmp_path, monkeypatch):
+        """Test the scan stops once all required endpoints are found"""
+        from app.services import assess_service
+        
+        # A single worker makes the scan order deterministic
+        monkeypatch.setattr(assess_service, "UBIC_SCAN_WORKERS", 1)
+        service = AssessService()
+        (tmp_path / "a_routes.py").write_text("".join(
+            f'@router.get("{endpoint}")\n' for endpoint in assess_service.REQUIRED_ENDPOINTS
+        ))
+        for i in range(5):
+            sub = tmp_path / f"pkg{i}"
+            sub.mkdir()
+            (sub / "module.py").write_text("x = 1\n")
+        
+        opened = []
+        real_open = open
+        
+        def tracking_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+        
+        monkeypatch.setattr("builtins.open", tracking_open)
+        result = await service.check_ubic_compliance(str(tmp_path))
+        
+        assert result["compliant"] is True
+        assert result["missing"] == []
+        assert len(opened) == 1
+    
+    @pytest.mark.asyncio
+    async def test_check_ubic_compliance_skips_dirs_and_reads_bytes(self, tmp_path):
+        """Test skipped directories are ignored and non-UTF-8 files still scan"""
+        service = AssessService()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "routes.py").write_text('@router.get("/shutdown")\n')
+        (tmp_path / "api").mkdir()
+        (tmp_path / "api" / "routes.py").write_bytes(
+            b'# caf\xe9\n@router.post("/message")\n'
+        )
+        
+        result = await service.check_ubic_compliance(str(tmp_path))
+        
+        assert result["found_endpoints"] == ["/message"]
+    
+    @pytest.mark.asyncio
+    async def test_check_ubic_compliance_skips_empty_and_oversized_files(self, tmp_path, monkeypatch):
+        """Test empty files and files over the size cutoff are not scanned"""
+        from app.services import assess_service
+        
+        monkeypatch.setattr(assess_service, "MAX_ROUTE_FILE_BYTES", 64)
+        service = AssessService()
+        (tmp_path / "__init__.py").write_text("")
+        (tmp_path / "generated.py").write_text('@router.get("/state")\n' + "#" * 100)
+        (tmp_path / "routes.py").write_text('@router.get("/health")\n')
+        
+        result = await service.check_ubic_compliance(str(tmp_path))
+        
+        assert result["found_endpoints"] == ["/health"]
+    
+    @pytest.mark.asyncio
+    async def test_check_ubic_compliance_cached_until_files_change(self, tmp_path, monkeypatch):
+        """Test an unchanged tree reuses the scan and an edited file triggers a rescan"""
+        from app.services import assess_service
+        
+        scans = []
+        real_scan = assess_service._scan_ubic_routes
+        
+        def counting_scan(entries):
+            scans.append(len(entries))
+            return real_scan(entries)
+        
+        monkeypatch.setattr(assess_service, "_scan_ubic_routes", counting_scan)
+        service = AssessService()
+        routes = tmp_path / "routes.py"
+        routes.write_text('@router.get("/health")\n')
+        
+        first = await service.check_ubic_compliance(str(tmp_path))
+        second = await AssessService().check_ubic_compliance(str(tmp_path))
+        assert first == second
+        assert len(scans) == 1
+        
+        routes.write_text('@router.get("/health")\n@router.get("/state")\n')
+        third = await service.check_ubic_compliance(str(tmp_path))
+        assert third["found_endpoints"] == ["/health", "/state"]
+        assert len(scans) == 2
+    
+    @pytest.mark.asyncio
+    async def test_check_ubic_compliance_shared_across_clones_of_a_commit(self, tmp_path, monkeypatch):
+        """Test fresh checkouts of the same commit reuse one scan"""
+        from app.services import assess_service
+        
+        scans = []
+        real_scan = assess_service._scan_ubic_routes
+        
+        def counting_scan(entries):
+            scans.append(len(entries))
+            return real_scan(entries)
+        
+        monkeypatch.setattr(assess_service, "_scan_ubic_routes", counting_scan)
+        monkeypatch.setattr(assess_service, "_git_head", lambda repo_path: "feedc0de" * 5)
+        results = []
+        for clone in ("clone_a", "clone_b"):
+            (tmp_path / clone).mkdir()
+            (tmp_path / clone / "routes.py").write_text('@router.get("/health")\n')
+            results.append(await AssessService().check_ubic_compliance(str(tmp_path / clone)))
+        
+        assert results[0] == results[1]
+        assert results[0]["found_endpoints"] == ["/health"]
+        assert len(scans) == 1
+    
     @pytest.mark.asyncio
     async def test_run_tests_no_framework(self):
         """Test run_tests with no test framework"""
@@ -118,6 +297,201 @@ class TestAssessServiceCoverage:
             assert "coverage_percent" in result
             assert result["has_test_framework"] is False
     
+    @pytest.mark.asyncio
+    async def test_run_tests_installs_requirements_once(self, tmp_path, monkeypatch):
+        """Test unchanged requirements are pip-installed only once"""
+        from app.services import assess_service
+        
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "requirements.txt").write_text("pytest-example-pin==0.0.1\n")
+        commands = []
+        
+        async def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return Mock(returncode=0, stdout="1 passed in 0.01s", stderr="")
+        
+        monkeypatch.setattr(assess_service, "_run_command", fake_run)
+        service = AssessService()
+        
+        await service.run_tests(str(tmp_path))
+        await service.run_tests(str(tmp_path))
+        
+        installs = [cmd for cmd in commands if cmd[0] == "pip"]
+        assert len(installs) == 1
+    
+    @pytest.mark.asyncio
+    async def test_run_command_captures_output_and_times_out(self, tmp_path):
+        """Test commands run without blocking, keep bounded output and are killed on timeout"""
+        import subprocess
+        from app.services import assess_service
+        from app.services.assess_service import _run_command
+        
+        result = await _run_command(
+            [sys.executable, "-c", "import sys; print('3 passed'); sys.stderr.write('warn')"],
+            cwd=str(tmp_path),
+            timeout=30
+        )
+        assert result.returncode == 0
+        assert result.stdout.strip() == "3 passed"
+        assert result.stderr == "warn"
+        
+        result = await _run_command(
+            [sys.executable, "-c",
+             "import sys; print('x' * 100000); print('9 passed'); sys.stderr.write('E' * 100000)"],
+            cwd=str(tmp_path),
+            timeout=30
+        )
+        assert len(result.stdout) <= assess_service.STDOUT_TAIL_BYTES
+        assert result.stdout.endswith("9 passed\n")
+        assert result.stderr == "E" * assess_service.STDERR_HEAD_BYTES
+        
+        with pytest.raises(subprocess.TimeoutExpired):
+            await _run_command(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                cwd=str(tmp_path),
+                timeout=0.5
+            )
+    
+    @pytest.mark.asyncio
+    async def test_run_tests_parses_final_summary_counts(self, tmp_path, monkeypatch):
+        """Test pass/fail counts come from the pytest summary at the end of the output"""
+        from app.services import assess_service
+        
+        (tmp_path / "tests").mkdir()
+        stdout = (
+            "tests/test_x.py::test_reports_2 passed items PASSED\n"
+            + "." * 5000 + "\n"
+            + "==== 7 passed, 2 failed, 1 xfailed in 0.52s ====\n"
+        )
+        
+        async def fake_run(cmd, **kwargs):
+            return Mock(returncode=1, stdout=stdout, stderr="")
+        
+        monkeypatch.setattr(assess_service, "_run_command", fake_run)
+        result = await AssessService().run_tests(str(tmp_path))
+        
+        assert result["tests_passed_count"] == 7
+        assert result["tests_failed_count"] == 2
+        assert result["tests_run"] == 9
+    
+    @pytest.mark.asyncio
+    async def test_run_tests_finds_nested_config_and_requirements(self, tmp_path, monkeypatch):
+        """Test test dirs, pytest.ini and requirements.txt are found under src/"""
+        from app.services import assess_service
+        
+        src = tmp_path / "src"
+        (src / "tests").mkdir(parents=True)
+        (src / "pytest.ini").write_text("[pytest]\n")
+        (src / "requirements.txt").write_text("pytest-example-nested==0.0.1\n")
+        commands = []
+        
+        async def fake_run(cmd, cwd, **kwargs):
+            commands.append((cmd, cwd))
+            return Mock(returncode=0, stdout="1 passed in 0.01s", stderr="")
+        
+        monkeypatch.setattr(assess_service, "_run_command", fake_run)
+        result = await AssessService().run_tests(str(tmp_path))
+        
+        assert result["has_test_framework"] is True
+        assert (["pip", "install", "-q", "-r", str(src / "requirements.txt")], str(src)) in commands
+        assert commands[-1][0][-1] == "src/tests"
+    
+    def test_load_coverage_reparses_only_changed_reports(self, tmp_path, monkeypatch):
+        """Test an unchanged coverage.json is parsed once and a rewritten one again"""
+        from app.services import assess_service
+        
+        parses = []
+        real_loads = assess_service.orjson.loads
+        
+        def counting_loads(data):
+            parses.append(data)
+            return real_loads(data)
+        
+        monkeypatch.setattr(assess_service.orjson, "loads", counting_loads)
+        report = tmp_path / "coverage.json"
+        report.write_text('{"totals": {"percent_covered": 42.0}}')
+        
+        assert assess_service._load_coverage(str(report))["totals"]["percent_covered"] == 42.0
+        assess_service._load_coverage(str(report))
+        assert len(parses) == 1
+        
+        report.write_text('{"totals": {"percent_covered": 85.25}}')
+        os.utime(report, ns=(0, report.stat().st_mtime_ns + 1_000_000))
+        assert assess_service._load_coverage(str(report))["totals"]["percent_covered"] == 85.25
+        assert len(parses) == 2
+        
+        with pytest.raises(FileNotFoundError):
+            assess_service._load_coverage(str(tmp_path / "missing.json"))
+    
+    @pytest.mark.asyncio
+    async def test_run_tests_reuses_results_for_same_commit(self, tmp_path, monkeypatch):
+        """Test a commit already tested skips pytest on the next audit"""
+        from collections import OrderedDict
+        from app.services import assess_service
+        
+        (tmp_path / "tests").mkdir()
+        commands = []
+        
+        async def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return Mock(returncode=0, stdout="4 passed in 0.01s", stderr="")
+        
+        monkeypatch.setattr(assess_service, "_audit_cache", OrderedDict())
+        monkeypatch.setattr(assess_service, "_run_command", fake_run)
+        monkeypatch.setattr(assess_service, "_git_head", lambda repo_path: "0123abcd")
+        service = AssessService()
+        
+        first = await service.run_tests(str(tmp_path))
+        second = await service.run_tests(str(tmp_path))
+        
+        assert first == second
+        assert second["tests_passed_count"] == 4
+        assert len(commands) == 1
+        
+        # Not a git checkout: nothing to key on, so nothing is cached
+        monkeypatch.setattr(assess_service, "_git_head", lambda repo_path: None)
+        await service.run_tests(str(tmp_path))
+        assert len(commands) == 2
+    
+    @pytest.mark.asyncio
+    async def test_clone_repository_checks_out_only_audited_paths(self, tmp_path):
+        """Test the sparse clone brings Python sources and tests but not other files"""
+        import subprocess
+        
+        source = tmp_path / "source"
+        (source / "app").mkdir(parents=True)
+        (source / "tests").mkdir()
+        (source / "docs").mkdir()
+        (source / "app" / "main.py").write_text('@app.get("/health")\n')
+        (source / "tests" / "fixture.json").write_text("{}")
+        (source / "requirements.txt").write_text("fastapi\n")
+        (source / "docs" / "diagram.png").write_bytes(b"\x89PNG" * 100)
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], cwd=source, check=True)
+        subprocess.run(git + ["add", "."], cwd=source, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=source, check=True)
+        
+        service = AssessService()
+        repo_path = await service.clone_repository(f"file://{source}")
+        try:
+            assert os.path.exists(os.path.join(repo_path, "app", "main.py"))
+            assert os.path.exists(os.path.join(repo_path, "tests", "fixture.json"))
+            assert os.path.exists(os.path.join(repo_path, "requirements.txt"))
+            assert not os.path.exists(os.path.join(repo_path, "docs", "diagram.png"))
+        finally:
+            service.cleanup_repository(repo_path)
+    
+    @pytest.mark.asyncio
+    async def test_clone_repository_failure_removes_temp_dir(self, tmp_path):
+        """Test a failed clone raises and leaves no temp directory behind"""
+        import glob
+        import tempfile
+        
+        before = set(glob.glob(os.path.join(tempfile.gettempdir(), "i_assess_*")))
+        with pytest.raises(Exception, match="Failed to clone repository"):
+            await AssessService().clone_repository(f"file://{tmp_path}/missing")
+        assert set(glob.glob(os.path.join(tempfile.gettempdir(), "i_assess_*"))) == before
+    
     def test_payment_recommendation_full_compliance(self):
         """Test payment recommendation with full UBIC compliance"""
         service = AssessService()
@@ -174,6 +548,26 @@ class TestAssessServiceCoverage:
         assert "recommendation" in result
         assert result["total_score"] < 80  # Should be lower
     
+    def test_payment_recommendation_tier_boundaries(self):
+        """Test each rubric tier starts exactly at its threshold"""
+        service = AssessService()
+        
+        def recommend(coverage, success_rate, quality):
+            return service.calculate_payment_recommendation({
+                "ubic": {"compliant": False, "found": 9, "total_required": 9, "missing": []},
+                "tests": {"coverage_percent": coverage, "test_success_rate": success_rate},
+                "ai_review": {"quality_score": quality},
+            })
+        
+        assert recommend(80, 90, 0)["score_breakdown"]["coverage"] == 20
+        assert recommend(79.9, 89.9, 0)["score_breakdown"]["coverage"] == 15
+        assert recommend(79.9, 89.9, 0)["score_breakdown"]["tests_pass"] == 8
+        assert recommend(10, 0, 0)["score_breakdown"]["coverage"] == 2.5
+        
+        # 40 (UBIC) + 15 (coverage) + 0 (tests) = 55
+        assert recommend(50, 0, 0)["recommendation"] == "APPROVE_WITH_CONDITIONS"
+        assert recommend(49, 0, 0)["recommendation"] == "REQUEST_FIXES_FIRST"
+    
     def test_extract_score_various_formats(self):
         """Test score extraction from different text formats"""
         service = AssessService()
@@ -188,9 +582,57 @@ class TestAssessServiceCoverage:
         # Test integer score
         assert service._extract_score("score 8 / 10") == 8
         
+        # Test "out of 10"
+        assert service._extract_score("Overall score: 6 out of 10") == 6
+        
+        # Test a labelled score wins over an earlier bare one
+        assert service._extract_score("Coverage 3/10\nCode Quality Score: 9/10") == 9
+        
+        # Test a lower-preference form never consumes a higher one
+        assert service._extract_score("Score breakdown: UBIC 9/10 endpoints, overall 8 out of 10") == 9
+        assert service._extract_score("score (Score: 9/10) is 7 out of 10") == 9
+        
         # Test default
         assert service._extract_score("No score here") == 7  # Default
     
+    def test_code_sample_cuts_at_line_boundary(self):
+        """Test code samples stop at a line boundary within the char and line caps"""
+        import io
+        from app.services.assess_service import _code_sample
+        
+        assert _code_sample(io.StringIO("a = 1\nb = 2")) == "a = 1\nb = 2"
+        
+        long_lines = "x" * 40 + "\n"
+        sample = _code_sample(io.StringIO(long_lines * 100))
+        assert len(sample) <= 1500
+        assert sample == (long_lines * 36).rstrip("\n")
+        
+        sample = _code_sample(io.StringIO("pass\n" * 200))
+        assert sample.count("\n") == 99
+    
+    @pytest.mark.asyncio
+    async def test_get_code_samples_stops_walking_at_max_files(self, tmp_path, monkeypatch):
+        """Test the tree walk ends as soon as enough samples are collected"""
+        from app.services import assess_service
+        
+        (tmp_path / "main.py").write_text("app = None\n")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "module.py").write_text("x = 1\n")
+        
+        visited = []
+        real_iter = assess_service._iter_py_files
+        
+        def tracking_iter(*args, **kwargs):
+            for entry in real_iter(*args, **kwargs):
+                visited.append(entry.name)
+                yield entry
+        
+        monkeypatch.setattr(assess_service, "_iter_py_files", tracking_iter)
+        samples = await AssessService()._get_code_samples(str(tmp_path), max_files=1)
+        
+        assert "File: main.py" in samples
+        assert visited == ["main.py"]
+    
     def test_extract_list_from_text(self):
         """Test extracting lists from AI response"""
         service = AssessService()
@@ -266,6 +708,14 @@ class TestMetricsModule:
             assert metrics is not None
         except ImportError:
             pytest.skip("Metrics module not available")
+    
+    def test_ubic_metrics_on_served_registry(self):
+        """Test the UBIC endpoint metrics are exported by the /metrics registry"""
+        from app.core.metrics import generate_metrics
+        from app.api.v1.endpoints import metrics as ubic_metrics
+        
+        ubic_metrics.record_emergence("test")
+        assert b'ubic_emergence_detected_total{emergence_type="test"}' in generate_metrics()
 
 
 class TestMultiModelRouter:
@@ -282,6 +732,22 @@ class TestMultiModelRouter:
         router = MultiModelRouter()
         assert router is not None
         assert hasattr(router, 'route_request')
+    
+    def test_router_bulk_statuses(self):
+        """Test per-model statuses come back from one bulk call"""
+        from datetime import datetime
+        from app.services.multi_model_router import MultiModelRouter
+        router = MultiModelRouter()
+        router._setup_routing_rules()
+        router.models = {"gpt-4": object(), "claude": object()}
+        router._track_performance("gpt-4", datetime.now(), True)
+        router._track_performance("gpt-4", datetime.now(), False)
+        
+        statuses = router.get_statuses_bulk()
+        assert set(statuses) == {"gpt-4"}
+        assert statuses["gpt-4"]["total_requests"] == 2
+        assert statuses["gpt-4"]["success_rate"] == 50
+        assert router.get_statuses_bulk(["claude"]) == {}
 
 
 class TestAIOrchestrator: